@@ -2,6 +2,7 @@ import { BaseFooter } from "@/components/base-footer";
 import { BaseHeader } from "@/components/base-header";
 import { FounderLocationMapClient } from "@/components/founder-location-map-client";
 import { ThemeSwitch } from "@/components/theme-switch";
+import { mirroredAssetUrl } from "@/lib/asset-mirror";
 import { getAllFounderUsernames, getFounderByUsername } from "@/lib/founder";
 import { projects } from "@/lib/data";
 import { createMetadata } from "@/lib/metadata";
@@ -171,7 +172,7 @@ export default async function FounderPage({ params }: PageProps) {
   // Use profile_image from MDX/Devfolio when valid URL; else fall back to Twitter avatar so DP always shows
   const profileImageUrl =
     f.profile_image?.trim() && (f.profile_image.startsWith("http://") || f.profile_image.startsWith("https://"))
-      ? f.profile_image
+      ? mirroredAssetUrl(f.profile_image)
       : `https://unavatar.io/twitter/${encodeURIComponent(username)}`;
   const rawContent =
     founder?.content ??
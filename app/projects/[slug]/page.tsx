@@ -1,9 +1,11 @@
 import { BaseFooter } from "@/components/base-footer";
 import { BaseHeader } from "@/components/base-header";
 import { ThemeSwitch } from "@/components/theme-switch";
+import { mirroredAssetUrl } from "@/lib/asset-mirror";
 import { getProjectBySlugOrId, projects } from "@/lib/data";
 import { getFounderByUsername } from "@/lib/founder";
 import { createMetadata } from "@/lib/metadata";
+import { getProjectDetail } from "@/lib/project-detail";
 import { getProjectMdx } from "@/lib/project-mdx";
 import { Github, ExternalLink, Trophy, Link2, Youtube, Globe } from "lucide-react";
 import type { Metadata } from "next";
@@ -136,13 +138,13 @@ function ProjectLinks({
 
 export default async function ProjectPage({ params }: PageProps) {
   const { slug } = await params;
-  const project = getProjectBySlugOrId(slug);
+  const project = getProjectDetail(slug);
   if (!project) notFound();
 
   const projectMdx = getProjectMdx(slug);
   const name = projectMdx?.frontmatter.name ?? project.name;
   const oneLiner = projectMdx?.frontmatter.description ?? project.description;
-  const logo = projectMdx?.frontmatter.logo ?? project.logo;
+  const logo = mirroredAssetUrl(projectMdx?.frontmatter.logo ?? project.logo);
   const hasDetailedContent =
     projectMdx?.content?.trim() &&
     !projectMdx.content.includes(DEFAULT_PLACEHOLDER);
@@ -165,7 +167,7 @@ export default async function ProjectPage({ params }: PageProps) {
     const fromMdx = profile?.frontmatter.profile_image?.trim();
     const profile_image =
       fromMdx && (fromMdx.startsWith("http://") || fromMdx.startsWith("https://"))
-        ? fromMdx
+        ? mirroredAssetUrl(fromMdx, "thumb")
         : `https://unavatar.io/twitter/${encodeURIComponent(displayHandle)}`;
     return {
       ...f,
@@ -298,7 +300,7 @@ export default async function ProjectPage({ params }: PageProps) {
                   className="flex items-center gap-4 rounded-xl border border-border bg-background/50 p-4"
                 >
                   <div className="relative flex h-12 w-12 shrink-0 overflow-hidden rounded-full bg-accent/20 text-sm font-bold text-accent sm:h-14 sm:w-14">
-                    {f.profile_image?.startsWith("http") ? (
+                    {f.profile_image?.startsWith("http") || f.profile_image?.startsWith("/") ? (
                       <img
                         src={f.profile_image}
                         alt=""
@@ -0,0 +1,46 @@
+/**
+ * Server-only: local copies of remote logos and profile images.
+ * Written by scripts/devfolio-scraper/mirror_assets.py into public/mirror/ + lib/asset-mirror.json.
+ */
+import { existsSync, readFileSync } from "fs";
+import path from "path";
+
+const MANIFEST_FILE = path.join(process.cwd(), "lib", "asset-mirror.json");
+
+interface MirroredAsset {
+  sha256: string;
+  bytes: number;
+  contentType: string | null;
+  /** Full-size copy, e.g. /mirror/original/<sha256>.png */
+  path: string;
+  /** Square WebP thumbnail, null when it could not be made */
+  thumb: string | null;
+}
+
+let _assetsCache: Record<string, MirroredAsset> | null = null;
+
+function readManifest(): Record<string, MirroredAsset> {
+  if (_assetsCache) return _assetsCache;
+  _assetsCache = {};
+  if (existsSync(MANIFEST_FILE)) {
+    try {
+      const manifest = JSON.parse(readFileSync(MANIFEST_FILE, "utf-8"));
+      if (manifest.version === 1) _assetsCache = manifest.assets ?? {};
+    } catch {
+      // Unreadable manifest: serve the remote URLs
+    }
+  }
+  return _assetsCache!;
+}
+
+/**
+ * Local URL for a remote image when it has been mirrored, else the URL unchanged.
+ * "thumb" (grids, avatars) falls back to the full-size copy when there is no thumbnail.
+ */
+export function mirroredAssetUrl(url: string, variant: "original" | "thumb" = "original"): string;
+export function mirroredAssetUrl(url: string | null | undefined, variant?: "original" | "thumb"): string | null | undefined;
+export function mirroredAssetUrl(url: string | null | undefined, variant: "original" | "thumb" = "original") {
+  const asset = url ? readManifest()[url.trim()] : undefined;
+  if (!asset) return url;
+  return (variant === "thumb" && asset.thumb) || asset.path;
+}
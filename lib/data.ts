@@ -103,7 +103,9 @@ export const categorySubFilters: Record<string, string[]> = {
   Payments: ["stablecoin", "onramp", "merchant", "micropayments", "payroll", "streaming", "freelance", "USDC"],
 };
 
-import projectsFromDevfolio from "./projects-from-devfolio.json";
+// The directory listing: every Devfolio project without descriptionFull, about a fifth of
+// projects-from-devfolio.json. Detail pages add it back from their shard (lib/project-detail.ts).
+import projectsFromDevfolio from "./directory/listing.json";
 import clawdKitchenRaw from "./clawd-kitchen-projects.json";
 import projectsFromSubmissions from "./projects-from-submissions.json";
 
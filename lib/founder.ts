@@ -1,6 +1,8 @@
 import matter from "gray-matter";
-import { readFileSync, readdirSync, existsSync } from "fs";
+import { createHash } from "crypto";
+import { readFileSync, readdirSync, existsSync, statSync } from "fs";
 import path from "path";
+import { mirroredAssetUrl } from "@/lib/asset-mirror";
 
 export interface FounderProfileFrontmatter {
   /** Unique ID for Telegram bot: user sends /edit <edit_id> to request profile edits. */
@@ -20,6 +22,8 @@ export interface FounderProfileFrontmatter {
   prize_winnings_amount?: number;
   onchain_creds_claimed?: number;
   tags?: string[];
+  /** Hash of the About text the crawler generated; the About is left alone once it no longer matches. */
+  about_sha?: string;
 }
 
 export interface FounderProfile {
@@ -29,10 +33,33 @@ export interface FounderProfile {
 }
 
 const CONTENT_DIR = path.join(process.cwd(), "content", "founders");
+/** Written by scripts/devfolio-scraper/founders_index.py: frontmatter + sha256 of every founder MDX. */
+const INDEX_FILE = path.join(process.cwd(), "content", "founders-index.json");
+
+interface FounderIndex {
+  version: number;
+  founders: Record<string, { hash: string; frontmatter: FounderProfileFrontmatter }>;
+}
 
 let _allFounderFrontmatterCache: Map<string, FounderProfileFrontmatter> | null = null;
 
-/** Batch-read all founder MDX frontmatter once. Cached for the process. Use for lists (e.g. /founders). */
+function readFounderIndex(): { founders: FounderIndex["founders"]; mtimeMs: number } {
+  if (!existsSync(INDEX_FILE)) return { founders: {}, mtimeMs: 0 };
+  try {
+    const mtimeMs = statSync(INDEX_FILE).mtimeMs;
+    const index = JSON.parse(readFileSync(INDEX_FILE, "utf-8")) as FounderIndex;
+    return index.version === 1 ? { founders: index.founders ?? {}, mtimeMs } : { founders: {}, mtimeMs: 0 };
+  } catch {
+    return { founders: {}, mtimeMs: 0 };
+  }
+}
+
+/**
+ * Batch-read all founder MDX frontmatter once. Cached for the process. Use for lists (e.g. /founders).
+ * An entry of founders-index.json is trusted without opening the MDX when the file is not newer than
+ * the index (one stat per founder). Only files modified since the index was written are read: their
+ * entry is still used if the hash matches, otherwise (or when the entry is missing) gray-matter parses them.
+ */
 export function getAllFounderFrontmatterMap(): Map<string, FounderProfileFrontmatter> {
   if (_allFounderFrontmatterCache) return _allFounderFrontmatterCache;
   const map = new Map<string, FounderProfileFrontmatter>();
@@ -40,12 +67,23 @@ export function getAllFounderFrontmatterMap(): Map<string, FounderProfileFrontma
     _allFounderFrontmatterCache = map;
     return map;
   }
+  const index = readFounderIndex();
   const files = readdirSync(CONTENT_DIR).filter((f: string) => f.endsWith(".mdx"));
   for (const file of files) {
     const username = file.replace(/\.mdx$/, "");
+    const filePath = path.join(CONTENT_DIR, file);
     try {
-      const raw = readFileSync(path.join(CONTENT_DIR, file), "utf-8");
-      const { data } = matter(raw);
+      const entry = index.founders[username];
+      if (entry && statSync(filePath).mtimeMs <= index.mtimeMs) {
+        map.set(username, entry.frontmatter);
+        continue;
+      }
+      const raw = readFileSync(filePath);
+      if (entry && entry.hash === createHash("sha256").update(raw).digest("hex")) {
+        map.set(username, entry.frontmatter);
+        continue;
+      }
+      const { data } = matter(raw.toString("utf-8"));
       map.set(username, data as FounderProfileFrontmatter);
     } catch {
       // skip invalid files
@@ -115,7 +153,7 @@ export function getAllFoundersForPals(projects: {
         name: f.name || username,
         city: f.city ?? null,
         short_bio: f.short_bio ?? null,
-        profile_image: f.profile_image ?? null,
+        profile_image: mirroredAssetUrl(f.profile_image, "thumb") ?? null,
         project: (proj as { name?: string } | undefined)?.name ?? f.name ?? username,
         tags: f.tags ?? [],
       });
@@ -134,10 +172,10 @@ export function getAllFoundersForPals(projects: {
   return out.sort((a, b) => a.name.localeCompare(b.name));
 }
 
-/** Avatar URL for a founder: profile_image if set and URL-like, else Twitter avatar via unavatar. */
+/** Avatar URL for a founder: profile_image if set and URL-like (or mirrored locally), else Twitter avatar via unavatar. */
 function getFounderAvatarUrl(founder: FounderForPals): string {
   const img = founder.profile_image?.trim();
-  if (img && (img.startsWith("http://") || img.startsWith("https://")))
+  if (img && (img.startsWith("http://") || img.startsWith("https://") || img.startsWith("/")))
     return img;
   return `https://unavatar.io/twitter/${encodeURIComponent(founder.username)}`;
 }
@@ -0,0 +1,31 @@
+/**
+ * Server-only: one project with its full description.
+ * lib/data.ts carries the directory listing (lib/directory/listing.json, no descriptionFull), so
+ * a detail page reads just its own shard, lib/directory/projects/<slug>.json, written by
+ * scripts/devfolio-scraper/directory_index.py, instead of the whole project list.
+ */
+import { existsSync, readFileSync } from "fs";
+import path from "path";
+import { getProjectBySlugOrId, type Project } from "@/lib/data";
+
+const SHARD_DIR = path.join(process.cwd(), "lib", "directory", "projects");
+
+/** Same file name as directory_index.shard_name(). */
+function shardFile(project: Project): string {
+  return path.join(SHARD_DIR, `${(project.slug || project.id).replace(/[^A-Za-z0-9._-]/g, "_")}.json`);
+}
+
+/** Project by slug or id, with descriptionFull from its shard when it has one. */
+export function getProjectDetail(slugOrId: string): Project | undefined {
+  const project = getProjectBySlugOrId(slugOrId);
+  if (!project) return undefined;
+  // ClawdKitchen and submitted projects have no shard; they carry their description inline
+  const file = shardFile(project);
+  if (!existsSync(file)) return project;
+  try {
+    const detail = JSON.parse(readFileSync(file, "utf-8")) as Project;
+    return detail.id === project.id ? detail : project;
+  } catch {
+    return project;
+  }
+}
@@ -0,0 +1,86 @@
+/**
+ * Read lib/projects-from-devfolio.changeset.json (written by scripts/devfolio-scraper/changeset.py)
+ * so a sync only touches the projects that changed since its last run.
+ *
+ * Each consumer keeps the changeset sequence it last applied in scripts/.sync-cursors.json.
+ * projectChanges() returns null when the consumer has to do a full sync: first run, no changeset,
+ * or more runs since its cursor than the changeset log keeps.
+ */
+import * as fs from "fs";
+import * as path from "path";
+
+const CHANGESET_FILE = path.join(process.cwd(), "lib", "projects-from-devfolio.changeset.json");
+const CURSOR_FILE = path.join(process.cwd(), "scripts", ".sync-cursors.json");
+
+interface ChangesetEntry {
+  sequence: number;
+  added: string[];
+  modified: string[];
+  removed: string[];
+  /** Slug of every id in the entry, removed ones included */
+  slugs: Record<string, string>;
+}
+
+interface Changeset {
+  version: number;
+  sequence: number;
+  records: Record<string, { hash: string; slug: string }>;
+  log: ChangesetEntry[];
+}
+
+export interface ProjectChanges {
+  sequence: number;
+  /** Project ids added or modified since the cursor */
+  upsert: Set<string>;
+  /** Slugs of projects removed since the cursor */
+  removedSlugs: string[];
+}
+
+function readJson<T>(file: string): T | null {
+  if (!fs.existsSync(file)) return null;
+  try {
+    return JSON.parse(fs.readFileSync(file, "utf-8")) as T;
+  } catch {
+    return null;
+  }
+}
+
+function readChangeset(): Changeset | null {
+  const changeset = readJson<Changeset>(CHANGESET_FILE);
+  return changeset?.version === 1 ? changeset : null;
+}
+
+/** Current changeset sequence, 0 when there is no changeset. */
+export function currentSequence(): number {
+  return readChangeset()?.sequence ?? 0;
+}
+
+/** Projects to process for `consumer`, or null when it has to process all of them. */
+export function projectChanges(consumer: string): ProjectChanges | null {
+  const changeset = readChangeset();
+  const cursor = readJson<Record<string, number>>(CURSOR_FILE)?.[consumer];
+  if (!changeset || cursor === undefined) return null;
+  if (cursor >= changeset.sequence) return { sequence: changeset.sequence, upsert: new Set(), removedSlugs: [] };
+  const entries = changeset.log.filter((e) => e.sequence > cursor);
+  if (entries[0]?.sequence !== cursor + 1) return null;
+  const touched = new Map<string, string>();
+  for (const entry of entries) {
+    for (const id of [...entry.added, ...entry.modified, ...entry.removed]) touched.set(id, entry.slugs[id] ?? "");
+  }
+  const upsert = new Set<string>();
+  const removedSlugs: string[] = [];
+  for (const [id, slug] of touched) {
+    if (changeset.records[id]) upsert.add(id);
+    else if (slug) removedSlugs.push(slug);
+  }
+  return { sequence: changeset.sequence, upsert, removedSlugs };
+}
+
+/** Record that `consumer` has applied everything up to `sequence`. */
+export function saveCursor(consumer: string, sequence: number): void {
+  const cursors = readJson<Record<string, number>>(CURSOR_FILE) ?? {};
+  cursors[consumer] = sequence;
+  const tmp = CURSOR_FILE + ".tmp";
+  fs.writeFileSync(tmp, JSON.stringify(cursors, null, 2) + "\n", "utf-8");
+  fs.renameSync(tmp, CURSOR_FILE);
+}
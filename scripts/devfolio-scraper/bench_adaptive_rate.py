@@ -0,0 +1,81 @@
+"""
+Adaptive (AIMD) request pacing vs fixed pacing against a fake_devfolio.py server that only
+tolerates a given load.
+
+For each --capacity (requests/s the server serves before answering 429 + Retry-After) the
+profile crawl runs once with a fixed --rps and once with http_client's adaptive limiter
+starting at the same rate. Reported per run: wall time, profiles/s, 429s and the rate the
+limiter ended at / peaked at. The adaptive run should settle near the capacity: faster than a
+too-cautious fixed rate, and with far fewer 429s than a too-aggressive one.
+
+Usage:
+  python bench_adaptive_rate.py                                 # capacities 5 20 50, fixed 4 req/s
+  python bench_adaptive_rate.py --capacity 10 --fixed-rps 30 --profiles 400 --latency 0.05
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+
+import fetch_devfolio_profile_json as crawler
+import http_client
+from fake_devfolio import FakeDevfolio
+
+
+def run(server: FakeDevfolio, usernames: list[str], concurrency: int, rps: float, adaptive: bool, max_rps: float) -> dict:
+    if adaptive:
+        http_client.configure_rate(start_rps=rps, max_rps=max_rps)
+    else:
+        http_client.reset_rate()
+    server.reset_stats()
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.perf_counter()
+        asyncio.run(
+            crawler.crawl_async(
+                usernames, Path(tmp), base_url=server.base_url, concurrency=concurrency, rps=0 if adaptive else rps
+            )
+        )
+        wall = time.perf_counter() - t0
+    stats = server.reset_stats()
+    limiter = http_client.limiter_for(server.base_url.split("//", 1)[1]) if adaptive else None
+    return {
+        "wall": wall,
+        "profiles_per_s": len(usernames) / wall,
+        "requests": stats["requests"],
+        "throttled": stats["status"].get(429, 0),
+        "final_rps": limiter.rate if limiter else rps,
+        "peak_rps": limiter.peak_rate if limiter else rps,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--capacity", type=float, nargs="+", default=[5, 20, 50], help="Server capacities (req/s)")
+    parser.add_argument("--profiles", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.02, help="Server latency per request (seconds)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--fixed-rps", type=float, default=crawler.DEFAULT_RPS, help="Fixed rate, also the adaptive start")
+    parser.add_argument("--max-rps", type=float, default=100.0, help="Adaptive rate ceiling")
+    args = parser.parse_args()
+
+    usernames = [f"builder{i:05d}" for i in range(args.profiles)]
+    print(f"{args.profiles} profiles, concurrency {args.concurrency}, latency {args.latency}s, fixed/start rate {args.fixed_rps:g} req/s")
+    print(f"{'capacity':>8} {'mode':<9} {'wall s':>8} {'profiles/s':>11} {'requests':>9} {'429s':>6} {'end req/s':>10} {'peak req/s':>11}")
+    for capacity in args.capacity:
+        server = FakeDevfolio(latency=args.latency, retry_after=args.retry_after, capacity=capacity)
+        server.start()
+        for adaptive in (False, True):
+            row = run(server, usernames, args.concurrency, args.fixed_rps, adaptive, args.max_rps)
+            print(
+                f"{capacity:>8g} {'adaptive' if adaptive else 'fixed':<9} {row['wall']:>8.2f} {row['profiles_per_s']:>11.1f} "
+                f"{row['requests']:>9} {row['throttled']:>6} {row['final_rps']:>10.1f} {row['peak_rps']:>11.1f}"
+            )
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
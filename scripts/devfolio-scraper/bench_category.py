@@ -0,0 +1,87 @@
+"""
+Benchmark for transform_to_data category inference on a synthetic corpus.
+
+Compares the original per-project loops (every category x keyword x hashtag, two-way
+substring test) with the batch classifier transform_to_data.iter_transformed uses
+(infer_categories over the precompiled CategoryIndex) and checks that both give every project
+the same category.
+
+Usage:
+  python bench_category.py                   # 50,000 projects
+  python bench_category.py --projects 200000 --vocab 3000
+"""
+import argparse
+import random
+import time
+
+from transform_to_data import CATEGORY_KEYWORDS, CategoryIndex, hashtag_names, infer_categories
+
+# Hashtags as they show up on Devfolio projects, plus keyword-ish ones
+COMMON_TAGS = [
+    "Solidity", "Next.js", "TypeScript", "React", "BASE", "Node.js", "Python", "Rust", "Hardhat",
+    "Foundry", "ethers.js", "wagmi", "viem", "Tailwind CSS", "Shadcn", "Smart wallet", "OnchainKit",
+    "Coinbase Wallet", "IPFS", "The Graph", "Chainlink", "Uniswap", "USDC", "Farcaster", "Frames",
+    "OpenAI", "LangChain", "Supabase", "PostgreSQL", "MongoDB", "Docker", "Remix (IDE)", "ThirdWeb",
+]
+
+
+def legacy_infer_category(hashtags: list) -> str:
+    """transform_to_data.infer_category before the keyword index."""
+    if not hashtags:
+        return "Consumer"
+    tag_names = hashtag_names(hashtags)
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        for kw in keywords:
+            if any(kw in t or t in kw for t in tag_names):
+                return category
+    return "Consumer"
+
+
+def synthetic_corpus(projects: int, vocab_size: int, seed: int) -> list:
+    rng = random.Random(seed)
+    keywords = [kw for kws in CATEGORY_KEYWORDS.values() for kw in kws]
+    vocab = list(COMMON_TAGS)
+    while len(vocab) < vocab_size:
+        word = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 12)))
+        # Some long-tail tags contain a category keyword
+        if rng.random() < 0.2:
+            word = word[:3] + rng.choice(keywords) + word[3:]
+        vocab.append(word.title())
+    corpus = []
+    for _ in range(projects):
+        n = rng.randint(0, 12)
+        corpus.append([{"name": rng.choice(vocab)} if rng.random() < 0.9 else rng.choice(vocab) for _ in range(n)])
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=50_000)
+    parser.add_argument("--vocab", type=int, default=1500, help="Distinct hashtags in the corpus")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = synthetic_corpus(args.projects, args.vocab, args.seed)
+    print(f"{args.projects} projects, {args.vocab} distinct hashtags")
+
+    t0 = time.perf_counter()
+    legacy = [legacy_infer_category(h) for h in corpus]
+    legacy_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    CategoryIndex(CATEGORY_KEYWORDS)
+    build_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    indexed = [category for category, _ in infer_categories(corpus)]
+    indexed_s = time.perf_counter() - t0
+
+    by_score = [category for category, _ in infer_categories(corpus, by_score=True)]
+    mismatches = sum(1 for a, b in zip(legacy, indexed) if a != b)
+    print(f"legacy loops:   {legacy_s:7.3f}s  ({args.projects / legacy_s:10.0f} projects/s)")
+    print(f"keyword index:  {indexed_s:7.3f}s  ({args.projects / indexed_s:10.0f} projects/s), built in {build_s * 1000:.1f} ms")
+    print(f"speedup: {legacy_s / indexed_s:.1f}x   mismatches: {mismatches}")
+    print(f"projects whose category changes with by_score=True: {sum(1 for a, b in zip(indexed, by_score) if a != b)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Micro-benchmark for profile link extraction (fetch_devfolio_profiles.extract_links).
+
+Times per-page parse cost of:
+  legacy       two full BeautifulSoup(html.parser) passes + regex fallbacks (the old
+               extract_github_url / extract_twitter_handle)
+  next_data    extract_links with the structured __NEXT_DATA__ profiles (the normal path)
+  html_scan    extract_links when __NEXT_DATA__ has no links (anchor-only parse + one regex)
+
+Pages come from --fixtures DIR (*.html), else from the HTTP cache (.http_cache.sqlite3),
+else synthetic Next.js-sized pages. --save-fixtures DIR writes the cached pages out as
+fixture files so later runs compare against the same inputs.
+
+Usage:
+  python bench_link_extraction.py
+  python bench_link_extraction.py --fixtures fixtures/ --repeat 5
+  python bench_link_extraction.py --save-fixtures fixtures/
+"""
+import argparse
+import re
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+import http_cache
+from fake_devfolio import fake_profile_html
+from fetch_devfolio_profiles import BASE_URL, HTML_PARSER, extract_handle_from_twitter_url, extract_links
+
+
+def legacy_extract(html: str) -> dict:
+    """Links as extracted before the single-pass rewrite (two full parses per page)."""
+    out = {}
+    soup = BeautifulSoup(html, "html.parser")
+    for a in soup.find_all("a", href=True):
+        h = extract_handle_from_twitter_url((a.get("href") or "").strip())
+        if h:
+            out["twitter"] = h
+            break
+    else:
+        m = re.search(r'["\'](https?://(?:www\.)?(?:x\.com|twitter\.com)/(?:#!/)?([a-zA-Z0-9_]+))["\']', html, re.I)
+        if m:
+            out["twitter"] = m.group(2)
+    soup = BeautifulSoup(html, "html.parser")
+    for a in soup.find_all("a", href=True):
+        href = (a.get("href") or "").strip()
+        if href.startswith("//"):
+            href = "https:" + href
+        if href.startswith("/"):
+            href = BASE_URL + href
+        if href.startswith("http") and "github.com" in href.lower() and "gist." not in href.lower():
+            out["github"] = href
+            break
+    else:
+        m = re.search(r'["\'](https?://(?:www\.)?github\.com/[^"\'\\s]+)["\']', html, re.I)
+        if m:
+            out["github"] = m.group(1)
+    return out
+
+
+def synthetic_pages(count: int) -> dict:
+    """Profile pages padded to roughly the size of a real Devfolio Next.js page (~100 KB)."""
+    filler = "".join(
+        f'<div class="sc-{i}"><a href="/hackathons/h{i}">Hackathon {i}</a><span>{"lorem ipsum " * 8}</span></div>'
+        for i in range(600)
+    )
+    pages = {}
+    for i in range(count):
+        html = fake_profile_html(f"builder{i:04d}")
+        pages[f"builder{i:04d}.html"] = html.replace('<div id="__next"></div>', f'<div id="__next">{filler}</div>')
+    return pages
+
+
+def cached_pages() -> dict:
+    if not http_cache.CACHE_FILE.exists():
+        return {}
+    db = sqlite3.connect(http_cache.CACHE_FILE)
+    rows = db.execute("SELECT url, body FROM responses WHERE url LIKE '%/@%'").fetchall()
+    db.close()
+    return {url.rsplit("/@", 1)[-1] + ".html": body for url, body in rows}
+
+
+def time_per_page(fn, pages: list, repeat: int) -> list:
+    times = []
+    for html in pages:
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn(html)
+            best = min(best, time.perf_counter() - t0)
+        times.append(best * 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", type=Path, help="Folder of saved profile pages (*.html)")
+    parser.add_argument("--save-fixtures", type=Path, help="Write cached profile pages to this folder and exit")
+    parser.add_argument("--pages", type=int, default=30, help="Synthetic pages when no fixtures/cache (default: 30)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per page; best is kept (default: 3)")
+    args = parser.parse_args()
+
+    if args.save_fixtures:
+        args.save_fixtures.mkdir(parents=True, exist_ok=True)
+        pages = cached_pages()
+        for name, html in pages.items():
+            (args.save_fixtures / name).write_text(html, encoding="utf-8")
+        print("Saved", len(pages), "fixture pages to", args.save_fixtures)
+        return
+
+    if args.fixtures:
+        pages = {p.name: p.read_text(encoding="utf-8") for p in sorted(args.fixtures.glob("*.html"))}
+        source = str(args.fixtures)
+    else:
+        pages = cached_pages()
+        source = "HTTP cache"
+        if not pages:
+            pages = synthetic_pages(args.pages)
+            source = "synthetic"
+    htmls = list(pages.values())
+    avg_kb = sum(len(h) for h in htmls) / len(htmls) / 1024
+    print(f"{len(htmls)} pages from {source}, avg {avg_kb:.0f} KB, HTML backend: {HTML_PARSER}")
+    print(f"{'path':<11} {'mean ms':>9} {'median ms':>10} {'p95 ms':>8}")
+    for name, fn in (
+        ("legacy", legacy_extract),
+        ("next_data", extract_links),
+        ("html_scan", lambda html: extract_links(html, profiles=[])),
+    ):
+        times = sorted(time_per_page(fn, htmls, args.repeat))
+        p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+        print(f"{name:<11} {statistics.mean(times):9.2f} {statistics.median(times):10.2f} {p95:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Per-profile CPU time and peak memory of the __NEXT_DATA__ extraction paths in next_data.py.
+
+  legacy      regex(DOTALL) over the page + json.loads + full recursive walk (the old code)
+  early_stop  next_data_json + json.loads + extract_users_and_stats (stops once all four found)
+  targeted    next_data_json + extract_users_and_stats_targeted (decodes only the four subtrees)
+  stream      extract_users_and_stats_stream over the page in 16 KiB chunks (as --stream-parse reads it)
+
+Peak memory is measured with tracemalloc around one extraction (page text excluded). Pages come
+from --fixtures DIR (*.html), else the HTTP cache, else synthetic pages with --filler unrelated
+records in the payload. All paths must return the same four values.
+
+--crawl N also runs fetch_devfolio_profile_json's concurrent crawl of N profiles against a local
+fake_devfolio.py server (pages with --filler records) once per parse mode, and reports the peak
+traced memory of the whole crawl. Full and targeted parses hold every in-flight page; the stream
+parse holds a chunk per request, so its peak should not grow with page size.
+
+Usage:
+  python bench_next_data.py
+  python bench_next_data.py --filler 5000 --pages 10
+  python bench_next_data.py --fixtures fixtures/
+  python bench_next_data.py --crawl 100 --concurrency 32 --filler 2000
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import fetch_devfolio_profile_json as crawler
+from bench_link_extraction import cached_pages
+from fake_devfolio import fake_profile_html
+from next_data import extract_users_and_stats, extract_users_and_stats_stream, extract_users_and_stats_targeted, next_data_json
+
+
+def legacy_extract(html: str):
+    """The pre-rewrite path: regex over the page, full parse, queries scan, then a full walk."""
+    match = re.search(r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>', html, re.DOTALL)
+    next_data = json.loads(match.group(1))
+    user, profiles_list, address_data, stats_data = None, [], None, None
+
+    def walk(o, depth=0):
+        nonlocal user, profiles_list, address_data, stats_data
+        if depth > 30:
+            return
+        if isinstance(o, dict):
+            if "users" in o and isinstance(o["users"], list) and o["users"] and user is None:
+                user = o["users"][0]
+            if "userDevfolioStats" in o and stats_data is None:
+                stats_data = o["userDevfolioStats"]
+            if "profiles" in o and isinstance(o["profiles"], list) and o["profiles"]:
+                profiles_list = o["profiles"]
+            if "address" in o and isinstance(o["address"], dict) and address_data is None:
+                address_data = o["address"]
+            for v in o.values():
+                walk(v, depth + 1)
+        elif isinstance(o, list):
+            for i in o:
+                walk(i, depth + 1)
+
+    walk(next_data)
+    return user, profiles_list, address_data, stats_data
+
+
+PATHS = {
+    "legacy": legacy_extract,
+    "early_stop": lambda html: extract_users_and_stats(json.loads(next_data_json(html))),
+    "targeted": lambda html: extract_users_and_stats_targeted(next_data_json(html)),
+    "stream": lambda html: extract_users_and_stats_stream(
+        html[i : i + crawler.STREAM_CHUNK] for i in range(0, len(html), crawler.STREAM_CHUNK)
+    ),
+}
+
+
+def measure(fn, html: str) -> tuple[float, float]:
+    """(CPU ms, peak KiB) for one extraction."""
+    t0 = time.process_time()
+    fn(html)
+    cpu = (time.process_time() - t0) * 1000
+    tracemalloc.start()
+    fn(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak / 1024
+
+
+def start_server(filler: int) -> tuple[subprocess.Popen, str]:
+    """fake_devfolio.py in its own process, so its page building is not in the traced memory."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    proc = subprocess.Popen(
+        [sys.executable, "fake_devfolio.py", "--port", str(port), "--filler", str(filler)],
+        cwd=Path(__file__).resolve().parent,
+        stdout=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return proc, base_url
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("fake_devfolio.py did not start")
+
+
+def crawl_peak(count: int, concurrency: int, filler: int) -> None:
+    proc, base_url = start_server(filler)
+    usernames = [f"builder{i:05d}" for i in range(count)]
+    page_kb = len(fake_profile_html(usernames[0], filler)) / 1024
+    print(f"\ncrawl: {count} profiles, concurrency {concurrency}, ~{page_kb:.0f} KB pages")
+    print(f"{'parse':<9} {'wall s':>7} {'peak MiB':>9}")
+    for parse in ("full", "targeted", "stream"):
+        with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            asyncio.run(crawler.crawl_async(usernames, Path(tmp), base_url=base_url, concurrency=concurrency, rps=0, parse=parse))
+            wall = time.perf_counter() - t0
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        print(f"{parse:<9} {wall:7.2f} {peak / 2**20:9.1f}")
+    proc.terminate()
+    proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", type=Path, help="Folder of saved profile pages (*.html)")
+    parser.add_argument("--pages", type=int, default=20, help="Synthetic pages (default: 20)")
+    parser.add_argument("--filler", type=int, default=2000, help="Unrelated records per synthetic payload")
+    parser.add_argument("--crawl", type=int, default=0, help="Also measure a concurrent crawl of this many profiles")
+    parser.add_argument("--concurrency", type=int, default=32, help="Requests in flight for --crawl (default: 32)")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        htmls = [p.read_text(encoding="utf-8") for p in sorted(args.fixtures.glob("*.html"))]
+        source = str(args.fixtures)
+    else:
+        htmls = list(cached_pages().values())
+        source = "HTTP cache"
+        if not htmls:
+            htmls = [fake_profile_html(f"builder{i:04d}", filler_items=args.filler) for i in range(args.pages)]
+            source = f"synthetic, {args.filler} filler records"
+    htmls = [h for h in htmls if next_data_json(h) is not None]
+    avg_kb = sum(len(h) for h in htmls) / max(1, len(htmls)) / 1024
+    print(f"{len(htmls)} pages ({source}), avg {avg_kb:.0f} KB")
+
+    mismatches = sum(1 for h in htmls if len({json.dumps(fn(h), sort_keys=True) for fn in PATHS.values()}) > 1)
+    print(f"{'path':<11} {'cpu ms/page':>12} {'peak KiB/page':>14}")
+    for name, fn in PATHS.items():
+        results = [measure(fn, h) for h in htmls]
+        print(
+            f"{name:<11} {statistics.mean(r[0] for r in results):12.2f} {statistics.mean(r[1] for r in results):14.0f}"
+        )
+    print("pages where the paths disagree:", mismatches)
+    if args.crawl:
+        crawl_peak(args.crawl, args.concurrency, args.filler)
+
+
+if __name__ == "__main__":
+    main()
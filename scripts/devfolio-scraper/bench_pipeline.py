@@ -0,0 +1,174 @@
+"""
+End-to-end throughput benchmark of the pipeline stages against fake_devfolio.py.
+
+For each --scales multiple of today's data (385 projects, ~530 founders) it starts a local
+stand-in server and runs scrape -> transform -> profiles -> merge into a temp folder, each
+stage in a fresh process so its peak RSS is its own. Reported per stage: records, wall time,
+records/s, HTTP requests and req/s (counted by the server), non-200 responses and peak RSS.
+Latency, 500s and 429s can be injected to see how the retry paths hold up.
+
+Usage:
+  python bench_pipeline.py                          # 1x, 10x and 100x
+  python bench_pipeline.py --scales 1 10 --latency 0.02 --error-rate 0.01 --throttle-rate 0.02
+  python bench_pipeline.py --json bench_results.json   # keep the numbers to compare runs
+"""
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fake_devfolio import SEARCH_PATH, FakeDevfolio
+from records import iter_records
+
+STAGES = ["scrape", "transform", "profiles", "merge"]
+
+
+def peak_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+
+def stage_main(stage: str, workdir: Path, base_url: str, options: dict, conn) -> None:
+    """Child process: run one stage with its files redirected into workdir."""
+    all_projects = workdir / "all_projects.json"
+    projects_json = workdir / "projects-from-devfolio.json"
+    profile_links = workdir / "profile_links.json"
+    metrics_args = ["--metrics-dir", str(workdir / "metrics")]
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        t0 = time.perf_counter()
+        if stage == "scrape":
+            import scrape
+
+            scrape.URL = base_url + SEARCH_PATH
+            scrape.OUTPUT_FILE = all_projects
+            scrape.CHECKPOINT_FILE = workdir / "scrape_checkpoint.json"
+            scrape.PARTIAL_FILE = workdir / "all_projects.partial.ndjson"
+            scrape.main(["--restart", "--workers", str(options["workers"]), *metrics_args])
+        elif stage == "transform":
+            import transform_to_data
+
+            transform_to_data.main(["--input", str(all_projects), "--output", str(projects_json), *metrics_args])
+        elif stage == "profiles":
+            import fetch_devfolio_profile_json as crawler
+
+            crawler.PROJECTS_JSON = projects_json
+            crawler.PROFILE_LINKS = profile_links
+            crawler.CONTENT_FOUNDERS = workdir / "founders"
+            crawler.main(
+                [
+                    "--concurrency",
+                    str(options["concurrency"]),
+                    "--rps",
+                    "0",
+                    "--no-adaptive",
+                    "--no-cache",
+                    "--retry-window",
+                    "0",
+                    "--journal",
+                    str(workdir / "profile_failures.json"),
+                    "--identity",
+                    str(workdir / "identity_graph.json"),
+                    "--base-url",
+                    base_url,
+                    *metrics_args,
+                ]
+            )
+        elif stage == "merge":
+            import merge_profile_links
+
+            merge_profile_links.PROJECTS_JSON = projects_json
+            merge_profile_links.PROFILE_LINKS = profile_links
+            merge_profile_links.main(["--identity", str(workdir / "identity_graph.json"), *metrics_args])
+        wall = time.perf_counter() - t0
+    conn.send({"wall": wall, "peak_rss_mb": peak_rss_mb()})
+
+
+def count_records(stage: str, workdir: Path) -> int:
+    if stage == "scrape":
+        return sum(1 for _ in iter_records(workdir / "all_projects.json"))
+    if stage == "profiles":
+        with open(workdir / "profile_links.json", encoding="utf-8") as f:
+            return len(json.load(f))
+    return sum(1 for _ in iter_records(workdir / "projects-from-devfolio.json"))
+
+
+def run_stage(stage: str, workdir: Path, server: FakeDevfolio, options: dict) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    parent, child = ctx.Pipe(duplex=False)
+    server.reset_stats()
+    proc = ctx.Process(target=stage_main, args=(stage, workdir, server.base_url, options, child))
+    proc.start()
+    result = parent.recv() if parent.poll(timeout=None) else {}
+    proc.join()
+    if proc.exitcode != 0:
+        raise RuntimeError(f"{stage} exited with {proc.exitcode}")
+    http = server.reset_stats()
+    wall = result["wall"]
+    records = count_records(stage, workdir)
+    return {
+        "stage": stage,
+        "records": records,
+        "wall_s": round(wall, 3),
+        "records_per_s": round(records / wall, 1),
+        "requests": http["requests"],
+        "requests_per_s": round(http["requests"] / wall, 1),
+        "non_200": sum(n for status, n in http["status"].items() if status != 200),
+        "mb_downloaded": round(http["bytes"] / 2**20, 2),
+        "peak_rss_mb": round(result["peak_rss_mb"], 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=float, nargs="+", default=[1, 10, 100], help="Multiples of today's data")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES, help="Stop after the last one listed")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server latency per request (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=0.1, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--workers", type=int, default=4, help="scrape.py --workers")
+    parser.add_argument("--concurrency", type=int, default=32, help="fetch_devfolio_profile_json.py --concurrency")
+    parser.add_argument("--json", type=Path, help="Also write the results to this file")
+    args = parser.parse_args()
+
+    # Stages depend on the previous one's output, so run every stage up to the last one asked for
+    stages = STAGES[: max(STAGES.index(s) for s in args.stages) + 1]
+    options = {"workers": args.workers, "concurrency": args.concurrency}
+    results = []
+    print(f"{'scale':>6} {'stage':<10} {'records':>8} {'wall s':>8} {'rec/s':>9} {'requests':>9} {'req/s':>8} {'non-200':>8} {'MB in':>7} {'peak RSS MB':>12}")
+    for scale in args.scales:
+        server = FakeDevfolio(scale, args.latency, args.error_rate, args.throttle_rate, args.retry_after)
+        server.start()
+        with tempfile.TemporaryDirectory() as tmp:
+            for stage in stages:
+                row = {"scale": scale, **run_stage(stage, Path(tmp), server, options)}
+                results.append(row)
+                print(
+                    f"{scale:>5g}x {stage:<10} {row['records']:>8} {row['wall_s']:>8.2f} {row['records_per_s']:>9.0f} "
+                    f"{row['requests']:>9} {row['requests_per_s']:>8.0f} {row['non_200']:>8} {row['mb_downloaded']:>7.1f} "
+                    f"{row['peak_rss_mb']:>12.1f}"
+                )
+        server.stop()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "settings": {k: (str(v) if isinstance(v, Path) else v) for k, v in vars(args).items()},
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print("Saved", args.json)
+
+
+if __name__ == "__main__":
+    main()
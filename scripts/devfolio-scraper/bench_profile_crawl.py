@@ -0,0 +1,80 @@
+"""
+Wall-clock comparison of the serial and asyncio profile crawls in fetch_devfolio_profile_json.py.
+
+Serves fake /@{username} pages (with __NEXT_DATA__) from fake_devfolio.py with a fixed
+per-request latency, runs both crawl paths into temp folders, checks the MDX output is
+byte-identical and prints the timings. Never touches devfolio.co.
+
+It also checks that the async crawl really keeps --concurrency requests in flight: its wall
+time must stay within twice the ideal ceil(profiles / concurrency) * latency (or the --rps
+budget when that is slower), else it exits non-zero.
+
+Usage:
+  python bench_profile_crawl.py                      # 20 profiles, 300 ms latency
+  python bench_profile_crawl.py --profiles 40 --latency 0.5 --concurrency 16 --rps 20
+  python bench_profile_crawl.py --profiles 64 --latency 0.5 --concurrency 32 --rps 0
+"""
+import argparse
+import asyncio
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import fetch_devfolio_profile_json as crawler
+from fake_devfolio import FakeDevfolio
+
+
+def read_outputs(folder: Path) -> dict:
+    return {p.name: p.read_bytes() for p in sorted(folder.glob("*.mdx"))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.3, help="Server latency per request (seconds)")
+    parser.add_argument("--concurrency", type=int, default=crawler.DEFAULT_CONCURRENCY)
+    parser.add_argument("--rps", type=float, default=crawler.DEFAULT_RPS)
+    args = parser.parse_args()
+
+    server = FakeDevfolio(latency=args.latency)
+    base_url = server.start()
+    usernames = [f"builder{i:04d}" for i in range(args.profiles)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        serial_dir = Path(tmp) / "serial"
+        async_dir = Path(tmp) / "async"
+        serial_dir.mkdir()
+        async_dir.mkdir()
+
+        t0 = time.perf_counter()
+        crawler.crawl_serial(usernames, serial_dir, base_url=base_url)
+        serial_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        asyncio.run(
+            crawler.crawl_async(usernames, async_dir, base_url=base_url, concurrency=args.concurrency, rps=args.rps)
+        )
+        async_s = time.perf_counter() - t0
+
+        identical = read_outputs(serial_dir) == read_outputs(async_dir)
+
+    server.stop()
+    print()
+    print(f"profiles={args.profiles} latency={args.latency}s concurrency={args.concurrency} rps={args.rps}")
+    print(f"serial: {serial_s:8.2f}s  ({args.profiles / serial_s:6.2f} profiles/s)")
+    print(f"async:  {async_s:8.2f}s  ({args.profiles / async_s:6.2f} profiles/s)")
+    print(f"speedup: {serial_s / async_s:.1f}x   identical MDX output: {identical}")
+
+    # Waves of `concurrency` requests, unless the rate budget is the slower limit
+    ideal = math.ceil(args.profiles / max(1, args.concurrency)) * args.latency
+    if args.rps > 0:
+        ideal = max(ideal, (args.profiles - 1) / args.rps)
+    print(f"async ideal: {ideal:.2f}s   within 2x: {async_s <= 2 * ideal + 0.5}")
+    if not identical or async_s > 2 * ideal + 0.5:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Scaling benchmark for transform_to_data.py --workers on a large synthetic all_projects.json.
+
+Writes a synthetic scrape (--projects records from fake_devfolio.fake_project, shaped like
+Devfolio search hits) to a temp folder, runs the transform serially and with each --workers
+value, checks every output is byte-identical to the serial one and prints wall time and speedup.
+
+Usage:
+  python bench_transform.py                       # 20,000 projects, workers 1 2 4 8
+  python bench_transform.py --projects 100000 --workers 2 4
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import transform_to_data
+from fake_devfolio import HACKATHON_SIZES, fake_project
+
+
+def run(input_file: Path, output_file: Path, workers: int) -> float:
+    t0 = time.perf_counter()
+    transform_to_data.main(["--input", str(input_file), "--output", str(output_file), "--workers", str(workers)])
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8], help="Pool sizes to compare with serial")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        input_file = Path(tmp) / "all_projects.json"
+        with open(input_file, "w", encoding="utf-8") as f:
+            json.dump([fake_project(i, rng.choice(list(HACKATHON_SIZES)), rng) for i in range(args.projects)], f)
+        print(f"{args.projects} projects, {input_file.stat().st_size / 2**20:.0f} MB input, {os.cpu_count()} CPUs")
+
+        serial_out = Path(tmp) / "serial.json"
+        serial_s = run(input_file, serial_out, 1)
+        expected = serial_out.read_bytes()
+        rows = [(1, serial_s, True)]
+        for workers in args.workers:
+            out = Path(tmp) / f"workers{workers}.json"
+            rows.append((workers, run(input_file, out, workers), out.read_bytes() == expected))
+
+    print()
+    print(f"{'workers':>7} {'wall s':>8} {'projects/s':>11} {'speedup':>8}  identical")
+    for workers, seconds, identical in rows:
+        print(f"{workers:>7} {seconds:8.2f} {args.projects / seconds:11.0f} {serial_s / seconds:7.2f}x  {identical}")
+
+
+if __name__ == "__main__":
+    main()
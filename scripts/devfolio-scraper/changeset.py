@@ -0,0 +1,161 @@
+"""
+Per-project content hashes and a changeset log next to the project list, so the TypeScript
+syncs after the pipeline (generate-project-mdx, seed-directory) only touch projects that changed.
+
+Writes lib/projects-from-devfolio.changeset.json (for an output X.json: X.changeset.json):
+  {"version":1,"sequence":7,"count":385,
+   "records":{"<project id>":{"hash":"<sha256>","slug":"..."}},
+   "log":[{"sequence":7,"stage":"merge_profile_links","generated":"2026-01-01T10:00:00",
+           "added":[ids],"modified":[ids],"removed":[ids],"slugs":{"<id>":"<slug>"}}, ...]}
+
+A record's hash is the SHA-256 of its JSON with sorted keys, so it only changes when the project
+does, whatever the field order or file format. The runs that write the final project list
+(merge_profile_links.py, store.py export) compare the new hashes with the saved ones and, when
+something changed, append one log entry under the next sequence number (slugs covers every id
+in the entry, removed ones included). A run that changed nothing leaves the file alone. The
+transform does not record one: its projects lack the merged founder fields, so their hashes
+would differ from the merge's on every refresh.
+
+A consumer remembers the last sequence it applied and reads every log entry after it. The log
+keeps the last LOG_LENGTH runs; a consumer whose sequence is older than that (or that has none)
+does a full sync, which is also what it did before changesets existed.
+
+Usage:
+  python changeset.py                 # latest runs from the log
+  python changeset.py --since 5       # what a consumer at sequence 5 has to apply
+"""
+import argparse
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from records import write_json_atomic
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECTS_JSON = SCRIPT_DIR.parent.parent / "lib" / "projects-from-devfolio.json"
+CHANGESET_VERSION = 1
+LOG_LENGTH = 50
+
+
+def changeset_path(projects_path: Path) -> Path:
+    projects_path = Path(projects_path)
+    return projects_path.with_name(f"{projects_path.stem}.changeset.json")
+
+
+def record_hash(record: dict) -> str:
+    return hashlib.sha256(json.dumps(record, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def record_id(record: dict) -> str:
+    return str(record.get("id") or record.get("slug") or "")
+
+
+def load_changeset(path: Path) -> dict:
+    empty = {"version": CHANGESET_VERSION, "sequence": 0, "count": 0, "records": {}, "log": []}
+    if not Path(path).exists():
+        return empty
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data if data.get("version") == CHANGESET_VERSION else empty
+
+
+def changes_since(changeset: dict, sequence: int | None) -> dict | None:
+    """Ids to upsert and to remove for a consumer that applied `sequence`, or None when the log
+    no longer reaches back that far (full sync needed)."""
+    if sequence is not None and sequence >= changeset["sequence"]:
+        return {"upsert": [], "remove": [], "slugs": {}}
+    entries = [e for e in changeset["log"] if sequence is not None and e["sequence"] > sequence]
+    if not entries or entries[0]["sequence"] != sequence + 1:
+        return None
+    touched, slugs = set(), {}
+    for entry in entries:
+        touched.update(entry["added"] + entry["modified"] + entry["removed"])
+        slugs.update(entry["slugs"])
+    records = changeset["records"]
+    return {
+        "upsert": sorted(i for i in touched if i in records),
+        "remove": sorted(i for i in touched if i not in records),
+        "slugs": {i: slugs[i] for i in sorted(touched)},
+    }
+
+
+class ChangesetWriter:
+    """Hashes projects as they stream past (tee(), like DirectoryWriter); close() writes the changeset."""
+
+    def __init__(self, path: Path, stage: str):
+        self.path = Path(path)
+        self.stage = stage
+        self.records: dict[str, dict] = {}
+
+    def add(self, project: dict) -> None:
+        pid = record_id(project)
+        if pid in self.records:
+            print("Duplicate project id in changeset:", pid)
+        self.records[pid] = {"hash": record_hash(project), "slug": project.get("slug") or ""}
+
+    def tee(self, projects: Iterable[dict]) -> Iterator[dict]:
+        for project in projects:
+            self.add(project)
+            yield project
+
+    def close(self) -> dict:
+        previous = load_changeset(self.path)
+        old = previous["records"]
+        added = sorted(set(self.records) - set(old))
+        removed = sorted(set(old) - set(self.records))
+        modified = sorted(i for i in set(self.records) & set(old) if self.records[i]["hash"] != old[i]["hash"])
+        counts = {"added": len(added), "modified": len(modified), "removed": len(removed), "sequence": previous["sequence"]}
+        if not (added or modified or removed) and self.path.exists():
+            return counts
+        sequence = previous["sequence"] + 1
+        entry = {
+            "sequence": sequence,
+            "stage": self.stage,
+            "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "added": added,
+            "modified": modified,
+            "removed": removed,
+            "slugs": {i: (self.records.get(i) or old[i])["slug"] for i in sorted(added + modified + removed)},
+        }
+        write_json_atomic(
+            self.path,
+            {
+                "version": CHANGESET_VERSION,
+                "sequence": sequence,
+                "count": len(self.records),
+                "records": dict(sorted(self.records.items())),
+                "log": (previous["log"] + [entry])[-LOG_LENGTH:],
+            },
+            indent=None,
+        )
+        counts["sequence"] = sequence
+        return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=Path, default=PROJECTS_JSON, help="Project list the changeset belongs to (default: %(default)s)")
+    parser.add_argument("--since", type=int, help="Show the ids a consumer at this sequence has to upsert / remove")
+    args = parser.parse_args(argv)
+
+    changeset = load_changeset(changeset_path(args.projects))
+    print("Sequence", changeset["sequence"], "-", changeset["count"], "projects")
+    if args.since is not None:
+        changes = changes_since(changeset, args.since)
+        if changes is None:
+            print("Sequence", args.since, "is older than the log: full sync needed.")
+        else:
+            print(len(changes["upsert"]), "to upsert:", " ".join(changes["slugs"][i] for i in changes["upsert"]))
+            print(len(changes["remove"]), "to remove:", " ".join(changes["slugs"][i] for i in changes["remove"]))
+        return
+    for entry in changeset["log"][-10:]:
+        print(
+            f"{entry['sequence']:>4} {entry['generated']} {entry['stage']:<20}",
+            f"+{len(entry['added'])} ~{len(entry['modified'])} -{len(entry['removed'])}",
+        )
+
+
+if __name__ == "__main__":
+    main()
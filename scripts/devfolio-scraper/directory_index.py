@@ -0,0 +1,185 @@
+"""
+Build the project directory's precomputed payloads from the final project list.
+
+Writes, next to lib/projects-from-devfolio.json, into lib/directory/:
+  listing.json          Project[] without descriptionFull, minified, one project per line;
+                        lib/data.ts imports this instead of the full project list
+  search-index.json     inverted index over name, tags, category, batch and founder, plus facets
+  projects/<slug>.json  one full project (descriptionFull included) per file, which
+                        /projects/[slug] reads through lib/project-detail.ts
+
+search-index.json:
+  {"version":1,"count":385,"fields":["name","tags","category","batch","founder"],
+   "terms":{"<token>":[listing positions]},           lowercase [a-z0-9]+ tokens of those fields
+   "facets":{"category":{"AI":[positions]},"batch":{...},"tags":{"<lowercased tag>":[...]}},
+   "facetCounts":{"category":{"AI":12},...}}
+Positions index listing.json, in ascending order, so a query is an intersection of sorted lists.
+
+Projects are taken one at a time (tee() passes them through to whatever writes the main JSON),
+the listing is streamed to disk, and a detail shard is rewritten only when its bytes changed, so
+a refresh that changed three projects touches three shards. Shards of removed projects are deleted.
+Only the final project list is indexed: merge_profile_links.py and store.py export write these
+files, not the transform, whose projects still lack the merged founder fields. The folder is
+committed with the project list, since the Next.js build does not run the scraper.
+
+Usage:
+  python directory_index.py                                   # from lib/projects-from-devfolio.json
+  python directory_index.py --input projects.json --out-dir /tmp/directory
+"""
+import argparse
+import json
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import metrics
+from records import iter_records
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECTS_JSON = SCRIPT_DIR.parent.parent / "lib" / "projects-from-devfolio.json"
+DIRECTORY_DIR = PROJECTS_JSON.parent / "directory"
+INDEX_VERSION = 1
+INDEXED_FIELDS = ("name", "tags", "category", "batch", "founder")
+FACET_FIELDS = ("category", "batch", "tags")
+DETAIL_FIELDS = ("descriptionFull",)
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def compact(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def shard_name(project: dict) -> str:
+    return UNSAFE_FILENAME_RE.sub("_", str(project.get("slug") or project.get("id") or "")) + ".json"
+
+
+def field_values(project: dict, field: str) -> list[str]:
+    """Text of one indexed field; "founder" covers every founder's name and handle."""
+    if field == "tags":
+        return [str(t) for t in project.get("tags") or []]
+    if field == "founder":
+        values = [project.get("founder"), project.get("founderTwitter"), project.get("founderTwitterHandle")]
+        for f in project.get("founders") or []:
+            values += [f.get("name"), f.get("twitter")]
+        return [str(v) for v in values if v]
+    value = project.get(field)
+    return [str(value)] if value else []
+
+
+class DirectoryWriter:
+    """Collects the directory payloads while the projects stream past; close() finishes them."""
+
+    def __init__(self, out_dir: Path = DIRECTORY_DIR):
+        self.out_dir = Path(out_dir)
+        self.shard_dir = self.out_dir / "projects"
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        self.listing_path = self.out_dir / "listing.json"
+        self.listing_tmp = self.listing_path.with_suffix(".json.tmp")
+        self.listing = open(self.listing_tmp, "w", encoding="utf-8")
+        self.count = 0
+        self.terms: dict[str, list[int]] = {}
+        self.facets: dict[str, dict[str, list[int]]] = {field: {} for field in FACET_FIELDS}
+        self.shards: set[str] = set()
+        self.shards_written = 0
+
+    def add(self, project: dict) -> None:
+        position = self.count
+        slim = {k: v for k, v in project.items() if k not in DETAIL_FIELDS}
+        self.listing.write(("[" if position == 0 else ",\n") + compact(slim))
+
+        tokens = set()
+        for field in INDEXED_FIELDS:
+            for value in field_values(project, field):
+                tokens.update(TOKEN_RE.findall(value.lower()))
+        for token in tokens:
+            self.terms.setdefault(token, []).append(position)
+        for field in FACET_FIELDS:
+            values = field_values(project, field)
+            if field == "tags":
+                values = {v.strip().lower() for v in values if v.strip()}
+            for value in values:
+                self.facets[field].setdefault(value, []).append(position)
+
+        name = shard_name(project)
+        if name in self.shards:
+            print("Duplicate slug, detail shard overwritten:", name)
+        self.shards.add(name)
+        self.write_shard(self.shard_dir / name, compact(project) + "\n")
+        self.count += 1
+
+    def write_shard(self, path: Path, text: str) -> None:
+        data = text.encode("utf-8")
+        try:
+            if path.read_bytes() == data:
+                return
+        except FileNotFoundError:
+            pass
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        self.shards_written += 1
+
+    def tee(self, projects: Iterable[dict]) -> Iterator[dict]:
+        for project in projects:
+            self.add(project)
+            yield project
+
+    def close(self) -> dict:
+        self.listing.write("]\n" if self.count else "[]\n")
+        self.listing.close()
+        os.replace(self.listing_tmp, self.listing_path)
+
+        index = {
+            "version": INDEX_VERSION,
+            "count": self.count,
+            "fields": list(INDEXED_FIELDS),
+            "terms": dict(sorted(self.terms.items())),
+            "facets": {field: dict(sorted(values.items())) for field, values in self.facets.items()},
+            "facetCounts": {
+                field: {value: len(ids) for value, ids in sorted(values.items())} for field, values in self.facets.items()
+            },
+        }
+        index_path = self.out_dir / "search-index.json"
+        tmp = index_path.with_suffix(".json.tmp")
+        tmp.write_text(compact(index) + "\n", encoding="utf-8")
+        os.replace(tmp, index_path)
+
+        removed = 0
+        for shard in self.shard_dir.glob("*.json"):
+            if shard.name not in self.shards:
+                shard.unlink()
+                removed += 1
+        metrics.records_written("directory/listing.json", self.count)
+        metrics.records_written("directory/projects/*.json", self.shards_written)
+        return {
+            "projects": self.count,
+            "terms": len(self.terms),
+            "shards_written": self.shards_written,
+            "shards_removed": removed,
+        }
+
+
+def write_directory(projects: Iterable[dict], out_dir: Path = DIRECTORY_DIR) -> dict:
+    writer = DirectoryWriter(out_dir)
+    for project in projects:
+        writer.add(project)
+    return writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", type=Path, default=PROJECTS_JSON, help="Final project list (default: %(default)s)")
+    parser.add_argument("--out-dir", type=Path, default=DIRECTORY_DIR, help="Output folder (default: %(default)s)")
+    metrics.add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with metrics.stage("directory"):
+        counts = write_directory(iter_records(args.input), args.out_dir)
+    print("Directory payloads in", args.out_dir, counts)
+    metrics.write_reports("directory_index", args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Persistent journal of founder profiles whose fetch or parse failed, with a retry schedule.
+
+fetch_devfolio_profile_json.py records every failure here instead of only printing it, and
+clears the entry when the profile is fetched again. Each entry keeps the last reason, how often
+it failed in a row and when it is due again; the delay doubles with every attempt
+(BACKOFF_BASE, 2x, 4x, ... up to BACKOFF_MAX) and after MAX_ATTEMPTS the profile is only
+retried by a full crawl. A permanent failure (a 4xx other than 408/429, e.g. a 404 for a
+profile that does not exist) is never retried on a schedule either: only a full crawl tries it
+again.
+
+profile_failures.json:
+  {"<username>":{"reason":"fetch error: 503 ...","attempts":2,
+                 "first_failed":"2026-01-01T10:00:00","last_failed":"2026-01-01T10:01:00",
+                 "next_retry":"2026-01-01T10:02:00","permanent":false}}
+
+Usage:
+  python failure_journal.py          # list entries and when they are due
+"""
+import argparse
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+
+from records import write_json_atomic
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+JOURNAL_FILE = SCRIPT_DIR / "profile_failures.json"
+BACKOFF_BASE = 30.0
+BACKOFF_MAX = 6 * 3600.0
+MAX_ATTEMPTS = 8
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+# Client errors that can go away on their own; any other 4xx will not change on a retry
+TRANSIENT_CLIENT_STATUSES = {408, 429}
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Wait before retry number `attempts` (1 = first retry)."""
+    return min(BACKOFF_MAX, BACKOFF_BASE * 2 ** max(0, attempts - 1))
+
+
+def is_permanent(error: Exception | None) -> bool:
+    """True for an HTTP 4xx response other than TRANSIENT_CLIENT_STATUSES."""
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    return isinstance(status, int) and 400 <= status < 500 and status not in TRANSIENT_CLIENT_STATUSES
+
+
+def timestamp(seconds: float) -> str:
+    return time.strftime(TIME_FORMAT, time.localtime(seconds))
+
+
+def parse_timestamp(value: str) -> float:
+    return datetime.strptime(value, TIME_FORMAT).timestamp()
+
+
+class FailureJournal:
+    def __init__(self, path: Path = JOURNAL_FILE):
+        self.path = Path(path)
+        self.entries: dict[str, dict] = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                self.entries = json.load(f) or {}
+
+    def save(self) -> None:
+        if self.entries or self.path.exists():
+            write_json_atomic(self.path, dict(sorted(self.entries.items())))
+
+    def record(self, username: str, reason: str, now: float | None = None, permanent: bool = False) -> dict:
+        """Count one more failure for username and schedule its next retry (none when permanent)."""
+        now = time.time() if now is None else now
+        entry = self.entries.get(username) or {"first_failed": timestamp(now), "attempts": 0}
+        entry["reason"] = reason
+        entry["attempts"] += 1
+        entry["last_failed"] = timestamp(now)
+        entry["next_retry"] = timestamp(now + backoff_seconds(entry["attempts"]))
+        entry["permanent"] = permanent
+        self.entries[username] = {
+            k: entry[k] for k in ("reason", "attempts", "first_failed", "last_failed", "next_retry", "permanent")
+        }
+        self.save()
+        return self.entries[username]
+
+    def resolve(self, username: str) -> bool:
+        """Drop username after a successful fetch; True when it had failed before."""
+        if self.entries.pop(username, None) is None:
+            return False
+        self.save()
+        return True
+
+    def retryable(self) -> list[str]:
+        return sorted(u for u, e in self.entries.items() if e["attempts"] < MAX_ATTEMPTS and not e.get("permanent"))
+
+    def due(self, now: float | None = None) -> list[str]:
+        """Retryable usernames whose next retry time has come."""
+        now = time.time() if now is None else now
+        return [u for u in self.retryable() if parse_timestamp(self.entries[u]["next_retry"]) <= now]
+
+    def seconds_until_next(self, now: float | None = None) -> float | None:
+        """Time until the earliest retryable entry is due (0 if one is due), None when there is none."""
+        now = time.time() if now is None else now
+        times = [parse_timestamp(self.entries[u]["next_retry"]) for u in self.retryable()]
+        return max(0.0, min(times) - now) if times else None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--journal", type=Path, default=JOURNAL_FILE, help="Journal file (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    journal = FailureJournal(args.journal)
+    if not journal.entries:
+        print("No failed profiles.")
+        return
+    due = set(journal.due())
+    for username, entry in sorted(journal.entries.items()):
+        if entry.get("permanent"):
+            when = "permanent"
+        elif username in due:
+            when = "due now"
+        else:
+            when = "gave up" if entry["attempts"] >= MAX_ATTEMPTS else f"next {entry['next_retry']}"
+        print(f"{username:<24} {entry['attempts']:>2}x  {when:<26} {entry['reason']}")
+    print(len(journal), "failed,", len(due), "due; retry with: python fetch_devfolio_profile_json.py --retry-failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+"""
+Local stand-in for api.devfolio.co and devfolio.co, for benchmarks and offline runs.
+
+Serves the two endpoints the scraper uses:
+  POST /api/search/projects   search paging contract of scrape.py: hackathon_slugs, prize_tracks,
+                              from/size (from + size capped at the 1000-hit search window),
+                              hits.total as {"value": n}
+  GET  /@{username}           profile page with a __NEXT_DATA__ payload shaped like the real one
+  GET  /assets/{name}.png     small solid-colour PNG (16 colours, so different names can share bytes)
+
+Projects are generated deterministically from (hackathon, index), so any page can be served
+without holding the dataset in memory; --scale multiplies today's project counts. Latency,
+500 errors and 429s (with Retry-After) can be injected. To model a server that tolerates a
+certain load, --capacity answers requests beyond that many per second (token bucket, one
+second of burst) with 429 + Retry-After, and --max-in-flight answers requests beyond that
+many concurrent ones with 503.
+
+Usage:
+  python fake_devfolio.py --port 8765 --scale 10 --latency 0.05 --error-rate 0.01 --throttle-rate 0.02
+  python fake_devfolio.py --latency 0.05 --capacity 20 --max-in-flight 8
+  python scrape.py ...  # with scrape.URL pointed at http://127.0.0.1:8765/api/search/projects
+  python fetch_devfolio_profile_json.py --base-url http://127.0.0.1:8765 --no-cache
+"""
+import argparse
+import json
+import math
+import random
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+SEARCH_PATH = "/api/search/projects"
+# Search window of the real API: from + size may not go past this
+MAX_WINDOW = 1000
+# Projects per hackathon in today's all_projects.json (385 in total)
+HACKATHON_SIZES = {
+    "base-batch-india": 150,
+    "build-onchain-fbi": 90,
+    "onchain-ai-blr": 70,
+    "based-india": 75,
+}
+# Prize tracks are sized so every track query fits in the search window
+TRACK_SIZE = 500
+
+TAGS = [
+    "Solidity", "Next.js", "TypeScript", "React", "BASE", "Node.js", "Python", "Rust", "Hardhat",
+    "Foundry", "ethers.js", "wagmi", "viem", "Tailwind CSS", "Smart wallet", "OnchainKit", "USDC",
+    "Farcaster", "OpenAI", "LangChain", "Supabase", "DeFi", "AI", "NFT", "Payments", "DAO", "zk",
+]
+SECTION_TITLES = ["The problem it solves", "Challenges I ran into", "Technologies I used", "How it works"]
+LINK_POOL = [
+    "https://github.com/{slug}/{slug}-app",
+    "https://{slug}.vercel.app",
+    "https://warpcast.com/{slug}",
+    "https://youtu.be/{slug}",
+    "https://basescan.org/address/0x{slug}",
+    "https://docs.google.com/{slug}",
+    "https://{slug}.xyz/demo",
+]
+
+
+def hackathon_sizes(scale: float) -> dict:
+    return {slug: max(1, round(n * scale)) for slug, n in HACKATHON_SIZES.items()}
+
+
+def track_names(total: int) -> list:
+    return [f"Track {k}" for k in range(max(3, math.ceil(total / TRACK_SIZE)))]
+
+
+def fake_project(i: int, hackathon: str, rng: random.Random, track: str | None = None) -> dict:
+    """One search hit _source shaped like Devfolio's: multi-section description, hashtags,
+    members and comma-separated links."""
+    slug = f"{hackathon[:6]}-project-{i:06d}"
+    sections = []
+    for title in rng.sample(SECTION_TITLES, rng.randint(1, len(SECTION_TITLES))):
+        paragraphs = [
+            f"### {title}\n\n" + " ".join(rng.choice(TAGS) for _ in range(rng.randint(20, 80)))
+            for _ in range(rng.randint(1, 3))
+        ]
+        sections.append({"title": title, "content": "\n\n".join(paragraphs)})
+    if rng.random() < 0.3:
+        sections.append({"title": "Prizes", "content": "First Place Winners will receive 5,000 USDC"})
+    members = 1 + (rng.random() < 0.38)
+    return {
+        "uuid": f"{zlib.crc32(hackathon.encode('utf-8')):08x}{i:024x}",
+        "name": f"Project {i}",
+        "slug": slug,
+        "tagline": rng.choice(["", f"{slug} brings payments onchain"]),
+        "hackathon": {"subdomain": hackathon, "name": hackathon.replace("-", " ").title()},
+        "description": sections,
+        "hashtags": [{"name": t} for t in rng.sample(TAGS, rng.randint(0, 10))],
+        "prize_tracks": [{"name": track}] if track else [],
+        "members": [
+            {"first_name": f"Builder{m}", "last_name": "Onchain", "username": f"{slug.replace('-', '')}m{m}"}
+            for m in range(members)
+        ],
+        "links": ", ".join(link.format(slug=slug) for link in rng.sample(LINK_POOL, rng.randint(0, len(LINK_POOL)))),
+        "favicon": f"https://assets.devfolio.co/{slug}.png",
+    }
+
+
+def fake_png(name: str, size: int = 64) -> bytes:
+    """A size x size solid-colour PNG; the colour is one of 16, picked from the name."""
+    colour = zlib.crc32(name.encode("utf-8")) % 16
+    rgb = bytes([colour * 16, 255 - colour * 16, (colour * 97) % 256])
+    raw = b"".join(b"\x00" + rgb * size for _ in range(size))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b"")
+
+
+def fake_profile_html(username: str, filler_items: int = 0) -> str:
+    """Profile page with a realistic __NEXT_DATA__; filler_items adds that many unrelated
+    records (the bulk of a real page's payload) after the profile queries."""
+    next_data = {
+        "props": {
+            "pageProps": {
+                "dehydratedState": {
+                    "queries": [
+                        {
+                            "state": {
+                                "data": {
+                                    "users": [
+                                        {
+                                            "first_name": username.title(),
+                                            "last_name": "Builder",
+                                            "short_bio": f"{username} builds onchain apps on Base",
+                                            "bio": f"{username} has been hacking on Base since 2024.",
+                                            "profile_image": f"https://assets.example/{username}.png",
+                                        }
+                                    ],
+                                    "profiles": [
+                                        {"type": "github", "url": f"https://github.com/{username}"},
+                                        {"type": "twitter", "url": f"https://x.com/{username}_onchain"},
+                                    ],
+                                    "address": {"city": "Bangalore", "country": "India"},
+                                    "userDevfolioStats": {"hackathons_attended": 3, "projects_built": 2},
+                                }
+                            }
+                        }
+                    ]
+                }
+            }
+        }
+    }
+    if filler_items:
+        next_data["props"]["pageProps"]["hackathons"] = [
+            {
+                "uuid": f"{i:032x}",
+                "name": f"Hackathon {i}",
+                "tagline": "Build something onchain " * 4,
+                "settings": {"tracks": [{"name": f"Track {t}", "prizes": [{"amount": 1000 * t}]} for t in range(5)]},
+            }
+            for i in range(filler_items)
+        ]
+    return (
+        "<html><head></head><body><div id=\"__next\"></div>"
+        f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(next_data)}</script>'
+        "</body></html>"
+    )
+
+
+class FakeDevfolio:
+    """Threaded HTTP server with request counters; start() returns its base URL."""
+
+    def __init__(
+        self,
+        scale: float = 1.0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        filler_items: int = 0,
+        seed: int = 0,
+        capacity: float = 0.0,
+        max_in_flight: int = 0,
+    ):
+        self.sizes = hackathon_sizes(scale)
+        self.tracks = {slug: track_names(n) for slug, n in self.sizes.items()}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.filler_items = filler_items
+        self.capacity = capacity
+        self.max_in_flight = max_in_flight
+        self._tokens = capacity
+        self._refilled = time.monotonic()
+        self._in_flight = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self.reset_stats()
+
+    @property
+    def project_count(self) -> int:
+        return sum(self.sizes.values())
+
+    def reset_stats(self) -> dict:
+        """Return the counters so far and start new ones: {"requests", "bytes", "status": {code: n}}."""
+        with self._lock:
+            previous = getattr(self, "stats", None)
+            self.stats = {"requests": 0, "bytes": 0, "status": {}}
+        return previous
+
+    def _count(self, status: int, nbytes: int) -> None:
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["bytes"] += nbytes
+            self.stats["status"][status] = self.stats["status"].get(status, 0) + 1
+
+    @contextmanager
+    def in_flight(self):
+        with self._lock:
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _overloaded(self) -> int | None:
+        """429 past --capacity requests/s, 503 past --max-in-flight concurrent requests."""
+        with self._lock:
+            if self.max_in_flight and self._in_flight > self.max_in_flight:
+                return 503
+            if self.capacity:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._refilled) * self.capacity)
+                self._refilled = now
+                if self._tokens < 1:
+                    return 429
+                self._tokens -= 1
+        return None
+
+    def _injected_failure(self) -> int | None:
+        overloaded = self._overloaded()
+        if overloaded:
+            return overloaded
+        with self._lock:
+            roll = self._rng.random()
+        if roll < self.error_rate:
+            return 500
+        if roll < self.error_rate + self.throttle_rate:
+            return 429
+        return None
+
+    def search(self, payload: dict) -> tuple[int, dict]:
+        offset, size = int(payload.get("from") or 0), int(payload.get("size") or 10)
+        if offset + size > MAX_WINDOW:
+            return 400, {"error": f"Result window is too large, from + size must be <= {MAX_WINDOW}"}
+        wanted_tracks = set(payload.get("prize_tracks") or [])
+        matches = []
+        for slug in payload.get("hackathon_slugs") or []:
+            n = self.sizes.get(slug, 0)
+            tracks = self.tracks.get(slug, [])
+            # Project i belongs to track i % len(tracks)
+            if wanted_tracks:
+                indices = sorted(i for k, t in enumerate(tracks) if t in wanted_tracks for i in range(k, n, len(tracks)))
+            else:
+                indices = range(n)
+            matches.append((slug, tracks, indices))
+
+        hits, skip = [], offset
+        for slug, tracks, indices in matches:
+            if len(hits) >= size:
+                break
+            for i in indices[skip : skip + size - len(hits)]:
+                src = fake_project(i, slug, random.Random(f"{slug}:{i}"), tracks[i % len(tracks)])
+                hits.append({"_id": src["uuid"], "_source": src})
+            skip = max(0, skip - len(indices))
+        total = sum(len(indices) for _, _, indices in matches)
+        return 200, {"hits": {"total": {"value": total, "relation": "eq"}, "hits": hits}}
+
+    def start(self, port: int = 0) -> str:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def reply(self, status: int, body: bytes, content_type: str, headers: dict | None = None) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+                fake._count(status, len(body))
+
+            def fail(self, status: int) -> None:
+                headers = {"Retry-After": f"{fake.retry_after:g}"} if status in (429, 503) else None
+                self.reply(status, b'{"error": "injected"}', "application/json", headers)
+
+            def do_POST(self):
+                with fake.in_flight():
+                    self.serve_search()
+
+            def do_GET(self):
+                with fake.in_flight():
+                    self.serve_profile()
+
+            def serve_search(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if fake.latency:
+                    time.sleep(fake.latency)
+                if self.path.split("?")[0] != SEARCH_PATH:
+                    return self.reply(404, b"{}", "application/json")
+                failure = fake._injected_failure()
+                if failure:
+                    return self.fail(failure)
+                status, data = fake.search(json.loads(body or b"{}"))
+                self.reply(status, json.dumps(data).encode("utf-8"), "application/json")
+
+            def serve_profile(self):
+                if fake.latency:
+                    time.sleep(fake.latency)
+                path = unquote(self.path.split("?")[0])
+                if path.startswith("/assets/") and path.endswith(".png"):
+                    failure = fake._injected_failure()
+                    if failure:
+                        return self.fail(failure)
+                    return self.reply(200, fake_png(path[len("/assets/") : -4]), "image/png")
+                if not path.startswith("/@"):
+                    return self.reply(404, b"not found", "text/plain")
+                failure = fake._injected_failure()
+                if failure:
+                    return self.fail(failure)
+                html = fake_profile_html(path[2:], fake.filler_items)
+                self.reply(200, html.encode("utf-8"), "text/html; charset=utf-8")
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.base_url
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    @property
+    def search_url(self) -> str:
+        return self.base_url + SEARCH_PATH
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiple of today's project count (default: 1)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--filler", type=int, default=0, help="Unrelated records per profile __NEXT_DATA__")
+    parser.add_argument("--capacity", type=float, default=0.0, help="Requests per second served before 429s (0: no limit)")
+    parser.add_argument("--max-in-flight", type=int, default=0, help="Concurrent requests served before 503s (0: no limit)")
+    args = parser.parse_args()
+
+    fake = FakeDevfolio(
+        args.scale,
+        args.latency,
+        args.error_rate,
+        args.throttle_rate,
+        args.retry_after,
+        args.filler,
+        capacity=args.capacity,
+        max_in_flight=args.max_in_flight,
+    )
+    fake.start(args.port)
+    print(f"Serving {fake.project_count} projects at {fake.base_url} (search: {fake.search_url})")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print(json.dumps(fake.stats))
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()
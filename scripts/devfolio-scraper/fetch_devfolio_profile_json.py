@@ -1,22 +1,52 @@
 """
 Fetch full Devfolio profile JSON from profile page (__NEXT_DATA__) and generate founder MDX.
 
-Reads: lib/projects-from-devfolio.json (for list of founder usernames)
+Reads: lib/projects-from-devfolio.json (for list of founder usernames), resolved to one Devfolio
+        username per person with identity.py before anything is fetched
 Fetches: https://devfolio.co/@{username} and parses script#__NEXT_DATA__
-Writes: content/founders/[username].mdx (frontmatter + editable body)
+Writes: content/founders/[username].mdx (frontmatter + editable body), merged into the existing
+        file by founder_mdx.py and only rewritten when its content changed
+        profile_links.json (Twitter handle + GitHub URL, same as fetch_devfolio_profiles.py)
+        from the same page fetch, so every profile is downloaded once per refresh.
+        content/founders-index.json (frontmatter of every MDX, see founders_index.py)
+        identity_graph.json (who is who, reused by merge_profile_links.py)
+        profile_failures.json (failed profiles and when to retry them, see failure_journal.py)
+        Run merge_profile_links.py afterwards.
 
 Usage:
   pip install requests
   python fetch_devfolio_profile_json.py                    # fetch all founders
   python fetch_devfolio_profile_json.py user1 user2 user3  # retry only these usernames
+  python fetch_devfolio_profile_json.py --retry-failed     # retry the journaled failures that are due
+  python fetch_devfolio_profile_json.py --concurrency 8 --rps 4   # asyncio crawl, 8 in flight, from 4 req/s
+  python fetch_devfolio_profile_json.py --no-adaptive      # fixed 1 s pause / fixed --rps instead of AIMD pacing
+  python fetch_devfolio_profile_json.py --cache-only       # rebuild MDX from cached pages, no network
+  python fetch_devfolio_profile_json.py --concurrency 32 --stream-parse   # parse pages as they download
+  python fetch_devfolio_profile_json.py --store            # founders from / links into devfolio.sqlite3
 """
+import argparse
+import asyncio
 import json
-import re
-import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import requests
+import failure_journal
+import founders_index
+import http_cache
+import http_client
+import identity
+import metrics
+from fetch_devfolio_profiles import extract_links
+from founder_mdx import generate_mdx, placeholder_mdx, write_founder_mdx, write_if_changed
+from next_data import (
+    extract_users_and_stats,
+    extract_users_and_stats_stream,
+    extract_users_and_stats_targeted,
+    next_data_json,
+    social_from_profiles,
+)
+from store import RecordStore, add_store_arguments
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 ROOT = SCRIPT_DIR.parent.parent
@@ -24,96 +54,13 @@ PROJECTS_JSON = ROOT / "lib" / "projects-from-devfolio.json"
 PROFILE_LINKS = SCRIPT_DIR / "profile_links.json"
 CONTENT_FOUNDERS = ROOT / "content" / "founders"
 BASE_URL = "https://devfolio.co"
-USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/115.0"
-
-
-def find_in_obj(obj, path: list):
-    """Recursively find first object that has all keys in path (depth-first)."""
-    if not path:
-        return obj
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if k == path[0]:
-                found = find_in_obj(v, path[1:])
-                if found is not None:
-                    return found
-            found = find_in_obj(v, path)
-            if found is not None:
-                return found
-    elif isinstance(obj, list):
-        for item in obj:
-            found = find_in_obj(item, path)
-            if found is not None:
-                return found
-    return None
-
-
-def extract_users_and_stats(next_data: dict):
-    """Extract users[0], profiles (social), address, userDevfolioStats from Next.js payload.
-    Devfolio structure: queries[].state.data with users, profiles, userDevfolioStats."""
-    user = None
-    profiles_list = []
-    address_data = None
-    stats_data = None
-
-    def walk(o, depth=0):
-        nonlocal user, profiles_list, address_data, stats_data
-        if depth > 30:
-            return
-        if isinstance(o, dict):
-            if "users" in o and isinstance(o["users"], list) and o["users"] and user is None:
-                user = o["users"][0]
-            if "userDevfolioStats" in o and stats_data is None:
-                stats_data = o["userDevfolioStats"]
-            if "profiles" in o and isinstance(o["profiles"], list) and o["profiles"]:
-                profiles_list = o["profiles"]
-            if "address" in o and isinstance(o["address"], dict) and address_data is None:
-                address_data = o["address"]
-            for v in o.values():
-                walk(v, depth + 1)
-        elif isinstance(o, list):
-            for i in o:
-                walk(i, depth + 1)
-
-    # Prefer dehydratedState.queries[].state.data (Next.js React Query)
-    props = next_data.get("props", {}) or {}
-    page_props = props.get("pageProps", {}) or {}
-    dehydrated = page_props.get("dehydratedState") or page_props.get("dehydratedState") or {}
-    queries = (dehydrated.get("queries") or []) if isinstance(dehydrated, dict) else []
-    for q in queries:
-        if not isinstance(q, dict):
-            continue
-        state = q.get("state") or {}
-        data = state.get("data") if isinstance(state, dict) else None
-        if data and isinstance(data, dict):
-            if "users" in data and isinstance(data["users"], list) and data["users"] and user is None:
-                user = data["users"][0]
-            if "profiles" in data and isinstance(data["profiles"], list):
-                profiles_list = data["profiles"]
-            if "address" in data and isinstance(data["address"], dict):
-                address_data = data["address"]
-            if "userDevfolioStats" in data and stats_data is None:
-                stats_data = data["userDevfolioStats"]
-
-    walk(next_data)
-    return user, profiles_list, address_data, stats_data
-
-
-def social_from_profiles(profiles: list) -> dict:
-    out = {}
-    for p in profiles or []:
-        if not isinstance(p, dict):
-            continue
-        # Support both url/link and value/name (readme-md.json API shape)
-        url = (p.get("url") or p.get("link") or p.get("value") or "").strip()
-        kind = (p.get("type") or p.get("platform") or p.get("name") or "").lower()
-        if "github" in kind or "github.com" in url:
-            out["github"] = url or None
-        if "twitter" in kind or "x.com" in url or "twitter.com" in url:
-            out["twitter"] = url or None
-        if "linkedin" in kind:
-            out["linkedin"] = url or None
-    return out
+SERIAL_DELAY = 1.0
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RPS = 4.0
+# Bytes read per step by --stream-parse
+STREAM_CHUNK = 16 * 1024
+# Seconds a crawl keeps retrying its failures once the main pass is done
+DEFAULT_RETRY_WINDOW = 120.0
 
 
 def build_founder_schema(user: dict, profiles: list, address: dict, stats: dict, username: str) -> dict:
@@ -177,142 +124,446 @@ def build_founder_schema(user: dict, profiles: list, address: dict, stats: dict,
     }
 
 
-def mdx_escape(s: str) -> str:
-    if not s:
-        return ""
-    return s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+def profile_mdx_from_parts(username: str, parts: tuple | None) -> tuple[str, str | None, list | None]:
+    """(mdx, error, social profiles) from the four __NEXT_DATA__ values (None: page had no payload)."""
+    if parts is None:
+        return placeholder_mdx(username), "no __NEXT_DATA__", None
+    user, profiles, address, stats = parts
+    full_bio = (user.get("bio") or user.get("full_bio") or user.get("long_bio") or "") if user else ""
+    schema = build_founder_schema(user or {}, profiles, address or {}, stats or {}, username)
+    return generate_mdx(schema, full_bio), None, profiles
+
+
+def profile_mdx_from_html(username: str, html: str, targeted: bool = False) -> tuple[str, str | None, list | None]:
+    """Parse a profile page and return (mdx, error, social profiles from __NEXT_DATA__).
+    On error the mdx is a placeholder and profiles is None. With targeted=True only the four
+    subtrees we use are decoded from the payload text instead of parsing all of it."""
+    payload = next_data_json(html)
+    if payload is None:
+        return profile_mdx_from_parts(username, None)
+    if targeted:
+        return profile_mdx_from_parts(username, extract_users_and_stats_targeted(payload))
+    try:
+        next_data = json.loads(payload)
+    except json.JSONDecodeError as e:
+        return placeholder_mdx(username), f"json error: {e}", None
+    return profile_mdx_from_parts(username, extract_users_and_stats(next_data))
+
+
+def fetch_profile_html(username: str, base_url: str = BASE_URL, cache: http_cache.ResponseCache | None = None) -> str:
+    url = f"{base_url}/@{username}"
+    if cache is not None:
+        return cache.get_text(url)
+    r = http_client.get(url)
+    r.raise_for_status()
+    return r.text
+
+
+def fetch_profile_streamed(username: str, base_url: str = BASE_URL) -> tuple | None:
+    """The four __NEXT_DATA__ values of a profile page, decoded while the body streams in;
+    None when the page has no payload. Only a chunk of the page is in memory at a time."""
+    r = http_client.get(f"{base_url}/@{username}", stream=True)
+    try:
+        r.raise_for_status()
+        if r.encoding is None:
+            r.encoding = "utf-8"
+        chunks = r.iter_content(STREAM_CHUNK, decode_unicode=True)
+        parts = extract_users_and_stats_stream(chunks)
+        # Read the rest of the page (the end of <body>) so the connection can be reused
+        for _ in chunks:
+            pass
+        return parts
+    finally:
+        r.close()
+
+
+def fetch_page(username: str, base_url: str, cache: http_cache.ResponseCache | None, parse: str):
+    """Page HTML, or with parse="stream" the already decoded values (see fetch_profile_streamed)."""
+    if parse == "stream":
+        return fetch_profile_streamed(username, base_url)
+    return fetch_profile_html(username, base_url, cache)
+
+
+def write_profile(
+    username: str,
+    page,
+    fetch_error: Exception | None,
+    out_dir: Path,
+    parse: str = "full",
+    journal: failure_journal.FailureJournal | None = None,
+) -> tuple[str, dict | None]:
+    """Write one founder MDX from a single parse of the page (the fetch_page result).
+    Returns a short status line for the progress log and the page's social links
+    (None when the page could not be fetched).
+    A failed fetch or parse is recorded in journal and only writes the placeholder MDX when the
+    founder has no MDX yet: a profile fetched earlier is never replaced by a placeholder."""
+    if isinstance(fetch_error, http_cache.CacheMiss):
+        # Cache-only run: keep whatever MDX already exists
+        return "not cached, skipped", None
+    links = None
+    if fetch_error is not None:
+        mdx, error = placeholder_mdx(username), f"fetch error: {fetch_error}"
+    elif parse == "stream":
+        mdx, error, profiles = profile_mdx_from_parts(username, page)
+        # No page text to fall back on: links come from the structured profiles only
+        links = extract_links("", profiles or [])
+    else:
+        mdx, error, profiles = profile_mdx_from_html(username, page or "", parse == "targeted")
+        # Reuse the profiles already parsed for the MDX; the HTML is only scanned if they lack links
+        links = extract_links(page or "", profiles)
+    out_path = out_dir / f"{username}.mdx"
+    if error is not None:
+        metrics.inc("profile_failures_total", kind="fetch" if fetch_error is not None else "parse")
+        if journal is not None:
+            entry = journal.record(username, error, permanent=failure_journal.is_permanent(fetch_error))
+            if entry["permanent"]:
+                error += " (permanent, not retried until the next full crawl)"
+            else:
+                error += f" (attempt {entry['attempts']}, retry after {entry['next_retry']})"
+        if out_path.exists():
+            return error + ", kept existing MDX", links
+        write_if_changed(out_path, mdx)
+        metrics.records_written("founders/*.mdx")
+        return error, links
+    if journal is not None:
+        journal.resolve(username)
+    # Merged into the existing file (edited body, edit_id, ...) and only written when it changed
+    if not write_founder_mdx(out_path, mdx):
+        return f"ok, {out_path.name} unchanged", links
+    metrics.records_written("founders/*.mdx")
+    return f"ok -> {out_path.name}", links
+
+
+def crawl_serial(
+    usernames: list[str],
+    out_dir: Path,
+    base_url: str = BASE_URL,
+    delay: float = SERIAL_DELAY,
+    cache: http_cache.ResponseCache | None = None,
+    parse: str = "full",
+    journal: failure_journal.FailureJournal | None = None,
+) -> dict:
+    """Original crawl: one request at a time with a fixed sleep between profiles.
+    Returns {username: links} for every page that was fetched."""
+    all_links = {}
+    for i, username in enumerate(usernames):
+        print(i + 1, "/", len(usernames), username, end=" ... ")
+        page, fetch_error = None, None
+        fresh_before = cache.stats["fresh"] if cache is not None else 0
+        try:
+            page = fetch_page(username, base_url, cache, parse)
+        except Exception as e:
+            fetch_error = e
+        status, links = write_profile(username, page, fetch_error, out_dir, parse, journal)
+        print(status)
+        if links is not None:
+            all_links[username] = links
+        # No pause when the page came straight from the cache (or cache-only mode)
+        if cache is None or not (cache.cache_only or cache.stats["fresh"] > fresh_before):
+            time.sleep(delay)
+    return all_links
+
+
+class RateLimiter:
+    """Global requests-per-second budget shared by all crawl workers (evenly spaced slots)."""
+
+    def __init__(self, rps: float):
+        self.interval = 1.0 / rps if rps > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def crawl_async(
+    usernames: list[str],
+    out_dir: Path,
+    base_url: str = BASE_URL,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rps: float = DEFAULT_RPS,
+    cache: http_cache.ResponseCache | None = None,
+    parse: str = "full",
+    journal: failure_journal.FailureJournal | None = None,
+) -> dict:
+    """Crawl with at most `concurrency` requests in flight and at most `rps` request starts per second.
+    Blocking requests calls run in worker threads; MDX output is identical to crawl_serial."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = RateLimiter(rps)
+    # Own pool: the loop's default executor has min(32, cpu_count + 4) threads, which would
+    # cap the requests in flight below `concurrency` on small machines
+    pool = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="profile")
+    loop = asyncio.get_running_loop()
+    done = 0
+    all_links = {}
+
+    async def one(username: str) -> None:
+        nonlocal done
+        async with semaphore:
+            await limiter.wait()
+            page, fetch_error = None, None
+            try:
+                page = await loop.run_in_executor(pool, fetch_page, username, base_url, cache, parse)
+            except Exception as e:
+                fetch_error = e
+        status, links = write_profile(username, page, fetch_error, out_dir, parse, journal)
+        if links is not None:
+            all_links[username] = links
+        done += 1
+        print(done, "/", len(usernames), username, "...", status)
+
+    try:
+        await asyncio.gather(*(one(u) for u in usernames))
+    finally:
+        pool.shutdown(wait=False)
+    return all_links
+
+
+def crawl(usernames: set, args, cache: http_cache.ResponseCache | None, journal: failure_journal.FailureJournal) -> dict:
+    """One pass over usernames with the crawler the arguments select."""
+    if args.concurrency > 1:
+        return asyncio.run(
+            crawl_async(
+                sorted(usernames),
+                CONTENT_FOUNDERS,
+                base_url=args.base_url,
+                concurrency=args.concurrency,
+                rps=0 if args.adaptive else args.rps,
+                cache=cache,
+                parse=args.parse,
+                journal=journal,
+            )
+        )
+    return crawl_serial(
+        sorted(usernames),
+        CONTENT_FOUNDERS,
+        base_url=args.base_url,
+        delay=0 if args.adaptive else SERIAL_DELAY,
+        cache=cache,
+        parse=args.parse,
+        journal=journal,
+    )
 
 
-def generate_mdx(schema: dict, full_bio: str) -> str:
-    """Generate MDX content with frontmatter and editable body."""
-    lines = ["---"]
-    for k, v in schema.items():
-        if v is None:
+def drain_failures(
+    usernames: set, args, cache: http_cache.ResponseCache | None, journal: failure_journal.FailureJournal, window: float
+) -> dict:
+    """Retry the journaled failures among usernames as they come due (exponential backoff),
+    for at most `window` seconds. Returns the links of the profiles that were fetched."""
+    deadline = time.monotonic() + window
+    links = {}
+    while True:
+        due = set(journal.due()) & usernames
+        if due:
+            print("Retrying", len(due), "failed profile(s)...")
+            links.update(crawl(due, args, cache, journal))
             continue
-        if k == "tags" and v:
-            lines.append("tags:")
-            for t in v:
-                lines.append(f'  - "{mdx_escape(str(t))}"')
-        elif isinstance(v, str):
-            lines.append(f'{k}: "{mdx_escape(v)}"')
-        elif isinstance(v, (int, float)):
-            lines.append(f"{k}: {v}")
-    lines.append("---")
-    lines.append("")
-    lines.append("## About")
-    lines.append("")
-    lines.append(full_bio[:2000] if full_bio else "*Edit this section in the MDX file.*")
-    lines.append("")
-    lines.append("## What I'm Building")
-    lines.append("")
-    lines.append("*Add your focus areas and current projects here.*")
-    lines.append("")
-    lines.append("## Interests")
-    lines.append("")
-    lines.append("- Web3")
-    lines.append("- Base")
-    lines.append("- India ecosystem")
-    return "\n".join(lines)
-
-
-def main():
-    # Retry mode: only usernames passed as arguments
-    only_usernames = [a.strip() for a in sys.argv[1:] if a.strip()]
-
-    if only_usernames:
-        usernames = set(only_usernames)
-        print("Retry mode: fetching", len(usernames), "profile(s)...")
+        wait = journal.seconds_until_next()
+        if wait is None or not set(journal.retryable()) & usernames or time.monotonic() + wait > deadline:
+            break
+        print(f"Next retry in {wait:.0f}s")
+        time.sleep(wait)
+    return links
+
+
+def write_profile_links(links: dict, usernames: set, replace: bool) -> None:
+    """Save the links found in this crawl to profile_links.json for merge_profile_links.py.
+    Users whose page could not be fetched keep their previous entry. A full crawl (replace=True)
+    drops users that are no longer crawled; a retry run only updates the users it fetched."""
+    previous = {}
+    if PROFILE_LINKS.exists():
+        with open(PROFILE_LINKS, encoding="utf-8") as f:
+            previous = json.load(f) or {}
+    if replace:
+        out = {u: links.get(u, previous.get(u, {})) for u in sorted(usernames)}
     else:
-        if not PROJECTS_JSON.exists():
-            print("Run transform_to_data.py first.")
-            return
+        out = {**previous, **links}
+    with open(PROFILE_LINKS, "w", encoding="utf-8") as f:
+        json.dump(out, f, indent=2)
+    metrics.records_written(PROFILE_LINKS.name, len(out))
+    print("Wrote", PROFILE_LINKS, f"({len(links)} profiles updated)")
+
+
+def resolve_founders(projects=None, links: dict | None = None, identity_file: Path | None = None) -> tuple:
+    """(identities, usernames): the identity graph over projects (default: PROJECTS_JSON), links
+    (default: PROFILE_LINKS) and the founder index, and the canonical Devfolio username of every
+    founder (primary + co-founders), one per person. The graph is saved to identity_file if given."""
+    if projects is None:
         with open(PROJECTS_JSON, encoding="utf-8") as f:
             projects = json.load(f)
-        raw = set()
-        for p in projects:
-            u = (p.get("founderTwitter") or "").strip()
-            if u and u != "devfolio":
-                raw.add(u)
-            for f in p.get("founders") or []:
-                t = (f.get("twitter") or "").strip()
-                if t and t != "devfolio":
-                    raw.add(t)
-        # One profile per person: normalize Twitter handles to Devfolio username when we have profile_links
-        twitter_to_devfolio = {}
+    if links is None:
+        links = {}
         if PROFILE_LINKS.exists():
             with open(PROFILE_LINKS, encoding="utf-8") as f:
                 links = json.load(f)
-            for devfolio_user, data in (links or {}).items():
-                tw = (data.get("twitter") or "").strip()
-                if tw:
-                    twitter_to_devfolio[tw.lower()] = devfolio_user
-        usernames = set()
-        for u in raw:
-            canonical = twitter_to_devfolio.get(u.lower(), u)
-            usernames.add(canonical)
-        print("Fetching", len(usernames), "profiles and writing MDX...")
+    founders = founders_index.load_index(CONTENT_FOUNDERS.parent / founders_index.INDEX_FILE.name)
+    return identity.resolve(projects, links, founders, identity_file)
 
-    CONTENT_FOUNDERS.mkdir(parents=True, exist_ok=True)
 
-    for i, username in enumerate(sorted(usernames)):
-        print(i + 1, "/", len(usernames), username, end=" ... ")
-        try:
-            r = requests.get(f"{BASE_URL}/@{username}", headers={"User-Agent": USER_AGENT}, timeout=15)
-            r.raise_for_status()
-            html = r.text
-        except Exception as e:
-            print("fetch error:", e)
-            # Write placeholder MDX so page exists
-            schema = {"username": username, "name": username.replace("_", " ").title()}
-            mdx = generate_mdx(schema, "")
-            (CONTENT_FOUNDERS / f"{username}.mdx").write_text(mdx, encoding="utf-8")
-            time.sleep(0.8)
-            continue
+def founder_usernames(projects=None, links: dict | None = None) -> set:
+    """Canonical Devfolio usernames of every founder in projects; see resolve_founders."""
+    return resolve_founders(projects, links)[1]
 
-        match = re.search(r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>', html, re.DOTALL)
-        if not match:
-            print("no __NEXT_DATA__")
-            schema = {"username": username, "name": username.replace("_", " ").title()}
-            mdx = generate_mdx(schema, "")
-            (CONTENT_FOUNDERS / f"{username}.mdx").write_text(mdx, encoding="utf-8")
-            time.sleep(0.8)
-            continue
 
-        try:
-            next_data = json.loads(match.group(1))
-        except json.JSONDecodeError as e:
-            print("json error:", e)
-            schema = {"username": username, "name": username.replace("_", " ").title()}
-            mdx = generate_mdx(schema, "")
-            (CONTENT_FOUNDERS / f"{username}.mdx").write_text(mdx, encoding="utf-8")
-            time.sleep(0.8)
-            continue
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch Devfolio profiles and write founder MDX.")
+    parser.add_argument("usernames", nargs="*", help="Retry only these usernames")
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Retry the failed profiles from the failure journal that are due (with any usernames given)",
+    )
+    parser.add_argument(
+        "--retry-window",
+        type=float,
+        default=DEFAULT_RETRY_WINDOW,
+        help="Seconds to keep retrying failures with backoff after the crawl; 0 only journals them (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        default=failure_journal.JOURNAL_FILE,
+        help="Failure journal file (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--identity",
+        type=Path,
+        default=identity.IDENTITY_FILE,
+        help="Identity graph file the crawl resolves founders with and saves (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Max profile requests in flight; 1 keeps the original serial crawl (default: 1)",
+    )
+    parser.add_argument(
+        "--rps",
+        type=float,
+        default=DEFAULT_RPS,
+        help=f"Request rate per second for concurrent crawls: where adaptive pacing starts, or the fixed budget with --no-adaptive (default: {DEFAULT_RPS})",
+    )
+    parser.add_argument(
+        "--base-url",
+        default=BASE_URL,
+        help="Profile site to crawl, e.g. a local fake_devfolio.py server (default: %(default)s)",
+    )
+    parse = parser.add_mutually_exclusive_group()
+    parse.add_argument(
+        "--targeted-parse",
+        dest="parse",
+        action="store_const",
+        const="targeted",
+        default="full",
+        help="Decode only users/profiles/address/userDevfolioStats from __NEXT_DATA__ instead of the whole payload",
+    )
+    parse.add_argument(
+        "--stream-parse",
+        dest="parse",
+        action="store_const",
+        const="stream",
+        help="Like --targeted-parse, but while the page downloads, keeping only those values in memory (no HTTP cache)",
+    )
+    http_client.add_rate_arguments(parser)
+    http_cache.add_cache_arguments(parser)
+    add_store_arguments(parser)
+    metrics.add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.parse == "stream" and args.cache_only:
+        parser.error("--stream-parse reads pages from the network; it cannot be combined with --cache-only")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # Retry mode: only usernames passed as arguments
+    only_usernames = [a.strip() for a in args.usernames if a.strip()]
+
+    identity_file = args.identity
+    journal = failure_journal.FailureJournal(args.journal)
+    retry_mode = bool(only_usernames) or args.retry_failed
+    if retry_mode:
+        # Twitter handles and case variants still go to the person's one profile
+        identities = identity.load_identities(identity_file) or identity.Identities()
+        usernames = {identities.canonical(u) for u in only_usernames}
+        if args.retry_failed:
+            usernames |= set(journal.due())
+            print(len(journal), "profile(s) in the failure journal,", len(journal.due()), "due")
+        print("Retry mode: fetching", len(usernames), "profile(s)...")
+    elif args.store:
+        with RecordStore(args.store) as store:
+            identities, usernames = resolve_founders(list(store.iter_projects()), store.profile_links(), identity_file)
+        print("Fetching", len(usernames), "profiles from the store and writing MDX...")
+    else:
+        if not PROJECTS_JSON.exists():
+            print("Run transform_to_data.py first.")
+            return
+        identities, usernames = resolve_founders(identity_file=identity_file)
+        print("Fetching", len(usernames), "profiles and writing MDX...")
 
-        user, profiles, address, stats = extract_users_and_stats(next_data)
-        full_bio = (user.get("bio") or user.get("full_bio") or user.get("long_bio") or "") if user else ""
-        schema = build_founder_schema(user or {}, profiles, address or {}, stats or {}, username)
-        mdx = generate_mdx(schema, full_bio)
-        out_path = CONTENT_FOUNDERS / f"{username}.mdx"
-        out_path.write_text(mdx, encoding="utf-8")
-        print("ok ->", out_path.name)
-        time.sleep(1.0)
-
-    # Remove duplicate founder MDX keyed by Twitter handle (we now use Devfolio username only)
-    if not only_usernames and PROFILE_LINKS.exists():
-        with open(PROFILE_LINKS, encoding="utf-8") as f:
-            links = json.load(f)
-        twitter_handles = { (data.get("twitter") or "").strip().lower() for data in (links or {}).values() if (data.get("twitter") or "").strip() }
-        removed = 0
-        for mdx_file in list(CONTENT_FOUNDERS.glob("*.mdx")):
-            stem = mdx_file.stem.lower()
-            if stem in twitter_handles:
-                mdx_file.unlink()
-                removed += 1
-                print("Removed duplicate profile (Twitter handle):", mdx_file.name)
-        if removed:
-            print("Removed", removed, "duplicate founder MDX file(s).")
+    CONTENT_FOUNDERS.mkdir(parents=True, exist_ok=True)
+
+    # The cache stores whole pages, which is what --stream-parse avoids holding
+    cache = None if args.parse == "stream" else http_cache.cache_from_args(args)
+    if args.adaptive:
+        # http_client paces the requests and follows the server; the fixed pauses are off
+        start_rps = args.rps if args.concurrency > 1 else 1.0 / SERIAL_DELAY
+        http_client.configure_rate(start_rps=start_rps if start_rps > 0 else args.max_rps, max_rps=args.max_rps)
+    with metrics.stage("crawl"):
+        links = crawl(usernames, args, cache, journal)
+    if not (cache is not None and cache.cache_only) and args.retry_window > 0:
+        with metrics.stage("retry"):
+            links.update(drain_failures(usernames, args, cache, journal, args.retry_window))
+    if not retry_mode:
+        # Founders that are gone need no more retries
+        for username in set(journal.entries) - usernames:
+            journal.resolve(username)
+    if journal.retryable():
+        print(len(journal.retryable()), "profile(s) still failing; see", journal.path.name, "or run with --retry-failed")
+    if args.adaptive:
+        print("Request rate:", http_client.rate_summary() or "no requests")
+    if cache is not None:
+        print(cache.summary())
+        cache.close()
+    with metrics.stage("write_links"):
+        if args.store:
+            with RecordStore(args.store) as store:
+                changed = store.upsert_profile_links(links, keep=None if retry_mode else usernames)
+                projects, links = list(store.iter_projects()), store.profile_links()
+            print("Store:", changed, "profile links changed")
+        else:
+            write_profile_links(links, usernames, replace=not retry_mode)
+            projects, links = None, None
+        # The crawl may have found new handles; merge_profile_links.py reads the updated graph
+        if args.store or PROJECTS_JSON.exists():
+            identities = resolve_founders(projects, links, identity_file)[0]
+
+    # Leftover MDX from before identities were resolved up front (a Twitter handle or a case
+    # variant crawled as if it were a username); nothing writes new ones
+    if not retry_mode:
+        mdx_files = {f.stem: f for f in CONTENT_FOUNDERS.glob("*.mdx")}
+        duplicates = identities.duplicate_profiles(sorted(mdx_files), usernames)
+        for stem in duplicates:
+            mdx_files[stem].unlink()
+            print("Removed duplicate profile:", mdx_files[stem].name, "->", identities.canonical(stem))
+        if duplicates:
+            print("Removed", len(duplicates), "duplicate founder MDX file(s).")
+
+    # Only the MDX files written above hash differently, so only those are parsed again
+    with metrics.stage("index"):
+        index_file = CONTENT_FOUNDERS.parent / founders_index.INDEX_FILE.name
+        counts = founders_index.update_index(CONTENT_FOUNDERS, index_file)
+    print("Founder index:", index_file, counts)
 
     print("Done. MDX files in", CONTENT_FOUNDERS)
+    metrics.write_reports("fetch_devfolio_profile_json", args)
 
 
 if __name__ == "__main__":
@@ -2,27 +2,43 @@
 Fetch Twitter/X and GitHub links from Devfolio profile pages.
 
 Reads: lib/projects-from-devfolio.json (to get founderTwitter = Devfolio usernames)
-Writes: profile_links.json in this folder { "devfolio_username": { "twitter": "handle", "github": "url" } }
+Writes: profile_links.json in this folder { "devfolio_username": { "twitter": "handle", "github": "url", "linkedin": "url" } }
         Then run merge_profile_links.py to update projects-from-devfolio.json with founderTwitter + founderGithub.
 
+fetch_devfolio_profile_json.py writes the same profile_links.json from the same page fetch it uses for
+the founder MDX, so a full refresh does not need this script; it is kept for links-only runs.
+
 Usage:
   pip install requests beautifulsoup4
   python fetch_devfolio_profiles.py
+  python fetch_devfolio_profiles.py --cache-only   # re-extract links from cached pages, no network
+  python fetch_devfolio_profiles.py --no-adaptive  # fixed 0.8 s pause instead of AIMD pacing
   python merge_profile_links.py
 """
+import argparse
+import importlib.util
 import json
 import re
 import time
 from pathlib import Path
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+import http_cache
+import http_client
+import identity
+import metrics
+from next_data import extract_users_and_stats, next_data_json, social_from_profiles
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECTS_JSON = SCRIPT_DIR.parent.parent / "lib" / "projects-from-devfolio.json"
 OUTPUT_FILE = SCRIPT_DIR / "profile_links.json"
 BASE_URL = "https://devfolio.co"
-USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/115.0"
+SERIAL_DELAY = 0.8
+# lxml is several times faster than the pure-Python parser; used when installed
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+# Quoted GitHub / X / Twitter URLs anywhere in the page (script data included)
+SOCIAL_URL_RE = re.compile(r'["\'](https?://(?:www\.)?(?:github\.com|x\.com|twitter\.com)/[^"\'\s]+)["\']', re.I)
 
 
 def extract_handle_from_twitter_url(url: str) -> str | None:
@@ -38,66 +54,92 @@ def extract_handle_from_twitter_url(url: str) -> str | None:
     return None
 
 
-def extract_github_url(html: str, base: str) -> str | None:
-    # Prefer direct links to github.com (user or repo)
-    soup = BeautifulSoup(html, "html.parser")
-    seen = set()
-    for a in soup.find_all("a", href=True):
-        href = (a.get("href") or "").strip()
-        if not href or href in seen:
-            continue
-        seen.add(href)
-        if href.startswith("//"):
-            href = "https:" + href
-        if not href.startswith("http"):
-            if href.startswith("/"):
-                href = base + href
-            else:
-                continue
-        lower = href.lower()
-        if "github.com" in lower and "gist." not in lower:
-            return href
-    # Fallback: regex in raw HTML (for client-rendered links in script/data)
-    for match in re.finditer(r'["\'](https?://(?:www\.)?github\.com/[^"\'\\s]+)["\']', html, re.I):
-        return match.group(1)
-    return None
+def _normalize_href(href: str, base: str) -> str | None:
+    href = (href or "").strip()
+    if href.startswith("//"):
+        href = "https:" + href
+    if href.startswith("/"):
+        href = base + href
+    return href if href.startswith("http") else None
+
+
+def _add_link(out: dict, url: str) -> None:
+    """Record url under the first social key it matches that is still missing from out."""
+    lower = url.lower()
+    if "github" not in out and "github.com" in lower and "gist." not in lower:
+        out["github"] = url
+    elif "twitter" not in out:
+        handle = extract_handle_from_twitter_url(url)
+        if handle:
+            out["twitter"] = handle
+    if "linkedin" not in out and "linkedin.com/" in lower:
+        out["linkedin"] = url
+
+
+def _next_data_profiles(html: str) -> list:
+    payload = next_data_json(html)
+    if payload is None:
+        return []
+    try:
+        next_data = json.loads(payload)
+    except json.JSONDecodeError:
+        return []
+    return extract_users_and_stats(next_data)[1] or []
+
 
+def extract_links(html: str, profiles: list | None = None, base: str = BASE_URL) -> dict:
+    """Every social link on one profile page in a single pass: {"twitter": handle, "github": url,
+    "linkedin": url}, keys only when found.
 
-def extract_twitter_handle(html: str) -> str | None:
-    soup = BeautifulSoup(html, "html.parser")
+    Prefers the structured profiles from __NEXT_DATA__ (pass them in when already parsed).
+    Only when those lack Twitter or GitHub is the HTML scanned: one anchor-only parse with the
+    fastest installed backend, then one regex over the raw page for client-rendered links."""
+    out = {}
+    if profiles is None:
+        profiles = _next_data_profiles(html)
+    for url in social_from_profiles(profiles).values():
+        if url:
+            _add_link(out, url)
+    if "twitter" in out and "github" in out:
+        return out
+
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer("a", href=True))
     for a in soup.find_all("a", href=True):
-        href = (a.get("href") or "").strip()
-        h = extract_handle_from_twitter_url(href)
-        if h:
-            return h
-    for match in re.finditer(
-        r'["\'](https?://(?:www\.)?(?:x\.com|twitter\.com)/(?:#!/)?([a-zA-Z0-9_]+))["\']',
-        html,
-        re.I,
-    ):
-        return match.group(2)
-    return None
+        href = _normalize_href(a.get("href"), base)
+        if href:
+            _add_link(out, href)
+        if "twitter" in out and "github" in out:
+            return out
+    for match in SOCIAL_URL_RE.finditer(html):
+        _add_link(out, match.group(1))
+        if "twitter" in out and "github" in out:
+            break
+    return out
 
 
-def fetch_profile(username: str) -> dict:
+def fetch_profile(username: str, cache: http_cache.ResponseCache | None = None) -> dict:
     url = f"{BASE_URL}/@{username}"
     out = {}
     try:
-        r = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=15)
-        r.raise_for_status()
-        html = r.text
-        twitter = extract_twitter_handle(html)
-        if twitter:
-            out["twitter"] = twitter
-        github = extract_github_url(html, BASE_URL)
-        if github:
-            out["github"] = github
+        if cache is not None:
+            html = cache.get_text(url)
+        else:
+            r = http_client.get(url)
+            r.raise_for_status()
+            html = r.text
+        out.update(extract_links(html))
     except Exception as e:
         out["_error"] = str(e)
     return out
 
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch Twitter/GitHub links from Devfolio profile pages.")
+    http_client.add_rate_arguments(parser)
+    http_cache.add_cache_arguments(parser)
+    metrics.add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+
     if not PROJECTS_JSON.exists():
         print("Run transform_to_data.py first so that", PROJECTS_JSON, "exists.")
         return
@@ -105,27 +147,52 @@ def main():
     with open(PROJECTS_JSON, encoding="utf-8") as f:
         projects = json.load(f)
 
+    # One fetch per person: keys already known to be a handle or another spelling map to the username
+    identities = identity.load_identities() or identity.Identities()
     usernames = set()
     for p in projects:
         tw = (p.get("founderTwitter") or "").strip()
         if tw and tw != "devfolio":
-            usernames.add(tw)
+            usernames.add(identities.canonical(tw))
 
     print("Found", len(usernames), "unique Devfolio usernames to fetch.")
+    cache = http_cache.cache_from_args(args)
+    if args.adaptive:
+        # Starts at the old fixed pace and follows the server from there
+        http_client.configure_rate(start_rps=1.0 / SERIAL_DELAY, max_rps=args.max_rps)
+    previous = {}
+    if cache is not None and cache.cache_only and OUTPUT_FILE.exists():
+        with open(OUTPUT_FILE, encoding="utf-8") as f:
+            previous = json.load(f)
     results = {}
-    for i, username in enumerate(sorted(usernames)):
-        print(i + 1, "/", len(usernames), username, end=" ... ")
-        data = fetch_profile(username)
-        if data.get("_error"):
-            print("error:", data["_error"])
-        else:
-            print("twitter=", data.get("twitter") or "-", "github=", "yes" if data.get("github") else "-")
-        results[username] = {k: v for k, v in data.items() if k != "_error"}
-        time.sleep(0.8)
+    with metrics.stage("crawl"):
+        for i, username in enumerate(sorted(usernames)):
+            print(i + 1, "/", len(usernames), username, end=" ... ")
+            fresh_before = cache.stats["fresh"] if cache is not None else 0
+            data = fetch_profile(username, cache)
+            if data.get("_error"):
+                print("error:", data["_error"])
+                if username in previous:
+                    # Cache-only run without a cached page: keep the links we already had
+                    results[username] = previous[username]
+                    continue
+            else:
+                print("twitter=", data.get("twitter") or "-", "github=", "yes" if data.get("github") else "-")
+            results[username] = {k: v for k, v in data.items() if k != "_error"}
+            # No pause when the page came straight from the cache (or cache-only mode)
+            if not args.adaptive and (cache is None or not (cache.cache_only or cache.stats["fresh"] > fresh_before)):
+                time.sleep(SERIAL_DELAY)
+    if args.adaptive:
+        print("Request rate:", http_client.rate_summary() or "no requests")
+    if cache is not None:
+        print(cache.summary())
+        cache.close()
 
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
         json.dump(results, f, indent=2)
+    metrics.records_written(OUTPUT_FILE.name, len(results))
     print("Wrote", OUTPUT_FILE)
+    metrics.write_reports("fetch_devfolio_profiles", args)
 
 
 if __name__ == "__main__":
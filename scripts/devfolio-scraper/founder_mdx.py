@@ -0,0 +1,209 @@
+"""
+Write founder MDX (content/founders/[username].mdx) without clobbering what people edited.
+
+generate_mdx() renders a fresh file from the profile schema. write_founder_mdx() merges that
+into the file already on disk instead of replacing it:
+  - the frontmatter keys the crawler owns (FRONTMATTER_KEYS) take the new values, in the
+    position they already had; an owned key the profile no longer has is dropped
+  - every other key (edit_id, keys added by hand or by other scripts) is kept verbatim
+  - the body (## About, ## What I'm Building, ...) is kept, except the About section while it is
+    still the crawler's: the placeholder, or text whose hash matches the about_sha key the
+    crawler recorded when it wrote it. That About takes the current Devfolio bio (and about_sha
+    its hash); an About someone edited no longer matches and is kept, with its old about_sha
+The result is hashed against the file on disk and written (temp file + rename) only when it
+differs, so a refresh touches just the profiles that really changed, and git, the founder index
+and the Next.js build only see those.
+"""
+import hashlib
+import os
+from pathlib import Path
+
+# Keys build_founder_schema() produces; the rest of the frontmatter belongs to someone else
+FRONTMATTER_KEYS = (
+    "username",
+    "name",
+    "city",
+    "country",
+    "short_bio",
+    "profile_image",
+    "github",
+    "twitter",
+    "linkedin",
+    "hackathons_attended",
+    "projects_built",
+    "prizes_won",
+    "prize_winnings_amount",
+    "onchain_creds_claimed",
+    "tags",
+)
+ABOUT_HEADING = "## About"
+ABOUT_PLACEHOLDER = "*Edit this section in the MDX file.*"
+# Frontmatter key with the hash of the About text the crawler generated; written by
+# generate_mdx() and owned by merge_mdx() only while the About is unedited
+ABOUT_SHA_KEY = "about_sha"
+
+
+def mdx_escape(s: str) -> str:
+    if not s:
+        return ""
+    return s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def about_sha(about: str) -> str:
+    return hashlib.sha256(about.strip().encode("utf-8")).hexdigest()[:16]
+
+
+def generate_mdx(schema: dict, full_bio: str) -> str:
+    """Generate MDX content with frontmatter and editable body."""
+    about = full_bio[:2000] if full_bio else ABOUT_PLACEHOLDER
+    lines = ["---"]
+    for k, v in schema.items():
+        if v is None:
+            continue
+        if k == "tags" and v:
+            lines.append("tags:")
+            for t in v:
+                lines.append(f'  - "{mdx_escape(str(t))}"')
+        elif isinstance(v, str):
+            lines.append(f'{k}: "{mdx_escape(v)}"')
+        elif isinstance(v, (int, float)):
+            lines.append(f"{k}: {v}")
+    lines.append(f'{ABOUT_SHA_KEY}: "{about_sha(about)}"')
+    lines.append("---")
+    lines.append("")
+    lines.append(ABOUT_HEADING)
+    lines.append("")
+    lines.append(about)
+    lines.append("")
+    lines.append("## What I'm Building")
+    lines.append("")
+    lines.append("*Add your focus areas and current projects here.*")
+    lines.append("")
+    lines.append("## Interests")
+    lines.append("")
+    lines.append("- Web3")
+    lines.append("- Base")
+    lines.append("- India ecosystem")
+    return "\n".join(lines)
+
+
+def placeholder_mdx(username: str) -> str:
+    """Placeholder MDX so the founder page exists even when the fetch failed."""
+    schema = {"username": username, "name": username.replace("_", " ").title()}
+    return generate_mdx(schema, "")
+
+
+def split_mdx(text: str) -> tuple[list | None, list]:
+    """(frontmatter lines or None when there is none, body lines after the closing ---)."""
+    lines = text.split("\n")
+    if lines and lines[0].rstrip() == "---":
+        for i in range(1, len(lines)):
+            if lines[i].rstrip() == "---":
+                return lines[1:i], lines[i + 1 :]
+    return None, lines
+
+
+def frontmatter_blocks(lines: list) -> list[tuple[str | None, list]]:
+    """Group frontmatter lines per top-level key: [(key, lines)]. Indented lines (list items,
+    nested values) belong to the key above them; comments and blank lines to the key below."""
+    blocks, pending = [], []
+    for line in lines:
+        if line[:1] in (" ", "\t", "-") and blocks:
+            blocks[-1][1].append(line)
+        elif not line.strip() or line.lstrip().startswith("#"):
+            pending.append(line)
+        else:
+            blocks.append((line.partition(":")[0].strip(), pending + [line]))
+            pending = []
+    if pending:
+        blocks.append((None, pending))
+    return blocks
+
+
+def about_span(body: list) -> tuple[int, int] | None:
+    """(first, end) line of the text under ## About, None when there is no such section."""
+    try:
+        start = next(i for i, line in enumerate(body) if line.rstrip() == ABOUT_HEADING) + 1
+    except StopIteration:
+        return None
+    end = next((i for i in range(start, len(body)) if body[i].startswith("## ")), len(body))
+    return start, end
+
+
+def about_text(body: list) -> str | None:
+    """Text of the ## About section, None when there is none."""
+    span = about_span(body)
+    return None if span is None else "\n".join(body[span[0] : span[1]]).strip()
+
+
+def frontmatter_string(block: list) -> str | None:
+    """Value of a one-line `key: "value"` frontmatter block."""
+    value = block[-1].partition(":")[2].strip() if block else ""
+    return value.strip('"') or None
+
+
+def about_is_generated(about: str | None, recorded_sha: str | None) -> bool:
+    """True while the About section is still what the crawler wrote into it."""
+    if about is None:
+        return False
+    return about == ABOUT_PLACEHOLDER or (recorded_sha is not None and about_sha(about) == recorded_sha)
+
+
+def merge_mdx(existing: str, generated: str) -> str:
+    """existing with the crawler's frontmatter keys taken from generated (see module docstring)."""
+    old_front, old_body = split_mdx(existing)
+    new_front, new_body = split_mdx(generated)
+    if old_front is None:
+        # Nothing to merge into: keep the text as the body under fresh frontmatter
+        old_front, old_body = [], old_body if existing.strip() else new_body
+    new_blocks = dict(frontmatter_blocks(new_front or []))
+    old_blocks = frontmatter_blocks(old_front)
+
+    old_about, new_about = about_text(old_body), about_text(new_body)
+    recorded_sha = next((frontmatter_string(block) for key, block in old_blocks if key == ABOUT_SHA_KEY), None)
+    # Files written before about_sha existed: an About identical to the new one is ours too
+    replace_about = new_about is not None and (old_about == new_about or about_is_generated(old_about, recorded_sha))
+    new_sha_block = new_blocks.pop(ABOUT_SHA_KEY, None)
+    if replace_about and new_sha_block:
+        new_blocks[ABOUT_SHA_KEY] = new_sha_block
+
+    merged = []
+    for key, block in old_blocks:
+        if key in new_blocks:
+            # Comments and blank lines above an owned key stay where they were
+            merged += [line for line in block if not line.strip() or line.lstrip().startswith("#")]
+            merged += [line for line in new_blocks.pop(key) if line.strip()]
+        elif key not in FRONTMATTER_KEYS:
+            merged += block
+    for block in new_blocks.values():
+        merged += block
+
+    body = old_body
+    if replace_about and old_about != new_about:
+        start, end = about_span(old_body)
+        body = old_body[:start] + ["", new_about] + ([""] if end < len(old_body) else []) + old_body[end:]
+    return "\n".join(["---", *merged, "---", *body])
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Write text to path (temp file + rename) unless the file already has exactly this content.
+    Returns True when the file was written."""
+    path = Path(path)
+    data = text.encode("utf-8")
+    if path.exists():
+        with open(path, "rb") as f:
+            if hashlib.sha256(f.read()).digest() == hashlib.sha256(data).digest():
+                return False
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+def write_founder_mdx(path: Path, generated: str) -> bool:
+    """Merge generated into the MDX at path (or create it) and write it only if it changed."""
+    path = Path(path)
+    if path.exists():
+        generated = merge_mdx(path.read_text(encoding="utf-8"), generated)
+    return write_if_changed(path, generated)
@@ -0,0 +1,277 @@
+"""
+Build content/founders-index.json: the frontmatter of every content/founders/*.mdx in one file,
+so the site (lib/founder.ts) loads one JSON instead of gray-matter-parsing every profile.
+
+Format, one founder per line so diffs stay readable:
+  {"version":1,"founders":{
+  "<username>":{"hash":"<sha256 of the .mdx bytes>","frontmatter":{...}},
+  ...}}
+
+The rebuild is incremental: every MDX is hashed, and only files whose hash differs from the
+entry already in the index are parsed again (removed files are dropped). The site trusts an
+entry without reading the MDX when the file is not newer than the index, and checks the hash
+otherwise, so a profile edited after the last rebuild (Telegram bot, add-edit-ids) is still
+read from its MDX. Frontmatter outside the flat subset our writers emit (quoted/plain scalars,
+numbers, booleans, null, string lists) is left out of the index, and the site parses that
+file itself. Plain scalars resolve as in js-yaml, which gray-matter uses (0x1f, 0755, 1_000,
+1e5 and 1:30 are numbers; a timestamp makes the file unsupported).
+
+fetch_devfolio_profile_json.py updates the index after every crawl.
+
+Usage:
+  python founders_index.py            # update after MDX edits
+  python founders_index.py --full     # reparse every file
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+from pathlib import Path
+
+import metrics
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+ROOT = SCRIPT_DIR.parent.parent
+CONTENT_FOUNDERS = ROOT / "content" / "founders"
+INDEX_FILE = ROOT / "content" / "founders-index.json"
+INDEX_VERSION = 1
+
+# Implicit types of js-yaml 3's default safe schema (what gray-matter loads frontmatter with),
+# tried in its order: null, bool, int, float, timestamp, merge. A plain scalar matching none of
+# them is a string.
+YAML_INT_RE = re.compile(
+    r"[-+]?0"
+    r"|[-+]?0b[01_]*[01]"
+    r"|[-+]?0x[0-9a-fA-F_]*[0-9a-fA-F]"
+    r"|[-+]?0[0-7_]*[0-7]"
+    r"|[-+]?[1-9]([0-9_]*[0-9])?"
+    r"|[-+]?[1-9][0-9_]*(:[0-5]?[0-9])+"
+)
+YAML_FLOAT_RE = re.compile(
+    r"[-+]?(0|[1-9][0-9_]*)(\.[0-9_]*)?([eE][-+]?[0-9]+)?"
+    r"|\.[0-9_]+([eE][-+]?[0-9]+)?"
+    r"|[-+]?[0-9][0-9_]*(:[0-5]?[0-9])+\.[0-9_]*"
+    r"|[-+]?\.(inf|Inf|INF)"
+    r"|\.(nan|NaN|NAN)"
+)
+YAML_TIMESTAMP_RE = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
+    r"|[0-9]{4}-[0-9]{1,2}-[0-9]{1,2}([Tt]|[ \t]+)[0-9]{1,2}:[0-9]{2}:[0-9]{2}(\.[0-9]*)?"
+    r"([ \t]*(Z|[-+][0-9]{1,2}(:[0-9]{2})?))?"
+)
+ESCAPES = {"\\": "\\", '"': '"', "/": "/", "n": "\n", "t": "\t", "r": "\r", "0": "\0", " ": " "}
+HEX_ESCAPES = {"x": 2, "u": 4, "U": 8}
+
+
+class UnsupportedFrontmatter(ValueError):
+    pass
+
+
+def double_quoted(text: str) -> str:
+    out, i = [], 0
+    while i < len(text):
+        c = text[i]
+        if c != "\\":
+            out.append(c)
+            i += 1
+            continue
+        esc = text[i + 1 : i + 2]
+        if esc in ESCAPES:
+            out.append(ESCAPES[esc])
+            i += 2
+        elif esc in HEX_ESCAPES:
+            digits = text[i + 2 : i + 2 + HEX_ESCAPES[esc]]
+            try:
+                out.append(chr(int(digits, 16)))
+            except ValueError:
+                raise UnsupportedFrontmatter(f"bad escape \\{esc}{digits}") from None
+            i += 2 + len(digits)
+        else:
+            raise UnsupportedFrontmatter(f"escape \\{esc}")
+    return "".join(out)
+
+
+def sexagesimal(value: str, number) -> float:
+    """js-yaml's base 60 ("1:30" = 90): the last part counts 1, the one before 60, ..."""
+    total, base = 0, 1
+    for part in reversed(value.split(":")):
+        total += number(part) * base
+        base *= 60
+    return total
+
+
+def yaml_int(text: str) -> int:
+    """A YAML_INT_RE match as js-yaml constructs it (0b, 0x, leading-0 octal, _, base 60)."""
+    value = text.replace("_", "")
+    sign = -1 if value[0] == "-" else 1
+    value = value.lstrip("+-")
+    if value == "0":
+        return 0
+    if value.startswith("0b"):
+        return sign * int(value[2:], 2)
+    if value.startswith("0x"):
+        return sign * int(value[2:], 16)
+    if value.startswith("0"):
+        return sign * int(value, 8)
+    if ":" in value:
+        return sign * sexagesimal(value, int)
+    return sign * int(value)
+
+
+def yaml_float(text: str) -> float:
+    """A YAML_FLOAT_RE match as js-yaml constructs it; .inf / .nan have no JSON form."""
+    value = text.replace("_", "").lower()
+    sign = -1 if value[0] == "-" else 1
+    value = value.lstrip("+-")
+    if value in (".inf", ".nan"):
+        raise UnsupportedFrontmatter(f"plain scalar {text[:20]!r}")
+    number = sexagesimal(value, float) if ":" in value else float(value)
+    if not math.isfinite(number):
+        raise UnsupportedFrontmatter(f"plain scalar {text[:20]!r}")
+    return sign * number
+
+
+def scalar(text: str):
+    """One YAML scalar as gray-matter (js-yaml) would load it, for the forms our writers use."""
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        body = text[1:-1]
+        if re.search(r'(?<!\\)(\\\\)*"', body):
+            raise UnsupportedFrontmatter("unescaped quote")
+        return double_quoted(body)
+    if len(text) >= 2 and text[0] == text[-1] == "'":
+        return text[1:-1].replace("''", "'")
+    if " #" in text:
+        text = text.split(" #", 1)[0].rstrip()
+    if text in ("", "~", "null", "Null", "NULL"):
+        return None
+    if text in ("true", "True", "TRUE"):
+        return True
+    if text in ("false", "False", "FALSE"):
+        return False
+    if YAML_INT_RE.fullmatch(text):
+        return yaml_int(text)
+    if YAML_FLOAT_RE.fullmatch(text) and not text.endswith("_"):
+        return yaml_float(text)
+    if YAML_TIMESTAMP_RE.fullmatch(text) or text == "<<":
+        # A Date / merge key in gray-matter; JSON has no equivalent
+        raise UnsupportedFrontmatter(f"plain scalar {text[:20]!r}")
+    if text[0] in "[{&*!|>%@`'\"" or text.startswith("- ") or ": " in text:
+        raise UnsupportedFrontmatter(f"plain scalar {text[:20]!r}")
+    return text
+
+
+def parse_frontmatter(text: str) -> dict:
+    """Frontmatter of one MDX as a dict ({} when there is none). Raises UnsupportedFrontmatter
+    for anything beyond top-level keys with scalar or string-list values."""
+    lines = text.split("\n")
+    if not lines or lines[0].rstrip() != "---":
+        return {}
+    try:
+        end = next(i for i in range(1, len(lines)) if lines[i].rstrip() == "---")
+    except StopIteration:
+        return {}
+    data, key = {}, None
+    # "key:" with nothing under it is null unless list items follow
+    pending = set()
+    for line in lines[1:end]:
+        line = line.rstrip("\r")
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if line.lstrip().startswith("- ") or line.strip() == "-":
+            if key is None or not isinstance(data[key], list):
+                raise UnsupportedFrontmatter("list item outside a list")
+            data[key].append(scalar(line.strip()[1:]))
+            pending.discard(key)
+            continue
+        if line[0] in " \t":
+            raise UnsupportedFrontmatter("nested value")
+        name, sep, value = line.partition(":")
+        if not sep or not name.strip():
+            raise UnsupportedFrontmatter(f"line {line[:20]!r}")
+        key = name.strip()
+        value = value.strip()
+        if value == "":
+            data[key] = []
+            pending.add(key)
+        elif value == "[]":
+            data[key] = []
+        else:
+            data[key] = scalar(value)
+    for key in pending:
+        data[key] = None
+    return data
+
+
+def load_index(path: Path = INDEX_FILE) -> dict:
+    if not path.exists():
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            index = json.load(f)
+    except json.JSONDecodeError:
+        return {}
+    if index.get("version") != INDEX_VERSION:
+        return {}
+    return index.get("founders") or {}
+
+
+def write_index(founders: dict, path: Path = INDEX_FILE) -> None:
+    """Compact JSON, one founder per line, written via temp file + rename."""
+    lines = [f'{{"version":{INDEX_VERSION},"founders":{{']
+    items = sorted(founders.items())
+    for i, (username, entry) in enumerate(items):
+        comma = "," if i < len(items) - 1 else ""
+        lines.append(f"{json.dumps(username, ensure_ascii=False)}:{json.dumps(entry, ensure_ascii=False, separators=(',', ':'))}{comma}")
+    lines.append("}}")
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def update_index(content_dir: Path = CONTENT_FOUNDERS, path: Path = INDEX_FILE, full: bool = False) -> dict:
+    """Bring the index in line with the MDX files, parsing only changed ones. Returns counts."""
+    previous = {} if full else load_index(path)
+    founders = {}
+    counts = {"parsed": 0, "unchanged": 0, "removed": 0, "unsupported": 0}
+    files = sorted(content_dir.glob("*.mdx")) if content_dir.exists() else []
+    for mdx_file in files:
+        username = mdx_file.stem
+        raw = mdx_file.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        old = previous.get(username)
+        if old is not None and old.get("hash") == digest:
+            founders[username] = old
+            counts["unchanged"] += 1
+            continue
+        try:
+            frontmatter = parse_frontmatter(raw.decode("utf-8"))
+        except (UnsupportedFrontmatter, UnicodeDecodeError) as e:
+            print("Not indexed (site parses it):", mdx_file.name, "-", e)
+            counts["unsupported"] += 1
+            continue
+        founders[username] = {"hash": digest, "frontmatter": frontmatter}
+        counts["parsed"] += 1
+    counts["removed"] = len(set(previous) - {f.stem for f in files})
+    if founders != previous or not path.exists():
+        write_index(founders, path)
+        metrics.records_written(path.name, counts["parsed"])
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--full", action="store_true", help="Reparse every MDX instead of only changed ones")
+    metrics.add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with metrics.stage("index"):
+        counts = update_index(full=args.full)
+    print("Founder index:", INDEX_FILE, counts)
+    metrics.write_reports("founders_index", args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Persistent HTTP response cache for Devfolio profile pages.
+
+Keyed by URL and stored in a single SQLite file next to the scripts. Each entry keeps the
+body plus ETag / Last-Modified. Entries younger than the TTL are served without touching
+the network; older ones are revalidated with If-None-Match / If-Modified-Since, so an
+unchanged profile costs one empty 304 instead of a full page. Total body size is bounded
+and the least recently used entries are evicted first.
+
+Usage (from a script):
+  cache = http_cache.cache_from_args(args)      # after http_cache.add_cache_arguments(parser)
+  html = cache.get_text(url) if cache else http_client.get(url).text
+"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import http_client
+import metrics
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+CACHE_FILE = SCRIPT_DIR / ".http_cache.sqlite3"
+DEFAULT_TTL = 6 * 3600
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class CacheMiss(LookupError):
+    """Raised in cache-only mode when a URL has never been cached."""
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        path: Path = CACHE_FILE,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        cache_only: bool = False,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.cache_only = cache_only
+        self.stats = {"fresh": 0, "revalidated": 0, "downloaded": 0, "bytes_downloaded": 0, "evicted": 0}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        self._db.commit()
+
+    def _row(self, url: str):
+        with self._lock:
+            return self._db.execute(
+                "SELECT etag, last_modified, body, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+
+    def _touch(self, url: str, fetched: bool) -> None:
+        now = time.time()
+        with self._lock:
+            if fetched:
+                self._db.execute(
+                    "UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE url = ?", (now, now, url)
+                )
+            else:
+                self._db.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url))
+            self._db.commit()
+
+    def _store(self, url: str, etag: str | None, last_modified: str | None, body: str) -> None:
+        now = time.time()
+        size = len(body.encode("utf-8"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body, size, now, now),
+            )
+            self._evict()
+            self._db.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the total size fits max_bytes (lock held)."""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, size in self._db.execute("SELECT url, size FROM responses ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+            self.stats["evicted"] += 1
+            metrics.inc("cache_evictions_total")
+
+    def _count(self, result: str) -> None:
+        self.stats[result] += 1
+        metrics.inc("cache_lookups_total", result=result)
+
+    def get_text(self, url: str) -> str:
+        """Return the body for url: from cache when fresh, revalidated when stale, else downloaded.
+        Raises CacheMiss in cache-only mode and requests.HTTPError on error statuses."""
+        row = self._row(url)
+        if row is not None:
+            etag, last_modified, body, fetched_at = row
+            if self.cache_only or time.time() - fetched_at < self.ttl:
+                self._touch(url, fetched=False)
+                self._count("fresh")
+                return body
+        elif self.cache_only:
+            metrics.inc("cache_lookups_total", result="miss")
+            raise CacheMiss(url)
+
+        headers = {}
+        if row is not None:
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        r = http_client.get(url, headers=headers)
+        if r.status_code == 304 and row is not None:
+            self._touch(url, fetched=True)
+            self._count("revalidated")
+            return body
+        r.raise_for_status()
+        self._count("downloaded")
+        self.stats["bytes_downloaded"] += len(r.content)
+        self._store(url, r.headers.get("ETag"), r.headers.get("Last-Modified"), r.text)
+        return r.text
+
+    def summary(self) -> str:
+        s = self.stats
+        return (
+            f"cache: {s['fresh']} fresh, {s['revalidated']} revalidated (304), {s['downloaded']} downloaded "
+            f"({s['bytes_downloaded'] / 1024:.0f} KiB), {s['evicted']} evicted"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def add_cache_arguments(parser) -> None:
+    group = parser.add_argument_group("HTTP cache")
+    mode = group.add_mutually_exclusive_group()
+    mode.add_argument("--no-cache", action="store_true", help="Always download full pages; do not read or write the cache")
+    mode.add_argument("--cache-only", action="store_true", help="Serve pages from the cache only; never touch the network")
+    group.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        help=f"Seconds a cached page is used without revalidation (default: {DEFAULT_TTL})",
+    )
+    group.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=DEFAULT_MAX_BYTES / (1024 * 1024),
+        help="Cache size bound in MiB; least recently used pages are evicted first",
+    )
+
+
+def cache_from_args(args) -> ResponseCache | None:
+    if args.no_cache:
+        return None
+    return ResponseCache(
+        ttl=args.cache_ttl,
+        max_bytes=int(args.cache_max_mb * 1024 * 1024),
+        cache_only=args.cache_only,
+    )
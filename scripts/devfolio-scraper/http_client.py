@@ -0,0 +1,270 @@
+"""
+Shared HTTP client for the Devfolio scraper scripts.
+
+One pooled requests.Session per process: keep-alive connections per host (so TLS
+handshakes happen once per connection, not once per request), a common User-Agent and
+timeout, and retries with jittered exponential backoff on connection errors, 429 and 5xx.
+A Retry-After header from the server always wins over our own backoff.
+
+After configure_rate() every request is also paced per host by an AdaptiveLimiter (AIMD):
+the request rate grows additively while responses come back fast and successful (exponentially
+until the first throttle signal), and is cut multiplicatively on 429/503, connection errors or
+rising latency. A Retry-After pauses every
+request to that host, not just the one being retried. Crawl speed then follows what the
+server tolerates instead of a fixed sleep.
+
+Usage:
+  import http_client
+  r = http_client.get("https://devfolio.co/@someone")
+  r = http_client.post(URL, json=payload, headers=HEADERS)
+  http_client.configure_rate(start_rps=1.0)   # adaptive pacing from here on
+"""
+import argparse
+import email.utils
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import metrics
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/115.0"
+DEFAULT_TIMEOUT = 15
+POOL_SIZE = 32
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+RETRY_AFTER_MAX = 120.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Adaptive pacing (AdaptiveLimiter)
+THROTTLE_STATUSES = {429, 503}
+MIN_RPS = 0.2
+# Default ceiling (--max-rps), the same for every script: the adaptive rate never climbs past
+# this many requests per second to one host unless a higher --max-rps is asked for
+MAX_RPS = 4.0
+# Requests/s added per second of healthy responses
+AIMD_INCREASE = 1.0
+# Until the first cut the rate grows by this much per healthy response (doubles about every
+# 1.4 s), so a short crawl finds the server's limit quickly, as TCP slow start does
+SLOW_START_STEP = 0.5
+# Factor applied to the rate on a throttle signal
+AIMD_DECREASE = 0.5
+# Latency counts as rising when its moving average is this many times the best one seen,
+# and at least LATENCY_SLACK seconds above it
+LATENCY_FACTOR = 2.0
+LATENCY_SLACK = 0.1
+LATENCY_ALPHA = 0.2
+# The best average creeps up slowly, so a lasting change in baseline latency is forgiven
+BEST_LATENCY_DRIFT = 0.002
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+class AdaptiveLimiter:
+    """AIMD request pacing for one host: evenly spaced request starts at `rate` per second."""
+
+    def __init__(self, host: str, start_rps: float = 1.0, min_rps: float = MIN_RPS, max_rps: float = MAX_RPS):
+        self.host = host
+        self.min_rps = min_rps
+        self.max_rps = max(max_rps, min_rps)
+        self.rate = min(max(start_rps, min_rps), self.max_rps)
+        self.peak_rate = self.rate
+        self.decreases = 0
+        self._lock = threading.Lock()
+        self._next = 0.0
+        self._paused_until = 0.0
+        self._decreased_at = 0.0
+        self._latency = None
+        self._best_latency = None
+
+    def wait(self) -> float:
+        """Block until this request may start; returns its start time (time.monotonic())."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next, self._paused_until)
+            self._next = slot + 1.0 / self.rate
+        if slot > now:
+            time.sleep(slot - now)
+        return slot
+
+    def observe(self, started: float, status: int | str, seconds: float, retry_after: float | None = None) -> None:
+        """Feed back one attempt: its start time (from wait()), status ("error" when no
+        response), latency and Retry-After."""
+        with self._lock:
+            now = time.monotonic()
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + min(retry_after, RETRY_AFTER_MAX))
+            if status in THROTTLE_STATUSES or status == "error":
+                self._decrease(started, str(status))
+                return
+            if status >= 500:
+                return
+            if self._latency is None:
+                self._latency = self._best_latency = seconds
+            else:
+                self._latency += LATENCY_ALPHA * (seconds - self._latency)
+                self._best_latency = min(self._latency, self._best_latency * (1 + BEST_LATENCY_DRIFT))
+            if self._latency > LATENCY_FACTOR * self._best_latency and self._latency - self._best_latency > LATENCY_SLACK:
+                self._decrease(started, "latency")
+                # Compare against the new level from here on: latency that keeps rising cuts
+                # again, a server that is simply slower now does not drag the rate to the floor
+                self._best_latency = self._latency
+                return
+            if self.decreases == 0:
+                self.rate = min(self.max_rps, self.rate + SLOW_START_STEP)
+            else:
+                # About AIMD_INCREASE more requests/s for every second of healthy responses
+                self.rate = min(self.max_rps, self.rate + AIMD_INCREASE / self.rate)
+            self.peak_rate = max(self.peak_rate, self.rate)
+
+    def _decrease(self, started: float, reason: str) -> None:
+        # Requests sent before the last cut were paced at the old rate; one cut covers them all
+        if started < self._decreased_at:
+            return
+        self.rate = max(self.min_rps, self.rate * AIMD_DECREASE)
+        self._decreased_at = time.monotonic()
+        self.decreases += 1
+        metrics.inc("rate_limit_decreases_total", host=self.host, reason=reason)
+
+    def summary(self) -> str:
+        return f"{self.host}: {self.rate:.2f} req/s now, peak {self.peak_rate:.2f}, {self.decreases} cut(s)"
+
+
+_rate_config: dict | None = None
+_limiters: dict[str, AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def configure_rate(start_rps: float = 1.0, min_rps: float = MIN_RPS, max_rps: float = MAX_RPS) -> None:
+    """Pace every later request with a per-host AdaptiveLimiter starting at start_rps."""
+    global _rate_config
+    with _limiters_lock:
+        _rate_config = {"start_rps": start_rps, "min_rps": min_rps, "max_rps": max_rps}
+        _limiters.clear()
+
+
+def reset_rate() -> None:
+    """Back to unpaced requests."""
+    global _rate_config
+    with _limiters_lock:
+        _rate_config = None
+        _limiters.clear()
+
+
+def limiter_for(host: str) -> AdaptiveLimiter | None:
+    if _rate_config is None:
+        return None
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = AdaptiveLimiter(host, **_rate_config)
+        return _limiters[host]
+
+
+def rate_summary() -> str:
+    with _limiters_lock:
+        return "; ".join(limiter.summary() for limiter in _limiters.values())
+
+
+def add_rate_arguments(parser) -> None:
+    group = parser.add_argument_group("Request rate")
+    group.add_argument(
+        "--adaptive",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Pace requests with AIMD: speed up while the server answers fast, back off on 429/503 or slow responses (default: on)",
+    )
+    group.add_argument(
+        "--max-rps",
+        type=float,
+        default=MAX_RPS,
+        help="Upper bound for the adaptive request rate per host (default: %(default)s)",
+    )
+
+
+def get_session() -> requests.Session:
+    """Process-wide session; safe to share between the crawl worker threads."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                s = requests.Session()
+                # Retries are handled in request() so we can honour Retry-After and log attempts
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=POOL_SIZE, max_retries=0)
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                s.headers["User-Agent"] = USER_AGENT
+                _session = s
+    return _session
+
+
+def retry_after_seconds(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff: uniform(0, min(max, base * 2^attempt))."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2**attempt)))
+
+
+def request(method: str, url: str, *, retries: int = MAX_RETRIES, timeout: float = DEFAULT_TIMEOUT, **kwargs):
+    """Send a request through the shared session, retrying transient failures.
+    Returns the last response (callers still call raise_for_status); re-raises the last
+    connection error when every attempt failed to connect."""
+    session = get_session()
+    host = urlsplit(url).netloc
+    limiter = limiter_for(host)
+    for attempt in range(retries + 1):
+        started = limiter.wait() if limiter is not None else 0.0
+        t0 = time.perf_counter()
+        try:
+            r = session.request(method, url, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            metrics.observe_request(host, "error", time.perf_counter() - t0, 0)
+            if limiter is not None:
+                limiter.observe(started, "error", time.perf_counter() - t0)
+            if attempt >= retries:
+                raise
+            metrics.inc("http_retries_total", host=host, reason=type(e).__name__)
+            time.sleep(backoff_delay(attempt))
+            continue
+        # A streamed body has not been read yet; count what the server says it is sending
+        nbytes = int(r.headers.get("Content-Length") or 0) if kwargs.get("stream") else len(r.content)
+        seconds = time.perf_counter() - t0
+        metrics.observe_request(host, r.status_code, seconds, nbytes)
+        delay = retry_after_seconds(r.headers.get("Retry-After")) if r.status_code in RETRY_STATUSES else None
+        if limiter is not None:
+            limiter.observe(started, r.status_code, seconds, delay)
+        if r.status_code not in RETRY_STATUSES or attempt >= retries:
+            return r
+        metrics.inc("http_retries_total", host=host, reason=str(r.status_code))
+        if delay is None:
+            delay = backoff_delay(attempt)
+        r.close()
+        time.sleep(min(delay, RETRY_AFTER_MAX))
+    return r
+
+
+def get(url: str, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs):
+    return request("POST", url, **kwargs)
@@ -0,0 +1,364 @@
+"""
+Founder identity graph: which Devfolio usernames, Twitter handles and GitHub accounts belong to
+the same person, so every person is crawled once and keyed by one Devfolio username.
+
+Built with union-find before any profile is fetched, from what earlier runs already know:
+  profile_links.json / the store  Devfolio username -> Twitter handle, GitHub URL
+  content/founders-index.json     the same from every founder MDX (twitter/github frontmatter)
+  the project list                founderTwitter + founderTwitterHandle/founderGithub, founders[].twitter
+Nodes are case-insensitive ("Alice" and "alice" are one node). Two Devfolio usernames are
+never joined (they are separate accounts), and a Twitter handle or GitHub account listed on
+several profiles (a team or project account) identifies nobody. A founder key from a project
+that is a known Devfolio username stays itself; one only known as somebody's Twitter handle
+joins that person, as merge_profile_links.py always did; one that is only known as such a
+shared handle is no founder to crawl (it would just 404 as devfolio.co/@<handle> every run)
+and is listed under "shared"; anything else is taken as a new Devfolio username. Each person's canonical id is the spelling of their username that already
+has a profile (profile_links entry or MDX), else the spelling used by most projects.
+
+Saved as identity_graph.json (next to profile_links.json):
+  {"version":1,
+   "people":{"<canonical>":{"devfolio":[...],"twitter":[...],"github":[...]}},
+   "aliases":{"<lowercase username or handle>":"<canonical>"},
+   "shared":["<lowercase handle that several profiles list>", ...]}
+fetch_devfolio_profile_json.py builds and saves it before crawling; merge_profile_links.py
+loads it to rewrite founder keys to the canonical id.
+
+Usage:
+  python identity.py            # rebuild from the current files and print a summary
+  python identity.py --store    # from devfolio.sqlite3 instead
+  python identity.py --check    # self-check of the resolution rules on a small made-up graph
+"""
+import argparse
+import json
+from collections import Counter
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import founders_index
+from records import write_json_atomic
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECTS_JSON = SCRIPT_DIR.parent.parent / "lib" / "projects-from-devfolio.json"
+PROFILE_LINKS = SCRIPT_DIR / "profile_links.json"
+IDENTITY_FILE = SCRIPT_DIR / "identity_graph.json"
+GRAPH_VERSION = 1
+# Placeholder founder key transform_to_data.py uses when a project has no members
+IGNORED_KEYS = {"", "devfolio"}
+TWITTER_HOSTS = ("twitter.com", "www.twitter.com", "x.com", "www.x.com", "mobile.twitter.com")
+GITHUB_HOSTS = ("github.com", "www.github.com")
+
+
+def twitter_handle(value) -> str | None:
+    """Handle from "@handle", "handle" or an x.com / twitter.com URL."""
+    value = str(value or "").strip()
+    if "/" in value:
+        parts = urlsplit(value if "//" in value else "https://" + value)
+        if parts.netloc.lower() not in TWITTER_HOSTS:
+            return None
+        value = parts.path.strip("/").split("/")[0]
+    value = value.lstrip("@")
+    return value if value and value.lower() not in IGNORED_KEYS else None
+
+
+def github_user(value) -> str | None:
+    """Account name from a github.com URL (profile or repository)."""
+    value = str(value or "").strip()
+    if not value:
+        return None
+    parts = urlsplit(value if "//" in value else "https://" + value)
+    if parts.netloc.lower() not in GITHUB_HOSTS:
+        return None
+    return parts.path.strip("/").split("/")[0] or None
+
+
+class IdentityGraph:
+    """Union-find over ("devfolio" | "twitter" | "github", lowercase name) nodes. A set never
+    holds two different Devfolio usernames: those are separate accounts, so a union that would
+    join them is refused and the handle stays with the account that claimed it first."""
+
+    def __init__(self):
+        self.parent: dict[tuple, tuple] = {}
+        # root -> the one lowercase Devfolio username in its set
+        self.account: dict[tuple, str] = {}
+        # Devfolio username spellings: lowercase -> Counter of how often each spelling was seen
+        self.spellings: dict[str, Counter] = {}
+        # Devfolio username spellings that already have a profile (links entry or MDX)
+        self.profiled: set[str] = set()
+        self.display: dict[tuple, str] = {}
+        self.conflicts = 0
+        # Lowercase Twitter handles several profiles list; resolve_key() takes them for nobody
+        self.shared: set[str] = set()
+
+    def node(self, kind: str, name: str) -> tuple:
+        key = (kind, name.lower())
+        if key not in self.parent:
+            self.parent[key] = key
+            self.display[key] = name
+        return key
+
+    def find(self, key: tuple) -> tuple:
+        root = key
+        while self.parent[root] != root:
+            root = self.parent[root]
+        # Path compression
+        while self.parent[key] != root:
+            self.parent[key], key = root, self.parent[key]
+        return root
+
+    def union(self, a: tuple, b: tuple) -> bool:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return True
+        if ra in self.account and rb in self.account:
+            self.conflicts += 1
+            return False
+        # Deterministic root so the saved graph does not depend on input order
+        ra, rb = sorted((ra, rb))
+        self.parent[rb] = ra
+        account = self.account.pop(rb, None) or self.account.get(ra)
+        if account:
+            self.account[ra] = account
+        return True
+
+    def devfolio(self, username: str, count: int = 1) -> tuple:
+        key = self.node("devfolio", username)
+        self.spellings.setdefault(key[1], Counter())[username] += count
+        if key == self.find(key):
+            self.account[key] = key[1]
+        return key
+
+    def link(self, key: tuple, twitter=None, github=None) -> None:
+        handle = twitter_handle(twitter)
+        if handle:
+            self.union(key, self.node("twitter", handle))
+        account = github_user(github)
+        if account:
+            self.union(key, self.node("github", account))
+
+    def resolve_key(self, name: str) -> tuple | None:
+        """Node for a founder key from a project: a known Devfolio username, else a known Twitter
+        handle, else a new Devfolio username. None for a shared handle that is not a username."""
+        name = (name or "").strip()
+        if name.lower() in IGNORED_KEYS:
+            return None
+        twitter = ("twitter", name.lower())
+        if ("devfolio", name.lower()) not in self.parent:
+            if twitter in self.parent and self.find(twitter) in self.account:
+                return twitter
+            if name.lower() in self.shared:
+                return None
+        return self.devfolio(name)
+
+    def add_key(self, name: str, twitter=None, github=None) -> tuple | None:
+        key = self.resolve_key(name)
+        if key is not None:
+            self.link(key, twitter, github)
+        return key
+
+    def members(self) -> dict[tuple, list[tuple]]:
+        groups: dict[tuple, list[tuple]] = {}
+        for key in self.parent:
+            groups.setdefault(self.find(key), []).append(key)
+        return groups
+
+    def canonical(self, root: tuple) -> str | None:
+        """Spelling of the set's Devfolio username: the profiled one, else the most used."""
+        lower = self.account.get(root)
+        if lower is None:
+            return None
+        return min(self.spellings[lower].items(), key=lambda item: (item[0] not in self.profiled, -item[1], item[0]))[0]
+
+    def to_json(self) -> dict:
+        people, aliases = {}, {}
+        groups = self.members()
+        # Twitter handles first: where a name is both, the Devfolio username wins, as in resolve_key
+        for root, members in groups.items():
+            if root in self.account:
+                aliases.update({lower: self.canonical(root) for kind, lower in members if kind == "twitter"})
+        for root, members in groups.items():
+            canonical = self.canonical(root)
+            if canonical is None:
+                # A Twitter handle or GitHub account no Devfolio username points at
+                continue
+            people[canonical] = {
+                kind: sorted(self.display[k] for k in members if k[0] == kind) for kind in ("devfolio", "twitter", "github")
+            }
+            people[canonical]["devfolio"] = sorted(self.spellings[self.account[root]])
+            aliases[self.account[root]] = canonical
+        return {
+            "version": GRAPH_VERSION,
+            "people": dict(sorted(people.items(), key=lambda kv: kv[0].lower())),
+            "aliases": dict(sorted(aliases.items())),
+            "shared": sorted(name for name in self.shared if name not in aliases),
+        }
+
+
+def build_graph(projects, links: dict | None = None, founders: dict | None = None) -> IdentityGraph:
+    """Graph from profile links ({username: {"twitter", "github"}}), founders-index entries and
+    the projects' founder keys. Profiles go in first so project keys resolve against them; a
+    Twitter handle or GitHub account that several profiles list (a team or project account) is
+    ignored rather than credited to one of them."""
+    graph = IdentityGraph()
+    profiles = []
+    for username, entry in (founders or {}).items():
+        fm = entry.get("frontmatter") or {}
+        profiles.append((str(fm.get("username") or username), fm.get("twitter"), fm.get("github")))
+    for username, data in (links or {}).items():
+        profiles.append((username, (data or {}).get("twitter"), (data or {}).get("github")))
+    profiles = [(u.strip(), t, g) for u, t, g in profiles if u.strip().lower() not in IGNORED_KEYS]
+
+    claims: dict[tuple, set] = {}
+    for username, twitter, github in profiles:
+        for kind, name in (("twitter", twitter_handle(twitter)), ("github", github_user(github))):
+            if name:
+                claims.setdefault((kind, name.lower()), set()).add(username.lower())
+    shared = {node for node, owners in claims.items() if len(owners) > 1}
+    graph.shared = {name for kind, name in shared if kind == "twitter"}
+    for username, twitter, github in profiles:
+        key = graph.devfolio(username, count=0)
+        graph.profiled.add(username)
+        graph.link(
+            key,
+            None if ("twitter", (twitter_handle(twitter) or "").lower()) in shared else twitter,
+            None if ("github", (github_user(github) or "").lower()) in shared else github,
+        )
+    for p in projects:
+        graph.add_key(p.get("founderTwitter") or "", p.get("founderTwitterHandle"), p.get("founderGithub"))
+        for f in p.get("founders") or []:
+            graph.add_key(f.get("twitter") or "", f.get("twitterHandle"))
+    return graph
+
+
+def founder_keys(projects) -> list[str]:
+    keys = []
+    for p in projects:
+        keys.append((p.get("founderTwitter") or "").strip())
+        keys += [(f.get("twitter") or "").strip() for f in p.get("founders") or []]
+    return [k for k in keys if k.lower() not in IGNORED_KEYS]
+
+
+class Identities:
+    """Loaded identity_graph.json: alias lookups for later stages."""
+
+    def __init__(self, data: dict | None = None):
+        data = data or {}
+        self.people: dict = data.get("people") or {}
+        self.aliases: dict = data.get("aliases") or {}
+        self.twitter_owner = {
+            handle.lower(): canonical for canonical, person in self.people.items() for handle in person.get("twitter") or []
+        }
+        self.shared: set = set(data.get("shared") or [])
+
+    def canonical(self, name: str) -> str:
+        """Canonical Devfolio username for a username or Twitter handle; unknown names unchanged."""
+        name = (name or "").strip()
+        return self.aliases.get(name.lower(), name)
+
+    def is_shared(self, name: str) -> bool:
+        """True for a handle several profiles list that is nobody's username: not a founder to crawl."""
+        return (name or "").strip().lower() in self.shared
+
+    def usernames(self, keys) -> set:
+        """Canonical usernames of founder keys, one per person, leaving out shared handles."""
+        return {self.canonical(key) for key in keys if not self.is_shared(key)}
+
+    def is_twitter_alias(self, name: str) -> bool:
+        """True when name resolves to someone through their Twitter handle, not their username."""
+        canonical = self.canonical(name)
+        return self.twitter_owner.get(name.strip().lower()) == canonical and name.strip().lower() != canonical.lower()
+
+    def duplicate_profiles(self, stems, keep: set) -> list[str]:
+        """Founder MDX stems that duplicate a profile in keep: a case variant of its username, or
+        its owner's Twitter handle when no project uses that name as a founder itself."""
+        duplicates = []
+        for stem in stems:
+            if stem in keep:
+                continue
+            canonical = self.canonical(stem)
+            owner = self.twitter_owner.get(stem.lower())
+            if canonical != stem and canonical.lower() == stem.lower() and canonical in keep:
+                duplicates.append(stem)
+            elif owner is not None and owner.lower() != stem.lower() and owner in keep:
+                duplicates.append(stem)
+        return duplicates
+
+
+def load_identities(path: Path = IDENTITY_FILE) -> Identities | None:
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return Identities(data) if data.get("version") == GRAPH_VERSION else None
+
+
+def resolve(projects, links: dict | None, founders: dict | None = None, path: Path | None = IDENTITY_FILE) -> tuple[Identities, set]:
+    """Build the graph, save it to path (unless None) and return it with the canonical usernames
+    of every founder in projects: the set to crawl, one per person."""
+    projects = list(projects)
+    data = build_graph(projects, links, founders).to_json()
+    if path is not None:
+        write_json_atomic(path, data)
+    identities = Identities(data)
+    return identities, identities.usernames(founder_keys(projects))
+
+
+def self_check() -> None:
+    """The resolution rules on a made-up graph; raises AssertionError when one is broken."""
+    links = {
+        "alice": {"twitter": "https://x.com/alice_tw", "github": "https://github.com/alice"},
+        "bob": {"twitter": "@teamhandle"},
+        "carol": {"twitter": "teamhandle"},
+    }
+    projects = [
+        {"founderTwitter": "alice_tw"},
+        {"founderTwitter": "Alice"},
+        {"founderTwitter": "teamhandle", "founders": [{"twitter": "bob"}]},
+        {"founderTwitter": "dave"},
+    ]
+    identities, usernames = resolve(projects, links, path=None)
+    # A handle joins its owner, case variants are one person, a new key is a new username
+    assert identities.canonical("alice_tw") == "alice" and identities.canonical("ALICE") == "alice"
+    # A handle two profiles list is nobody: not credited to bob or carol, and not crawled
+    assert identities.is_shared("teamhandle") and identities.canonical("teamhandle") == "teamhandle"
+    assert "teamhandle" not in identities.people["bob"]["twitter"]
+    assert usernames == {"alice", "bob", "dave"}, usernames
+    # ... unless it is a Devfolio username of its own
+    links["teamhandle"] = {}
+    assert "teamhandle" in resolve(projects, links, path=None)[1]
+
+
+def main(argv=None):
+    from store import RecordStore, add_store_arguments
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_store_arguments(parser)
+    parser.add_argument("--check", action="store_true", help="Run the self-check on a made-up graph and exit")
+    args = parser.parse_args(argv)
+    if args.check:
+        self_check()
+        print("Identity self-check passed.")
+        return
+
+    if args.store:
+        with RecordStore(args.store) as store:
+            projects, links = list(store.iter_projects()), store.profile_links()
+    else:
+        with open(PROJECTS_JSON, encoding="utf-8") as f:
+            projects = json.load(f)
+        links = {}
+        if PROFILE_LINKS.exists():
+            with open(PROFILE_LINKS, encoding="utf-8") as f:
+                links = json.load(f)
+    identities, usernames = resolve(projects, links, founders_index.load_index())
+    keys = founder_keys(projects)
+    shared = {key.lower() for key in keys if identities.is_shared(key)}
+    print(
+        len(set(keys)), "founder keys ->", len(usernames), "people to crawl;",
+        len(identities.people), "people in", IDENTITY_FILE,
+    )
+    if shared:
+        print(len(shared), "founder key(s) are shared handles and not crawled:", ", ".join(sorted(shared)))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,24 +2,109 @@
 Merge profile_links.json into lib/projects-from-devfolio.json.
 
 Keeps one canonical founder id per person (Devfolio username) to avoid duplicate
-founder profiles. Updates each project:
+founder profiles, using the identity graph fetch_devfolio_profile_json.py saved
+(identity_graph.json, see identity.py; rebuilt from the links when it is missing).
+Updates each project:
   - founderTwitter -> always Devfolio username (canonical id for /founders/[username])
   - founderTwitterHandle -> Twitter handle for display/X links (if found)
   - founderGithub -> founder's GitHub URL from Devfolio profile (if found)
+  - founders[].twitter -> the same canonical id for co-founders
 
-Run after fetch_devfolio_profiles.py.
+Also writes lib/directory/ (directory_index.py), whose search index covers founder names, and
+records the projects it changed in the changeset (changeset.py).
+
+Run after fetch_devfolio_profile_json.py (or fetch_devfolio_profiles.py for a links-only refresh).
+With --store only projects whose row or founder links changed since the last merge are
+patched in devfolio.sqlite3 (export with: python store.py export).
 """
+import argparse
 import json
 from pathlib import Path
 
+import identity
+import metrics
+from changeset import ChangesetWriter, changeset_path
+from directory_index import write_directory
+from records import write_records
+from store import RecordStore, add_store_arguments
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECTS_JSON = SCRIPT_DIR.parent.parent / "lib" / "projects-from-devfolio.json"
 PROFILE_LINKS = SCRIPT_DIR / "profile_links.json"
 
 
-def main():
+def load_identities(projects, links: dict, path: Path = identity.IDENTITY_FILE) -> identity.Identities:
+    """The saved identity graph at path, or one built from projects + links when there is none yet."""
+    saved = identity.load_identities(path)
+    return saved or identity.resolve(projects, links, path=None)[0]
+
+
+def apply_links(p: dict, links: dict, identities: identity.Identities) -> bool:
+    """Patch one project in place; True when its founder id or Twitter handle was set."""
+    updated = False
+    key = (p.get("founderTwitter") or "").strip()
+    if not key or key == "devfolio":
+        return False
+    canonical = identities.canonical(key)
+    if identities.is_twitter_alias(key):
+        # key was a Twitter handle; use Devfolio username as canonical id
+        p["founderTwitter"] = canonical
+        p["founderTwitterHandle"] = key
+        updated = True
+    else:
+        # key is a Devfolio username (maybe another spelling); add Twitter handle for display
+        if canonical != key:
+            p["founderTwitter"] = canonical
+            updated = True
+        data = links.get(canonical) or {}
+        if data.get("twitter"):
+            p["founderTwitterHandle"] = data["twitter"]
+            updated = True
+    if canonical in links and links[canonical].get("github"):
+        p["founderGithub"] = links[canonical]["github"]
+    for f in p.get("founders") or []:
+        name = (f.get("twitter") or "").strip()
+        if name and name != "devfolio" and identities.canonical(name) != name:
+            if identities.is_twitter_alias(name):
+                f["twitterHandle"] = name
+            f["twitter"] = identities.canonical(name)
+    return updated
+
+
+def merge_store(store: RecordStore, identity_file: Path = identity.IDENTITY_FILE) -> tuple[int, int]:
+    """Patch the projects queued for merge; returns (patched, updated with a founder id/handle)."""
+    links = store.profile_links()
+    identities = load_identities(store.iter_projects(), links, identity_file)
+    patched = []
+    updated = 0
+    for pid, p in store.iter_unmerged_projects():
+        updated += apply_links(p, links, identities)
+        patched.append((pid, p))
+    store.set_merged(patched)
+    return len(patched), updated
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge profile_links.json into lib/projects-from-devfolio.json.")
+    parser.add_argument(
+        "--identity",
+        type=Path,
+        default=identity.IDENTITY_FILE,
+        help="Identity graph saved by fetch_devfolio_profile_json.py (default: %(default)s)",
+    )
+    add_store_arguments(parser)
+    metrics.add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.store:
+        with RecordStore(args.store) as store:
+            patched, updated = merge_store(store, args.identity)
+        print("Store:", patched, "projects merged,", updated, "with canonical founder id + Twitter handle.")
+        metrics.write_reports("merge_profile_links", args)
+        return
+
     if not PROFILE_LINKS.exists():
-        print("Run fetch_devfolio_profiles.py first to create", PROFILE_LINKS)
+        print("Run fetch_devfolio_profile_json.py first to create", PROFILE_LINKS)
         return
 
     with open(PROJECTS_JSON, encoding="utf-8") as f:
@@ -27,40 +112,20 @@ def main():
     with open(PROFILE_LINKS, encoding="utf-8") as f:
         links = json.load(f)
 
-    # Twitter handle -> Devfolio username (so we normalize Twitter back to canonical id)
-    twitter_to_devfolio = {}
-    for devfolio_user, data in links.items():
-        tw = (data.get("twitter") or "").strip()
-        if tw:
-            twitter_to_devfolio[tw.lower()] = devfolio_user
+    identities = load_identities(projects, links, args.identity)
+    updated = sum(apply_links(p, links, identities) for p in projects)
 
-    updated = 0
-    for p in projects:
-        key = (p.get("founderTwitter") or "").strip()
-        if not key or key == "devfolio":
-            continue
-        key_lower = key.lower()
-        if key_lower in twitter_to_devfolio:
-            # key was a Twitter handle; use Devfolio username as canonical id
-            canonical = twitter_to_devfolio[key_lower]
-            p["founderTwitter"] = canonical
-            p["founderTwitterHandle"] = key
-            updated += 1
-        elif key in links:
-            # key is Devfolio username; keep it, add Twitter handle for display
-            data = links[key]
-            if data.get("twitter"):
-                p["founderTwitterHandle"] = data["twitter"]
-                updated += 1
-        canonical = p.get("founderTwitter") or key
-        if canonical in links and links[canonical].get("github"):
-            p["founderGithub"] = links[canonical]["github"]
-
-    with open(PROJECTS_JSON, "w", encoding="utf-8") as f:
-        json.dump(projects, f, indent=2)
+    write_records(PROJECTS_JSON, projects)
+    # The directory payloads carry founder names and handles, so they follow the merge
+    print("Directory payloads:", write_directory(projects, PROJECTS_JSON.parent / "directory"))
+    changes = ChangesetWriter(changeset_path(PROJECTS_JSON), "merge_profile_links")
+    for project in projects:
+        changes.add(project)
+    print("Changeset:", changes.close())
 
     print("Updated", updated, "projects with canonical founder id + Twitter handle; added founderGithub where available.")
     print("Wrote", PROJECTS_JSON)
+    metrics.write_reports("merge_profile_links", args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,252 @@
+"""
+Run metrics for the Devfolio scraper scripts.
+
+One registry per process, fed by http_client.py (every request attempt: latency, status,
+bytes, retries), http_cache.py (cache hits and evictions), records.py (records written) and
+the scripts themselves (stage durations). At the end of a run write_reports() saves
+  metrics/<script>.json   run summary
+  metrics/<script>.prom   Prometheus textfile (node_exporter --collector.textfile.directory)
+
+Usage:
+  import metrics
+  with metrics.stage("crawl"):
+      ...
+  metrics.records_written("founders/*.mdx")
+  metrics.add_metrics_arguments(parser)
+  metrics.write_reports("scrape", args)
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+METRICS_DIR = SCRIPT_DIR / "metrics"
+PREFIX = "devfolio_scraper"
+# Request latency buckets in seconds (Prometheus "le" bounds; +Inf is implicit)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+HELP = {
+    "http_requests_total": ("counter", "HTTP request attempts by host and status (error = no response)"),
+    "http_request_duration_seconds": ("histogram", "HTTP request attempt latency, including the body download"),
+    "http_response_bytes_total": ("counter", "Response body bytes downloaded"),
+    "http_retries_total": ("counter", "Request attempts that were retried, by reason"),
+    "rate_limit_decreases_total": ("counter", "Adaptive rate cuts by host and reason (429, 503, error, latency)"),
+    "cache_lookups_total": ("counter", "HTTP cache lookups by result"),
+    "cache_evictions_total": ("counter", "Pages evicted from the HTTP cache"),
+    "records_written_total": ("counter", "Records written, by output"),
+    "profile_failures_total": ("counter", "Founder profiles that could not be fetched or parsed, by kind"),
+    "stage_duration_seconds": ("gauge", "Wall time of each stage of the run"),
+    "run_duration_seconds": ("gauge", "Wall time of the whole run"),
+    "run_finished_timestamp_seconds": ("gauge", "Unix time the run finished"),
+}
+
+
+class Histogram:
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> list:
+        """[(le, count of observations <= le)], ending with +Inf."""
+        out, running = [], 0
+        for bound, n in zip(self.buckets, self.counts):
+            running += n
+            out.append((f"{bound:g}", running))
+        out.append(("+Inf", self.count))
+        return out
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the q-quantile (max for the overflow bucket)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for le, n in self.cumulative():
+            if n >= rank:
+                return self.max if le == "+Inf" else float(le)
+        return self.max
+
+
+class Metrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.counters = {}
+        self.histograms = {}
+        self.stages = {}
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            if key not in self.histograms:
+                self.histograms[key] = Histogram()
+            self.histograms[key].observe(value)
+
+    @contextmanager
+    def stage(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - t0
+
+    def total(self, name: str, **match) -> float:
+        with self.lock:
+            return sum(
+                v for (n, labels), v in self.counters.items() if n == name and match.items() <= dict(labels).items()
+            )
+
+    def summary(self, script: str) -> dict:
+        finished = time.time()
+        with self.lock:
+            counters = dict(self.counters)
+            histograms = dict(self.histograms)
+            stages = dict(self.stages)
+        http = {}
+        for (name, labels), value in counters.items():
+            labels = dict(labels)
+            host = labels.get("host")
+            if host is None:
+                continue
+            entry = http.setdefault(host, {"requests": 0, "status": {}, "bytes": 0, "retries": {}})
+            if name == "http_requests_total":
+                entry["requests"] += value
+                entry["status"][labels["status"]] = value
+            elif name == "http_response_bytes_total":
+                entry["bytes"] += value
+            elif name == "http_retries_total":
+                entry["retries"][labels["reason"]] = value
+            elif name == "rate_limit_decreases_total":
+                entry.setdefault("rate_cuts", {})[labels["reason"]] = value
+        for (name, labels), hist in histograms.items():
+            host = dict(labels).get("host")
+            if name == "http_request_duration_seconds" and host in http:
+                http[host]["latency_s"] = {
+                    "count": hist.count,
+                    "mean": round(hist.sum / hist.count, 4) if hist.count else None,
+                    "p50_le": hist.quantile(0.5),
+                    "p90_le": hist.quantile(0.9),
+                    "p99_le": hist.quantile(0.99),
+                    "max": round(hist.max, 4),
+                    "buckets": dict(hist.cumulative()),
+                }
+
+        def by_label(metric: str, label: str) -> dict:
+            return {dict(lb)[label]: v for (n, lb), v in counters.items() if n == metric and label in dict(lb)}
+
+        return {
+            "script": script,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "finished": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(finished)),
+            "duration_s": round(finished - self.started, 3),
+            "stages_s": {k: round(v, 3) for k, v in stages.items()},
+            "http": http,
+            "cache": {**by_label("cache_lookups_total", "result"), "evicted": self.total("cache_evictions_total")},
+            "records_written": by_label("records_written_total", "output"),
+        }
+
+    def prometheus(self, script: str) -> str:
+        finished = time.time()
+        with self.lock:
+            samples = {}
+            for (name, labels), value in self.counters.items():
+                samples.setdefault(name, []).append((dict(labels), value))
+            for stage_name, seconds in self.stages.items():
+                samples.setdefault("stage_duration_seconds", []).append(({"stage": stage_name}, seconds))
+            histograms = dict(self.histograms)
+        samples["run_duration_seconds"] = [({}, finished - self.started)]
+        samples["run_finished_timestamp_seconds"] = [({}, finished)]
+
+        def fmt(labels: dict) -> str:
+            labels = {"script": script, **labels}
+            escaped = {k: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for k, v in labels.items()}
+            return "{" + ",".join(f'{k}="{v}"' for k, v in escaped.items()) + "}"
+
+        lines = []
+        for name in HELP:
+            kind, text = HELP[name]
+            full = f"{PREFIX}_{name}"
+            if kind == "histogram":
+                entries = [(dict(lb), h) for (n, lb), h in histograms.items() if n == name]
+                if not entries:
+                    continue
+                lines += [f"# HELP {full} {text}", f"# TYPE {full} histogram"]
+                for labels, hist in entries:
+                    for le, n in hist.cumulative():
+                        lines.append(f"{full}_bucket{fmt({**labels, 'le': le})} {n}")
+                    lines.append(f"{full}_sum{fmt(labels)} {hist.sum:.6f}")
+                    lines.append(f"{full}_count{fmt(labels)} {hist.count}")
+                continue
+            if name not in samples:
+                continue
+            lines += [f"# HELP {full} {text}", f"# TYPE {full} {kind}"]
+            for labels, value in samples[name]:
+                lines.append(f"{full}{fmt(labels)} {value if isinstance(value, int) else f'{value:.6f}'}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Metrics()
+inc = REGISTRY.inc
+observe = REGISTRY.observe
+stage = REGISTRY.stage
+
+
+def observe_request(host: str, status: int | str, seconds: float, nbytes: int) -> None:
+    """One HTTP attempt, as seen by http_client.request()."""
+    inc("http_requests_total", host=host, status=str(status))
+    observe("http_request_duration_seconds", seconds, host=host)
+    if nbytes:
+        inc("http_response_bytes_total", nbytes, host=host)
+
+
+def records_written(output: str, n: int = 1) -> None:
+    inc("records_written_total", n, output=output)
+
+
+def add_metrics_arguments(parser) -> None:
+    group = parser.add_argument_group("Run metrics")
+    group.add_argument(
+        "--metrics-dir",
+        type=Path,
+        default=METRICS_DIR,
+        help="Where to write <script>.json and <script>.prom at the end of the run (default: metrics/)",
+    )
+    group.add_argument("--no-metrics", action="store_true", help="Do not write the run summary or Prometheus textfile")
+
+
+def write_reports(script: str, args=None) -> None:
+    """Write the JSON run summary and the Prometheus textfile (each via temp file + rename,
+    so a textfile collector never reads half a file)."""
+    if args is not None and getattr(args, "no_metrics", False):
+        return
+    out_dir = Path(getattr(args, "metrics_dir", None) or METRICS_DIR)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for suffix, text in (
+        (".json", json.dumps(REGISTRY.summary(script), indent=2) + "\n"),
+        (".prom", REGISTRY.prometheus(script)),
+    ):
+        path = out_dir / f"{script}{suffix}"
+        tmp = path.with_suffix(suffix + ".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    print("Metrics:", out_dir / f"{script}.json", "+ .prom")
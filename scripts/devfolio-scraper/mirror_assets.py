@@ -0,0 +1,243 @@
+"""
+Mirror the remote images the site renders (project logos, founder profile images) into
+public/mirror/, deduplicated by content hash, with fixed-size thumbnails.
+
+Reads: lib/projects-from-devfolio.json (logo) and content/founders-index.json (profile_image)
+Writes: public/mirror/original/<sha256>.<ext>     the downloaded file, one per distinct content
+        public/mirror/thumb/<sha256>-<size>.webp  square thumbnail (center crop), needs Pillow
+        lib/asset-mirror.json                     remote URL -> local paths, for lib/asset-mirror.ts
+
+Downloads run concurrently through http_client (shared session, retries, adaptive pacing) and
+are streamed to disk while being hashed, so a large image never sits in memory. Two URLs with
+the same bytes share one file. URLs already in the manifest whose file is still on disk are
+skipped, so a rerun only fetches new assets (and only makes thumbnails that are missing, e.g.
+after installing Pillow or changing --size). Without Pillow the originals are still mirrored
+and the manifest has no thumbnails.
+
+Manifest:
+  {"version":1,"thumbSize":96,"assets":{"<url>":{"sha256":"...","bytes":1234,
+   "contentType":"image/png","path":"/mirror/original/<sha256>.png","thumb":"/mirror/thumb/<sha256>-96.webp"}}}
+
+Usage:
+  pip install Pillow            # optional, for thumbnails
+  python mirror_assets.py
+  python mirror_assets.py --workers 16 --size 128
+  python mirror_assets.py --prune   # also delete mirrored files no URL refers to any more
+"""
+import argparse
+import hashlib
+import importlib.util
+import json
+import mimetypes
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import founders_index
+import http_client
+import metrics
+from records import iter_records, write_json_atomic
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+ROOT = SCRIPT_DIR.parent.parent
+PROJECTS_JSON = ROOT / "lib" / "projects-from-devfolio.json"
+MANIFEST_FILE = ROOT / "lib" / "asset-mirror.json"
+MIRROR_DIR = ROOT / "public" / "mirror"
+# URL prefix public/mirror is served under
+MIRROR_URL = "/mirror"
+MANIFEST_VERSION = 1
+DEFAULT_WORKERS = 8
+# Grids render logos and avatars at 48 px; 96 covers 2x screens
+DEFAULT_THUMB_SIZE = 96
+MAX_ASSET_BYTES = 20 * 1024 * 1024
+# Pillow is optional: without it only the originals are mirrored
+HAS_PIL = importlib.util.find_spec("PIL") is not None
+
+
+def collect_urls(projects_json: Path = PROJECTS_JSON, index_file: Path = founders_index.INDEX_FILE) -> set:
+    """Every http(s) project logo and founder profile image the site renders."""
+    candidates = []
+    if projects_json.exists():
+        candidates += [project.get("logo") for project in iter_records(projects_json)]
+    for entry in founders_index.load_index(index_file).values():
+        candidates.append((entry.get("frontmatter") or {}).get("profile_image"))
+    return {url.strip() for url in candidates if isinstance(url, str) and url.strip().startswith(("http://", "https://"))}
+
+
+def extension(url: str, content_type: str | None) -> str:
+    ext = mimetypes.guess_extension(content_type.split(";")[0].strip()) if content_type else None
+    if ext == ".jpe":
+        ext = ".jpg"
+    if ext:
+        return ext
+    suffix = Path(urlsplit(url).path).suffix.lower()
+    return suffix if 1 < len(suffix) <= 5 else ".bin"
+
+
+def download(url: str, original_dir: Path) -> dict:
+    """Stream url to a temp file while hashing it, then move it to <sha256><ext> (or drop it
+    when that content is already mirrored)."""
+    r = http_client.get(url, stream=True)
+    try:
+        r.raise_for_status()
+        content_type = r.headers.get("Content-Type")
+        if content_type and not content_type.startswith("image/"):
+            raise ValueError(f"not an image ({content_type})")
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_name = tempfile.mkstemp(dir=original_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in r.iter_content(64 * 1024):
+                    size += len(chunk)
+                    if size > MAX_ASSET_BYTES:
+                        raise ValueError(f"larger than {MAX_ASSET_BYTES // 2**20} MB")
+                    digest.update(chunk)
+                    f.write(chunk)
+            sha = digest.hexdigest()
+            target = original_dir / f"{sha}{extension(url, content_type)}"
+            if target.exists():
+                os.unlink(tmp_name)
+            else:
+                os.replace(tmp_name, target)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+    finally:
+        r.close()
+    return {"sha256": sha, "bytes": size, "contentType": content_type, "file": target.name}
+
+
+def make_thumbnail(source: Path, target: Path, size: int) -> bool:
+    """Square thumbnail (center crop to size x size) as WebP. False when Pillow is missing
+    or the file is not an image Pillow can read."""
+    if not HAS_PIL:
+        return False
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        with Image.open(source) as im:
+            im = ImageOps.exif_transpose(im)
+            im = im.convert("RGBA" if im.mode in ("RGBA", "LA", "P") else "RGB")
+            thumb = ImageOps.fit(im, (size, size), method=Image.Resampling.LANCZOS)
+            tmp = target.with_suffix(".webp.tmp")
+            thumb.save(tmp, "WEBP", quality=80, method=4)
+            os.replace(tmp, target)
+        return True
+    except (UnidentifiedImageError, OSError) as e:
+        print("No thumbnail for", source.name, "-", e)
+        return False
+
+
+def mirror_one(url: str, previous: dict | None, mirror_dir: Path, size: int) -> dict:
+    """Manifest entry for url, downloading it only when it is not mirrored yet."""
+    original_dir, thumb_dir = mirror_dir / "original", mirror_dir / "thumb"
+    if previous and (original_dir / Path(previous["path"]).name).exists():
+        entry = {**previous, "file": Path(previous["path"]).name}
+        status = "cached"
+    else:
+        entry = download(url, original_dir)
+        status = "downloaded"
+    thumb = thumb_dir / f"{entry['sha256']}-{size}.webp"
+    has_thumb = thumb.exists() or make_thumbnail(original_dir / entry["file"], thumb, size)
+    return {
+        "status": status,
+        "entry": {
+            "sha256": entry["sha256"],
+            "bytes": entry["bytes"],
+            "contentType": entry["contentType"],
+            "path": f"{MIRROR_URL}/original/{entry['file']}",
+            "thumb": f"{MIRROR_URL}/thumb/{thumb.name}" if has_thumb else None,
+        },
+    }
+
+
+def load_manifest(path: Path = MANIFEST_FILE) -> dict:
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    return manifest.get("assets") or {} if manifest.get("version") == MANIFEST_VERSION else {}
+
+
+def prune(mirror_dir: Path, assets: dict) -> int:
+    """Delete mirrored files no manifest entry points at."""
+    keep = {Path(a["path"]).name for a in assets.values()} | {Path(a["thumb"]).name for a in assets.values() if a["thumb"]}
+    removed = 0
+    for sub in ("original", "thumb"):
+        for path in (mirror_dir / sub).glob("*"):
+            if path.name not in keep:
+                path.unlink()
+                removed += 1
+    return removed
+
+
+def mirror(
+    urls: set,
+    mirror_dir: Path = MIRROR_DIR,
+    manifest_file: Path = MANIFEST_FILE,
+    workers: int = DEFAULT_WORKERS,
+    size: int = DEFAULT_THUMB_SIZE,
+    prune_files: bool = False,
+) -> dict:
+    (mirror_dir / "original").mkdir(parents=True, exist_ok=True)
+    (mirror_dir / "thumb").mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(manifest_file)
+    assets = {}
+    counts = {"downloaded": 0, "cached": 0, "failed": 0, "thumbs": 0}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(mirror_one, url, previous.get(url), mirror_dir, size): url for url in sorted(urls)}
+        for i, future in enumerate(as_completed(futures), 1):
+            url = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                counts["failed"] += 1
+                print(i, "/", len(futures), url, "... failed:", e)
+                # Keep serving the copy we already have
+                if url in previous:
+                    assets[url] = previous[url]
+                continue
+            counts[result["status"]] += 1
+            counts["thumbs"] += result["entry"]["thumb"] is not None
+            assets[url] = result["entry"]
+            if result["status"] == "downloaded":
+                print(i, "/", len(futures), url, "->", result["entry"]["path"])
+    counts["distinct_files"] = len({a["sha256"] for a in assets.values()})
+    if prune_files:
+        counts["pruned"] = prune(mirror_dir, assets)
+    write_json_atomic(manifest_file, {"version": MANIFEST_VERSION, "thumbSize": size, "assets": dict(sorted(assets.items()))})
+    metrics.records_written(f"{mirror_dir.name}/original", counts["downloaded"])
+    metrics.records_written(manifest_file.name, len(assets))
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel downloads (default: %(default)s)")
+    parser.add_argument("--size", type=int, default=DEFAULT_THUMB_SIZE, help="Thumbnail edge in pixels (default: %(default)s)")
+    parser.add_argument("--prune", action="store_true", help="Delete mirrored files that no URL refers to any more")
+    http_client.add_rate_arguments(parser)
+    metrics.add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.adaptive:
+        http_client.configure_rate(start_rps=args.workers, max_rps=args.max_rps)
+    if not HAS_PIL:
+        print("Pillow is not installed: mirroring originals only (pip install Pillow for thumbnails).")
+    urls = collect_urls()
+    print("Mirroring", len(urls), "assets into", MIRROR_DIR)
+    with metrics.stage("mirror"):
+        counts = mirror(urls, workers=args.workers, size=args.size, prune_files=args.prune)
+    print("Assets:", counts)
+    if args.adaptive:
+        print("Request rate:", http_client.rate_summary() or "no requests")
+    print("Wrote", MANIFEST_FILE)
+    metrics.write_reports("mirror_assets", args)
+
+
+if __name__ == "__main__":
+    main()
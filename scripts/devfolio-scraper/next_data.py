@@ -0,0 +1,200 @@
+"""
+Locate and read the Next.js __NEXT_DATA__ payload embedded in Devfolio profile pages.
+
+Shared by fetch_devfolio_profile_json.py (founder MDX) and fetch_devfolio_profiles.py
+(social links), so both read the same structured data the same way.
+
+Only four subtrees of the payload are ever used: users, profiles, address and
+userDevfolioStats. extract_users_and_stats() stops walking the parsed tree as soon as all
+four are found; extract_users_and_stats_targeted() skips building the tree at all and
+decodes just those values straight out of the JSON text; extract_users_and_stats_stream()
+does the same while the page is still arriving, holding only a small window of it.
+"""
+import json
+import re
+from typing import Iterable
+
+NEXT_DATA_OPEN = '<script id="__NEXT_DATA__" type="application/json">'
+SCRIPT_CLOSE = "</script>"
+TARGET_KEYS = ("users", "profiles", "address", "userDevfolioStats")
+TARGET_KEY_RE = re.compile(r'"(users|profiles|address|userDevfolioStats)"\s*:\s*')
+MAX_DEPTH = 30
+# Page text kept between chunks while scanning, enough for a marker or key split across two
+STREAM_TAIL = 64
+# A target value bigger than this is skipped instead of buffered
+MAX_VALUE_CHARS = 1024 * 1024
+
+_decoder = json.JSONDecoder()
+
+
+def next_data_json(html: str) -> str | None:
+    """Raw JSON text of the __NEXT_DATA__ script, or None when the page has none."""
+    # Next.js emits the payload at the end of <body>, so search from the end; the payload
+    # itself cannot contain "</script>" (it would end the script), so the first one closes it
+    start = html.rfind(NEXT_DATA_OPEN)
+    if start < 0:
+        return None
+    start += len(NEXT_DATA_OPEN)
+    end = html.find(SCRIPT_CLOSE, start)
+    if end < 0:
+        return None
+    return html[start:end]
+
+
+def _usable(key: str, value) -> bool:
+    if key == "users" or key == "profiles":
+        return isinstance(value, list) and bool(value)
+    if key == "address":
+        return isinstance(value, dict)
+    return value is not None
+
+
+def _take(found: dict, obj: dict) -> None:
+    for key in TARGET_KEYS:
+        if key not in found and key in obj and _usable(key, obj[key]):
+            found[key] = obj[key]
+
+
+def _parts(found: dict):
+    users = found.get("users")
+    return users[0] if users else None, found.get("profiles") or [], found.get("address"), found.get("userDevfolioStats")
+
+
+def extract_users_and_stats(next_data: dict):
+    """Extract users[0], profiles (social), address, userDevfolioStats from Next.js payload.
+    Devfolio structure: queries[].state.data with users, profiles, userDevfolioStats.
+    Each value is the first usable one found; the walk stops once all four are found."""
+    found = {}
+
+    # Prefer dehydratedState.queries[].state.data (Next.js React Query)
+    props = next_data.get("props", {}) or {}
+    page_props = props.get("pageProps", {}) or {}
+    dehydrated = page_props.get("dehydratedState") or {}
+    queries = (dehydrated.get("queries") or []) if isinstance(dehydrated, dict) else []
+    for q in queries:
+        if not isinstance(q, dict):
+            continue
+        state = q.get("state") or {}
+        data = state.get("data") if isinstance(state, dict) else None
+        if data and isinstance(data, dict):
+            _take(found, data)
+        if len(found) == len(TARGET_KEYS):
+            return _parts(found)
+
+    # Anything still missing: depth-first walk of the whole payload, depth-bounded, early exit
+    stack = [(next_data, 0)]
+    while stack and len(found) < len(TARGET_KEYS):
+        o, depth = stack.pop()
+        if depth > MAX_DEPTH:
+            continue
+        if isinstance(o, dict):
+            _take(found, o)
+            children = o.values()
+        elif isinstance(o, list):
+            children = o
+        else:
+            continue
+        # Reversed so the stack pops children in document order
+        stack.extend((v, depth + 1) for v in reversed(list(children)) if isinstance(v, (dict, list)))
+    return _parts(found)
+
+
+def extract_users_and_stats_targeted(payload: str):
+    """Same result shape as extract_users_and_stats, straight from the __NEXT_DATA__ JSON text.
+    Finds each target key in the text and decodes only its value, so the rest of the payload is
+    never turned into Python objects. Keys are taken in document order (first usable wins)."""
+    found = {}
+    for m in TARGET_KEY_RE.finditer(payload):
+        key = m.group(1)
+        # A key inside a JSON string would have its quotes escaped (\"users\")
+        if key in found or (m.start() > 0 and payload[m.start() - 1] == "\\"):
+            continue
+        try:
+            value, _ = _decoder.raw_decode(payload, m.end())
+        except json.JSONDecodeError:
+            continue
+        if _usable(key, value):
+            found[key] = value
+            if len(found) == len(TARGET_KEYS):
+                break
+    return _parts(found)
+
+
+def extract_users_and_stats_stream(chunks: Iterable[str]):
+    """extract_users_and_stats_targeted for a page that arrives in chunks (e.g. a streamed
+    response body). Text before __NEXT_DATA__ and between the target values is dropped as it
+    goes, so memory is one chunk plus the values being decoded, however large the page is.
+    Stops reading once all four are found or the payload ends. None when there is no payload."""
+    chunks = iter(chunks)
+    buf = ""
+    for chunk in chunks:
+        buf += chunk
+        start = buf.find(NEXT_DATA_OPEN)
+        if start >= 0:
+            buf = buf[start + len(NEXT_DATA_OPEN) :]
+            break
+        buf = buf[-(len(NEXT_DATA_OPEN) - 1) :]
+    else:
+        return None
+
+    found = {}
+    pos = 0
+    ended = False
+    while len(found) < len(TARGET_KEYS):
+        if not ended:
+            end = buf.find(SCRIPT_CLOSE)
+            if end >= 0:
+                buf, ended = buf[:end], True
+        m = TARGET_KEY_RE.search(buf, pos)
+        # A match at the very end may be cut off (its value has not arrived yet)
+        if m is not None and (m.end() < len(buf) or ended):
+            key = m.group(1)
+            if key in found or (m.start() > 0 and buf[m.start() - 1] == "\\"):
+                pos = m.end()
+                continue
+            try:
+                value, value_end = _decoder.raw_decode(buf, m.end())
+                # A number or literal at the end of the buffer may continue in the next chunk
+                complete = value_end < len(buf) or ended
+            except json.JSONDecodeError:
+                value, complete = None, ended or len(buf) - m.end() > MAX_VALUE_CHARS
+                if complete:
+                    # Invalid or too big: move past it, as the targeted parse does
+                    pos = m.end()
+                    continue
+            if complete:
+                if _usable(key, value):
+                    found[key] = value
+                # Later keys may sit inside this value, so keep scanning from its start
+                pos = m.end()
+                continue
+            keep = m.start() - 1
+        elif ended:
+            break
+        else:
+            keep = max(pos, len(buf) - STREAM_TAIL) - 1
+        chunk = next(chunks, None)
+        if chunk is None:
+            ended = True
+            continue
+        # Everything before keep has been scanned and is not part of a pending value
+        keep = max(0, keep)
+        buf, pos = buf[keep:] + chunk, max(0, pos - keep)
+    return _parts(found)
+
+
+def social_from_profiles(profiles: list) -> dict:
+    out = {}
+    for p in profiles or []:
+        if not isinstance(p, dict):
+            continue
+        # Support both url/link and value/name (readme-md.json API shape)
+        url = (p.get("url") or p.get("link") or p.get("value") or "").strip()
+        kind = (p.get("type") or p.get("platform") or p.get("name") or "").lower()
+        if "github" in kind or "github.com" in url:
+            out["github"] = url or None
+        if "twitter" in kind or "x.com" in url or "twitter.com" in url:
+            out["twitter"] = url or None
+        if "linkedin" in kind:
+            out["linkedin"] = url or None
+    return out
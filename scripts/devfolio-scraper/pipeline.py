@@ -0,0 +1,321 @@
+"""
+Run the Devfolio pipeline, skipping stages whose inputs have not changed since their last run.
+
+Stages, in order:
+  scrape     scrape.py --incremental     -> all_projects.json
+  transform  transform_to_data.py        all_projects.json -> lib/projects-from-devfolio.json
+  profiles   fetch_devfolio_profile_json founders in projects-from-devfolio.json -> content/founders/*.mdx + profile_links.json
+  merge      merge_profile_links.py      profile_links.json -> lib/projects-from-devfolio.json
+  assets     mirror_assets.py            logos + profile images -> public/mirror/ + lib/asset-mirror.json
+
+Every stage declares its input files and its own code; their SHA-256 hashes are recorded in
+.pipeline_state.json after it succeeds, and a stage is rerun only when one of them changed or an
+output is missing. The profiles stage tracks founders instead of a file: when only new founders
+appeared it crawls just those (with --retry-window 0, so a partial run never waits on
+failures). A founder whose profile failed (failure_journal.py) counts as new again once its
+retry is due, so a later run retries it; permanent failures (404, ...) are left to a full
+crawl. Founders already crawled are rotated like refresh_daemon.py does: each run also
+re-fetches up to --rotation-budget of them (default 25) whose profile is --rotation-days old
+(default 7), oldest first, so profile stats do not go stale between full crawls. The time of each
+founder's last fetch is kept with the stage state (the MDX mtime until then). The scrape always
+runs (its input is Devfolio itself), but incrementally, so it stops after a few unchanged pages.
+
+With --store the stages hand records over through the SQLite store (store.py) instead of the
+JSON files, each upserting only what changed, and a final export stage writes the app's JSON.
+Store inputs are fingerprinted by the version of the table they read, not a file hash:
+  scrape     scrape.py --incremental --store                 -> raw_projects
+  transform  transform_to_data.py --store   raw_projects     -> projects
+  profiles   fetch_devfolio_profile_json --store  projects   -> content/founders/*.mdx + profile_links
+  merge      merge_profile_links.py --store projects, profile_links -> projects.merged
+  export     store.py export                projects, profile_links -> lib/projects-from-devfolio.json + profile_links.json
+  assets     mirror_assets.py               as above, from the exported JSON
+
+Usage:
+  python pipeline.py                    # refresh; up-to-date stages are skipped
+  python pipeline.py --dry-run          # show what would run
+  python pipeline.py --no-scrape        # reuse all_projects.json as it is
+  python pipeline.py --force profiles   # rerun a stage in full (or --force all)
+  python pipeline.py --rotation-budget 0    # crawl only new founders, no rotation
+  python pipeline.py --store            # same stages through devfolio.sqlite3
+"""
+import argparse
+import hashlib
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from directory_index import DIRECTORY_DIR
+from failure_journal import FailureJournal
+from fetch_devfolio_profile_json import CONTENT_FOUNDERS, PROFILE_LINKS, PROJECTS_JSON, founder_usernames
+from founders_index import INDEX_FILE as FOUNDERS_INDEX
+from identity import IDENTITY_FILE
+from mirror_assets import MANIFEST_FILE as ASSET_MANIFEST
+from records import write_json_atomic
+from refresh_daemon import DEFAULT_ROTATION_DAYS, last_refreshed
+from store import STORE_FILE, RecordStore
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+STATE_FILE = SCRIPT_DIR / ".pipeline_state.json"
+ALL_PROJECTS = SCRIPT_DIR / "all_projects.json"
+# The site reads the listing and detail shards, so the stages that write them list it as an output
+DIRECTORY_LISTING = DIRECTORY_DIR / "listing.json"
+# Already-crawled founders re-fetched per run once their profile is --rotation-days old
+DEFAULT_ROTATION_BUDGET = 25
+
+
+class Stage(NamedTuple):
+    name: str
+    script: str
+    args: list
+    # Paths, or "store:<table>" for a table of the record store
+    inputs: list
+    outputs: list
+    # Other modules the script imports; a change to any of them reruns the stage
+    code: tuple = ()
+    always: bool = False
+    # Record keys (e.g. founder usernames) for stages that can run on only the new ones
+    records: Callable[[], set] | None = None
+    # Extra arguments for such a partial run
+    partial_args: tuple = ()
+
+
+class Rotation(NamedTuple):
+    # Seconds after which a record counts as stale, and how many stale ones one run refreshes
+    max_age: float
+    budget: int
+
+
+# Same in both modes: it reads the final JSON either way
+ASSETS_STAGE = Stage(
+    "assets", "mirror_assets.py", [], [PROJECTS_JSON, FOUNDERS_INDEX], [ASSET_MANIFEST], ("http_client.py", "founders_index.py", "records.py")
+)
+
+
+def fetched_founders(founders: set) -> set:
+    """Founders minus those whose profile is still failing and not due for a retry yet. A due
+    failure is never in the done set of a previous run, so it shows up as new; a permanent one
+    (or one past MAX_ATTEMPTS) counts as done."""
+    journal = FailureJournal()
+    return founders - (set(journal.retryable()) - set(journal.due()))
+
+
+def stale_records(previous: dict, records: set, rotation: Rotation, now: float) -> list:
+    """The rotation.budget records fetched longest ago, among those older than rotation.max_age.
+    Failures in the journal are left to their own retry schedule."""
+    if rotation.budget <= 0:
+        return []
+    failing = FailureJournal().entries
+    state = {"refreshed": previous.get("refreshed") or {}}
+    ages = [(last_refreshed(state, key), key) for key in records if key not in failing]
+    return [key for since, key in sorted(ages) if now - since >= rotation.max_age][: rotation.budget]
+
+
+def file_founder_usernames() -> set:
+    return fetched_founders(founder_usernames())
+
+
+STAGES = [
+    Stage("scrape", "scrape.py", ["--incremental"], [], [ALL_PROJECTS], ("http_client.py", "records.py"), always=True),
+    Stage("transform", "transform_to_data.py", ["--input", str(ALL_PROJECTS)], [ALL_PROJECTS], [PROJECTS_JSON], ("records.py",)),
+    Stage(
+        "profiles",
+        "fetch_devfolio_profile_json.py",
+        [],
+        [],
+        [PROFILE_LINKS, CONTENT_FOUNDERS, IDENTITY_FILE],
+        ("fetch_devfolio_profiles.py", "next_data.py", "http_client.py", "http_cache.py", "identity.py", "failure_journal.py", "founder_mdx.py"),
+        records=file_founder_usernames,
+        partial_args=("--retry-window", "0"),
+    ),
+    Stage("merge", "merge_profile_links.py", [], [PROJECTS_JSON, PROFILE_LINKS, IDENTITY_FILE], [PROJECTS_JSON, DIRECTORY_LISTING], ("identity.py", "changeset.py", "directory_index.py")),
+    ASSETS_STAGE,
+]
+
+
+def store_founder_usernames() -> set:
+    with RecordStore() as store:
+        return fetched_founders(founder_usernames(store.iter_projects(), store.profile_links()))
+
+
+STORE_STAGES = [
+    Stage("scrape", "scrape.py", ["--incremental", "--store"], [], [STORE_FILE], ("http_client.py", "records.py", "store.py"), always=True),
+    Stage("transform", "transform_to_data.py", ["--store"], ["store:raw_projects"], [STORE_FILE], ("records.py", "store.py")),
+    Stage(
+        "profiles",
+        "fetch_devfolio_profile_json.py",
+        ["--store"],
+        [],
+        [STORE_FILE, CONTENT_FOUNDERS, IDENTITY_FILE],
+        ("fetch_devfolio_profiles.py", "next_data.py", "http_client.py", "http_cache.py", "identity.py", "failure_journal.py", "founder_mdx.py", "store.py"),
+        records=store_founder_usernames,
+        partial_args=("--retry-window", "0"),
+    ),
+    Stage(
+        "merge",
+        "merge_profile_links.py",
+        ["--store"],
+        ["store:projects", "store:profile_links", IDENTITY_FILE],
+        [STORE_FILE],
+        ("identity.py", "store.py"),
+    ),
+    Stage("export", "store.py", ["export"], ["store:projects", "store:profile_links"], [PROJECTS_JSON, PROFILE_LINKS, DIRECTORY_LISTING], ("records.py", "changeset.py", "directory_index.py")),
+    ASSETS_STAGE,
+]
+STAGE_NAMES = [stage.name for stage in STORE_STAGES]
+
+
+def file_hash(path: Path) -> str | None:
+    if not path.exists():
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def code_hash(stage: Stage) -> str:
+    digest = hashlib.sha256()
+    for name in [stage.script, *stage.code]:
+        digest.update(name.encode("utf-8"))
+        digest.update((file_hash(SCRIPT_DIR / name) or "").encode("utf-8"))
+    return digest.hexdigest()
+
+
+def input_key(source) -> str:
+    return source if isinstance(source, str) else str(source.relative_to(SCRIPT_DIR.parent.parent))
+
+
+def input_hash(source) -> str | int | None:
+    if isinstance(source, str):
+        table = source.removeprefix("store:")
+        if not STORE_FILE.exists():
+            return None
+        with RecordStore() as store:
+            return store.version(table)
+    return file_hash(source)
+
+
+def fingerprint(stage: Stage) -> dict:
+    return {"code": code_hash(stage), "inputs": {input_key(source): input_hash(source) for source in stage.inputs}}
+
+
+def load_state() -> dict:
+    if not STATE_FILE.exists():
+        return {}
+    with open(STATE_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def plan(stage: Stage, previous: dict | None, force: bool, rotation: Rotation | None = None) -> tuple[str, str, list]:
+    """Decide how to run a stage: (action, reason, extra args), action being run/partial/skip.
+    A record stage runs on its new records plus, with a rotation, the stalest of the old ones."""
+    if force:
+        return "run", "forced", []
+    if previous is None:
+        return "run", "never run", []
+    if stage.always:
+        return "run", "always runs", []
+    if any(not path.exists() for path in stage.outputs):
+        return "run", "output missing", []
+    current = fingerprint(stage)
+    if current["code"] != previous.get("code"):
+        return "run", "code changed", []
+    if current["inputs"] != previous.get("inputs"):
+        return "run", "inputs changed", []
+    if stage.records is not None:
+        try:
+            records = stage.records()
+        except FileNotFoundError:
+            return "run", "no records yet", []
+        new = sorted(records - set(previous.get("records") or []))
+        stale = stale_records(previous, records - set(new), rotation, time.time()) if rotation else []
+        if new or stale:
+            shown = " ".join(new[:10]) + (" ..." if len(new) > 10 else "")
+            parts = ([f"{len(new)} new record(s): {shown}"] if new else []) + ([f"{len(stale)} stale"] if stale else [])
+            reason = ", ".join(parts)
+            return "partial", reason, [*stage.partial_args, *new, *stale]
+    return "skip", "up to date", []
+
+
+def run_stage(stage: Stage, extra: list) -> None:
+    cmd = [sys.executable, stage.script, *stage.args, *extra]
+    subprocess.run(cmd, cwd=SCRIPT_DIR, check=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--force",
+        action="append",
+        default=[],
+        choices=STAGE_NAMES + ["all"],
+        help="Rerun this stage in full even if it is up to date (repeatable)",
+    )
+    parser.add_argument("--no-scrape", action="store_true", help="Skip the scrape and use all_projects.json as it is")
+    parser.add_argument("--dry-run", action="store_true", help="Only print which stages would run")
+    parser.add_argument("--store", action="store_true", help=f"Pass records between stages through {STORE_FILE.name}")
+    parser.add_argument(
+        "--rotation-days",
+        type=float,
+        default=DEFAULT_ROTATION_DAYS,
+        help="Re-fetch an already crawled founder once its profile is this old (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--rotation-budget",
+        type=int,
+        default=DEFAULT_ROTATION_BUDGET,
+        help="Stale founders re-fetched per run, oldest first; 0 turns the rotation off (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    rotation = Rotation(args.rotation_days * 86400, args.rotation_budget)
+
+    stages = STORE_STAGES if args.store else STAGES
+    state = load_state()
+    # File and store runs fingerprint different inputs, so they keep separate entries
+    prefix = "store:" if args.store else ""
+    force = set(STAGE_NAMES if "all" in args.force else args.force)
+    started = time.perf_counter()
+    for i, stage in enumerate(stages, 1):
+        label = f"[{i}/{len(stages)}] {stage.name}"
+        if stage.name == "scrape" and args.no_scrape and stage.name not in force:
+            print(label, "skipped (--no-scrape)")
+            continue
+        previous = state.get(prefix + stage.name)
+        action, reason, extra = plan(stage, previous, stage.name in force, rotation)
+        print(label, reason if action == "skip" else f"running ({reason})")
+        if action == "skip" or args.dry_run:
+            continue
+
+        t0 = time.perf_counter()
+        try:
+            run_stage(stage, extra)
+        except subprocess.CalledProcessError as e:
+            print(label, "failed; later stages not run.")
+            sys.exit(e.returncode or 1)
+        # Hashes are taken after the run: a stage that rewrites one of its inputs (merge) must
+        # not look stale because of its own write
+        entry = fingerprint(stage)
+        if stage.records is not None:
+            done = stage.records()
+            fetched = done & set(extra) if action == "partial" else done
+            if action == "partial":
+                done |= set(previous.get("records") or [])
+            entry["records"] = sorted(done)
+            refreshed = {key: t for key, t in ((previous or {}).get("refreshed") or {}).items() if key in done}
+            finished = time.time()
+            refreshed.update((key, finished) for key in fetched)
+            entry["refreshed"] = refreshed
+        entry["finished"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        state[prefix + stage.name] = entry
+        write_json_atomic(STATE_FILE, state)
+        print(label, f"done in {time.perf_counter() - t0:.1f}s")
+
+    print(f"Pipeline finished in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
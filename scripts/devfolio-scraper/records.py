@@ -0,0 +1,61 @@
+"""
+Read and write the record files passed between pipeline stages.
+
+A file ending in .ndjson holds one JSON record per line and is read and written one record
+at a time. Any other file is a JSON array. Arrays are also written record by record, with
+output byte-identical to json.dump(records, f, indent=2), so lib/projects-from-devfolio.json
+stays exactly what lib/data.ts imports today. Writes go to a temp file renamed over the
+target, so readers never see half a file.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import metrics
+
+
+def is_ndjson(path: Path) -> bool:
+    return Path(path).suffix == ".ndjson"
+
+
+def iter_records(path: Path) -> Iterator:
+    """Yield the records of a JSON array file or an NDJSON file (the latter in constant memory)."""
+    with open(path, encoding="utf-8") as f:
+        if is_ndjson(path):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
+
+def write_json_atomic(path: Path, data, indent: int | None = 2) -> None:
+    """Write JSON to a temp file and rename over path, so readers never see half a file."""
+    tmp = Path(path).with_suffix(Path(path).suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=indent)
+    os.replace(tmp, path)
+
+
+def write_records(path: Path, records: Iterable, indent: int = 2) -> int:
+    """Stream records to path (NDJSON or JSON array by suffix); returns how many were written."""
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    count = 0
+    with open(tmp, "w", encoding="utf-8") as f:
+        if is_ndjson(path):
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+                count += 1
+        else:
+            pad = " " * indent
+            for record in records:
+                f.write("[\n" if count == 0 else ",\n")
+                # Nested lines carry one extra level, as json.dump does for array items
+                f.write(pad + json.dumps(record, indent=indent).replace("\n", "\n" + pad))
+                count += 1
+            f.write("\n]" if count else "[]")
+    os.replace(tmp, path)
+    metrics.records_written(path.name, count)
+    return count
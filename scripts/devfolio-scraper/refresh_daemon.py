@@ -0,0 +1,281 @@
+"""
+Keep the Devfolio data fresh from one long-running process instead of periodic full refreshes.
+
+Every --tick seconds the daemon:
+  1. re-scrapes the search API incrementally when --scrape-interval has passed, and when projects
+     were added or changed, runs the transform and the merge (lib/projects-from-devfolio.json)
+  2. refreshes at most --budget founder profiles, the most urgent first:
+       new       founders without an MDX yet
+       changed   founders of projects the scrape itself added or changed
+       retry     profiles in the failure journal that are due again
+       rotation  everyone else, oldest refresh first, once it is --rotation-days old
+  3. writes what the crawl found right away: founder MDX (merged, only when changed),
+     profile_links.json (only the fetched users), the founder index and the merged project list
+
+All requests go through http_client's one session and adaptive limiter, which live as long as
+the daemon, so connections stay warm and the learned request rate carries over between ticks.
+The load on Devfolio is at most --budget profile pages per tick plus the scrape.
+
+State (when each founder was last refreshed, pending changed founders, last scrape) is kept in
+.refresh_state.json, so a restart carries on where it stopped.
+Founders never refreshed by the daemon count from the time of their MDX file.
+
+Usage:
+  python refresh_daemon.py                                # run until Ctrl-C / SIGTERM
+  python refresh_daemon.py --once                         # one tick, e.g. from cron
+  python refresh_daemon.py --tick 60 --budget 10 --scrape-interval 1800 --rotation-days 7
+"""
+import argparse
+import heapq
+import json
+import os
+import signal
+import threading
+import time
+from pathlib import Path
+
+import failure_journal
+import fetch_devfolio_profile_json as crawler
+import founders_index
+import http_cache
+import http_client
+import identity
+import merge_profile_links
+import metrics
+import mirror_assets
+import scrape
+import transform_to_data
+from records import write_json_atomic
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+STATE_FILE = SCRIPT_DIR / ".refresh_state.json"
+DEFAULT_TICK = 60.0
+DEFAULT_BUDGET = 10
+DEFAULT_SCRAPE_INTERVAL = 1800.0
+DEFAULT_ROTATION_DAYS = 7.0
+# Queue tiers, most urgent first
+NEW, CHANGED, RETRY, ROTATION = range(4)
+TIER_NAMES = ("new", "changed", "retry", "rotation")
+
+
+def load_state(path: Path = STATE_FILE) -> dict:
+    state = {}
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    state.setdefault("refreshed", {})
+    state.setdefault("changed", [])
+    state.setdefault("last_scrape", 0.0)
+    return state
+
+
+def founders_of(projects: list, identities: identity.Identities) -> set:
+    return identities.usernames(identity.founder_keys(projects))
+
+
+def note_project_changes(state: dict, project_ids: set, identities: identity.Identities) -> int:
+    """Queue the founders of the projects the scrape added or changed. project_ids are
+    scrape.project_id() keys (uuid, else slug), which the transform keeps as id / slug."""
+    if not project_ids:
+        return 0
+    with open(crawler.PROJECTS_JSON, encoding="utf-8") as f:
+        projects = [p for p in json.load(f) if p.get("id") in project_ids or p.get("slug") in project_ids]
+    changed = founders_of(projects, identities)
+    state["changed"] = sorted(set(state["changed"]) | changed)
+    return len(changed)
+
+
+def last_refreshed(state: dict, username: str) -> float:
+    """When the daemon last fetched username, else the time of its MDX (0 when there is none)."""
+    if username in state["refreshed"]:
+        return state["refreshed"][username]
+    try:
+        return (crawler.CONTENT_FOUNDERS / f"{username}.mdx").stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+def refresh_queue(
+    founders: set, state: dict, journal: failure_journal.FailureJournal, now: float, rotation_seconds: float
+) -> list[tuple[int, float, str]]:
+    """(tier, last refreshed, username) for every founder that needs a refresh, as a heap."""
+    due = set(journal.due(now))
+    changed = set(state["changed"])
+    queue = []
+    for username in founders:
+        # A failing profile waits for its backoff, whatever its tier
+        if username in journal.entries and username not in due and username in journal.retryable():
+            continue
+        since = last_refreshed(state, username)
+        if not (crawler.CONTENT_FOUNDERS / f"{username}.mdx").exists():
+            tier = NEW
+        elif username in changed:
+            tier = CHANGED
+        elif username in due:
+            tier = RETRY
+        elif now - since >= rotation_seconds:
+            tier = ROTATION
+        else:
+            continue
+        queue.append((tier, since, username))
+    heapq.heapify(queue)
+    return queue
+
+
+class RefreshDaemon:
+    def __init__(self, args):
+        self.args = args
+        self.state_file = args.state
+        self.state = load_state(self.state_file)
+        self.journal = failure_journal.FailureJournal(args.journal)
+        # The crawler's own options, so a tick crawls exactly like fetch_devfolio_profile_json.py
+        self.crawl_args = crawler.parse_args(
+            ["--concurrency", str(args.concurrency), "--base-url", args.base_url, "--retry-window", "0", "--no-metrics"]
+            + ([] if args.adaptive else ["--no-adaptive"])
+        )
+        self.identity_file = self.crawl_args.identity
+        self.cache = None
+        self.stop = threading.Event()
+        self.ticks = 0
+
+    def scrape_due(self, now: float) -> bool:
+        return now - self.state["last_scrape"] >= self.args.scrape_interval
+
+    def scrape(self) -> set:
+        """Incremental scrape; transform + merge when it found anything. Returns the ids of the
+        projects it added or changed."""
+        first = not scrape.OUTPUT_FILE.exists()
+        with metrics.stage("scrape"):
+            count, added, changed, complete = scrape.scrape_file(scrape.OUTPUT_FILE, incremental=True, workers=self.args.scrape_workers)
+            scrape.clear_checkpoint()
+        self.state["last_scrape"] = time.time()
+        print(f"Scrape: {count} projects, {len(added)} added, {len(changed)} changed" + ("" if complete else " (incomplete)"))
+        if not (added or changed) and crawler.PROJECTS_JSON.exists():
+            return set()
+        with metrics.stage("transform"):
+            transform_to_data.main(["--input", str(scrape.OUTPUT_FILE), "--output", str(crawler.PROJECTS_JSON), "--no-metrics"])
+        self.merge()
+        # First scrape: every project is "added"; the new tier and the rotation cover it
+        return set() if first else set(added) | set(changed)
+
+    def merge(self) -> None:
+        if crawler.PROFILE_LINKS.exists():
+            with metrics.stage("merge"):
+                merge_profile_links.main(["--identity", str(self.identity_file), "--no-metrics"])
+
+    def refresh_profiles(self, founders: set, now: float) -> dict:
+        queue = refresh_queue(founders, self.state, self.journal, now, self.args.rotation_days * 86400)
+        batch = [heapq.heappop(queue) for _ in range(min(self.args.budget, len(queue)))]
+        counts = {name: 0 for name in TIER_NAMES}
+        for tier, _, _ in batch:
+            counts[TIER_NAMES[tier]] += 1
+        counts["waiting"] = len(queue)
+        if not batch:
+            return counts
+        usernames = {username for _, _, username in batch}
+        print("Refreshing", len(usernames), "profile(s):", ", ".join(f"{n} {k}" for k, n in counts.items() if n))
+        with metrics.stage("crawl"):
+            links = crawler.crawl(usernames, self.crawl_args, self.cache, self.journal)
+        finished = time.time()
+        fetched = {u for u in usernames if u not in self.journal.entries}
+        for username in fetched:
+            self.state["refreshed"][username] = finished
+        self.state["changed"] = [u for u in self.state["changed"] if u not in fetched]
+        with metrics.stage("write"):
+            crawler.write_profile_links(links, usernames, replace=False)
+            # New handles from the crawl feed the identity graph the merge reads
+            crawler.resolve_founders(identity_file=self.identity_file)
+            founders_index.update_index(crawler.CONTENT_FOUNDERS, crawler.CONTENT_FOUNDERS.parent / founders_index.INDEX_FILE.name)
+        self.merge()
+        if self.args.assets:
+            with metrics.stage("assets"):
+                print("Assets:", mirror_assets.mirror(mirror_assets.collect_urls(), workers=self.args.concurrency))
+        return counts
+
+    def tick(self) -> None:
+        started = time.time()
+        self.ticks += 1
+        project_ids = set()
+        if self.scrape_due(started) or not crawler.PROJECTS_JSON.exists():
+            project_ids = self.scrape()
+        identities, founders = crawler.resolve_founders(identity_file=self.identity_file)
+        queued = note_project_changes(self.state, project_ids, identities)
+        if queued:
+            print("Queued", queued, "founder(s) of changed projects")
+        # Founders that left every project are no longer refreshed
+        self.state["refreshed"] = {u: t for u, t in self.state["refreshed"].items() if u in founders}
+        counts = self.refresh_profiles(founders, started)
+        write_json_atomic(self.state_file, self.state)
+        print(f"Tick {self.ticks} done in {time.time() - started:.1f}s:", counts)
+        if self.args.adaptive:
+            print("Request rate:", http_client.rate_summary() or "no requests")
+        metrics.write_reports("refresh_daemon", self.args)
+
+    def run(self) -> None:
+        crawler.CONTENT_FOUNDERS.mkdir(parents=True, exist_ok=True)
+        if self.args.adaptive:
+            # Configured once: the limiter keeps what it learned for the life of the daemon
+            http_client.configure_rate(start_rps=1.0, max_rps=self.args.max_rps)
+        self.cache = http_cache.cache_from_args(self.args)
+        try:
+            while not self.stop.is_set():
+                started = time.monotonic()
+                try:
+                    self.tick()
+                except Exception as e:
+                    # Devfolio down, a bad page, ...: keep the state and try again next tick
+                    print(f"Tick {self.ticks} failed: {type(e).__name__}: {e}")
+                    if self.args.once:
+                        raise
+                if self.args.once:
+                    break
+                self.stop.wait(max(0.0, self.args.tick - (time.monotonic() - started)))
+        finally:
+            if self.cache is not None:
+                self.cache.close()
+            write_json_atomic(self.state_file, self.state)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tick", type=float, default=DEFAULT_TICK, help="Seconds between ticks (default: %(default)s)")
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET, help="Profiles fetched per tick at most (default: %(default)s)")
+    parser.add_argument(
+        "--scrape-interval",
+        type=float,
+        default=DEFAULT_SCRAPE_INTERVAL,
+        help="Seconds between incremental scrapes of the search API (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--rotation-days",
+        type=float,
+        default=DEFAULT_ROTATION_DAYS,
+        help="Refresh every other founder once their profile is this old (default: %(default)s)",
+    )
+    parser.add_argument("--concurrency", type=int, default=2, help="Profile requests in flight (default: %(default)s)")
+    parser.add_argument("--scrape-workers", type=int, default=scrape.DEFAULT_WORKERS, help="Parallel search requests (default: %(default)s)")
+    parser.add_argument("--assets", action="store_true", help="Also mirror new logos and profile images after each refresh")
+    parser.add_argument("--once", action="store_true", help="Run one tick and exit")
+    parser.add_argument("--base-url", default=crawler.BASE_URL, help="Profile site (default: %(default)s)")
+    parser.add_argument("--search-url", default=scrape.URL, help="Search API (default: %(default)s)")
+    parser.add_argument("--state", type=Path, default=STATE_FILE, help="Daemon state file (default: %(default)s)")
+    parser.add_argument("--journal", type=Path, default=failure_journal.JOURNAL_FILE, help="Failure journal (default: %(default)s)")
+    http_client.add_rate_arguments(parser)
+    http_cache.add_cache_arguments(parser)
+    metrics.add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.cache_only:
+        parser.error("--cache-only would never refresh anything")
+
+    scrape.URL = args.search_url
+    daemon = RefreshDaemon(args)
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        # Finish the current tick, save the state, then exit
+        signal.signal(sig, lambda *_: daemon.stop.set())
+    print(f"Refresh daemon: tick {args.tick:g}s, {args.budget} profiles per tick, scrape every {args.scrape_interval:g}s (pid {os.getpid()})")
+    daemon.run()
+    print("Stopped after", daemon.ticks, "tick(s).")
+
+
+if __name__ == "__main__":
+    main()
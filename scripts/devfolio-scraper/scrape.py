@@ -1,10 +1,40 @@
 """
 Scrape projects from multiple Devfolio hackathons (Base Batch India, Build Onchain FBI,
 Onchain AI BLR, Based India). Output: all_projects.json in this folder.
+
+The search API only pages through the first MAX_OFFSET hits of a query, so the scrape is
+split into shards: one query per hackathon slug, and when a hackathon reports more hits
+than the window, one query per prize track seen in it. Pages of all shards are fetched in
+parallel and every hackathon's collected count is checked against the total the API reports.
+Projects the prize-track shards cannot reach either (no track, or a track that alone exceeds
+the window) fail that check; the output is still written, but the script then exits non-zero
+unless --allow-incomplete is given, so pipeline.py does not go on with a partial list.
+
+Progress is checkpointed after every page (scrape_checkpoint.json + all_projects.partial.ndjson),
+so an interrupted run resumes with the pages it has not finished instead of from scratch.
+
+Usage:
+  python scrape.py                  # full scrape (resumes automatically after a crash)
+  python scrape.py --incremental    # merge new/changed hits into the existing all_projects.json
+  python scrape.py --restart        # ignore any checkpoint and start from scratch
+  python scrape.py --workers 8      # parallel page requests (default: 4)
+  python scrape.py --no-adaptive    # unpaced page requests (by default AIMD-paced, up to --max-rps)
+  python scrape.py --format ndjson  # all_projects.ndjson, one project per line (streamed to transform)
+  python scrape.py --incremental --store   # upsert new/changed hits into devfolio.sqlite3 instead
+  python scrape.py --allow-incomplete      # exit 0 even when the completeness check fails
 """
-import requests
+import argparse
 import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import NamedTuple
+
+import http_client
+import metrics
+from records import iter_records, write_json_atomic, write_records
+from store import RecordStore, add_store_arguments
 
 URL = "https://api.devfolio.co/api/search/projects"
 HEADERS = {
@@ -21,42 +51,418 @@ HACKATHON_SLUGS = [
     "based-india",
 ]
 
-OUTPUT_FILE = Path(__file__).resolve().parent / "all_projects.json"
+SCRIPT_DIR = Path(__file__).resolve().parent
+OUTPUT_FILE = SCRIPT_DIR / "all_projects.json"
+NDJSON_OUTPUT_FILE = SCRIPT_DIR / "all_projects.ndjson"
+CHECKPOINT_FILE = SCRIPT_DIR / "scrape_checkpoint.json"
+PARTIAL_FILE = SCRIPT_DIR / "all_projects.partial.ndjson"
 PAGE_SIZE = 50
+# Search window: from + size may not go past this many hits for one query
 MAX_OFFSET = 1000
+DEFAULT_WORKERS = 4
+# Incremental mode stops a shard after this many consecutive hits identical to all_projects.json
+DEFAULT_STOP_AFTER_UNCHANGED = 100
+
+
+class Shard(NamedTuple):
+    """One search query: a single hackathon, optionally narrowed to one prize track."""
+
+    slug: str
+    track: str | None = None
+
+    @property
+    def key(self) -> str:
+        return self.slug if self.track is None else f"{self.slug}/{self.track}"
+
+
+def project_id(src: dict) -> str:
+    return src.get("uuid") or src.get("slug") or ""
+
+
+def page_key(shard: Shard, offset: int) -> str:
+    return f"{shard.key}@{offset}"
+
 
-all_projects = []
-seen_ids = set()
+def parse_total(hits: dict) -> int | None:
+    """Total hit count as reported by the search API (int or Elasticsearch {"value": n})."""
+    total = hits.get("total")
+    if isinstance(total, dict):
+        total = total.get("value")
+    return total if isinstance(total, int) else None
 
-for offset in range(0, MAX_OFFSET, PAGE_SIZE):
+
+def fetch_page(shard: Shard, offset: int) -> tuple[list, int | None]:
+    """Return (projects, reported total hits) for one page of one shard."""
     payload = {
-        "hackathon_slugs": HACKATHON_SLUGS,
+        "hackathon_slugs": [shard.slug],
         "q": "",
         "filter": "all",
         "prizes": [],
-        "prize_tracks": [],
+        "prize_tracks": [shard.track] if shard.track else [],
         "tracks": [],
         "category": [],
         "hashtags": [],
         "from": offset,
         "size": PAGE_SIZE,
     }
-    res = requests.post(URL, json=payload, headers=HEADERS)
+    res = http_client.post(URL, json=payload, headers=HEADERS)
+    res.raise_for_status()
     data = res.json()
     hits = data.get("hits") or {}
-    projects = hits.get("hits", []) if isinstance(hits, dict) else []
-    if not projects:
-        break
-    for item in projects:
-        src = item.get("_source") or item
-        pid = src.get("uuid") or src.get("slug") or ""
-        if pid and pid not in seen_ids:
-            seen_ids.add(pid)
-            all_projects.append(src)
-    print("Collected:", len(all_projects))
-
-with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-    json.dump(all_projects, f, indent=2)
-
-print("Final count:", len(all_projects))
-print("Saved to:", OUTPUT_FILE)
+    if not isinstance(hits, dict):
+        return [], None
+    return [item.get("_source") or item for item in hits.get("hits", [])], parse_total(hits)
+
+
+class ScrapeState:
+    """Everything a run has collected so far. Shared by the worker threads and saved as the
+    checkpoint after every page."""
+
+    def __init__(self, mode: str, existing: dict, stop_after_unchanged: int):
+        self.mode = mode
+        self.existing = existing
+        self.stop_after_unchanged = stop_after_unchanged
+        self.lock = threading.Lock()
+        self.seen = set()
+        # (sort key, byte offset in PARTIAL_FILE): records stay on disk until the output is
+        # written, and the output order does not depend on which page finished first
+        self.fetched = []
+        self.done = set()
+        self.totals = {}
+        self.tracks = {}
+        self.ids_by_slug = {}
+        self.streaks = {}
+        self.stopped = set()
+        self.complete = True
+
+    def limit(self, shard: Shard) -> int:
+        """How far this shard can be paged: its reported total, capped by the search window."""
+        total = self.totals.get(shard.key)
+        return MAX_OFFSET if total is None else min(total, MAX_OFFSET)
+
+    def record_page(self, shard: Shard, offset: int, records: list, total: int | None) -> None:
+        with self.lock:
+            if offset == 0:
+                self.totals[shard.key] = total
+            slug_ids = self.ids_by_slug.setdefault(shard.slug, set())
+            shard_tracks = self.tracks.setdefault(shard.key, set())
+            new_records = []
+            for pos, src in enumerate(records):
+                pid = project_id(src)
+                if not pid:
+                    continue
+                slug_ids.add(pid)
+                for t in src.get("prize_tracks") or []:
+                    if isinstance(t, dict) and t.get("name"):
+                        shard_tracks.add(t["name"])
+                if pid in self.seen:
+                    continue
+                self.seen.add(pid)
+                if self.existing:
+                    if self.existing.get(pid) == src:
+                        self.streaks[shard.key] = self.streaks.get(shard.key, 0) + 1
+                        continue
+                    self.streaks[shard.key] = 0
+                order = [HACKATHON_SLUGS.index(shard.slug), shard.track or "", offset, pos]
+                new_records.append((order, src))
+            if self.existing and self.streaks.get(shard.key, 0) >= self.stop_after_unchanged:
+                self.stopped.add(shard.key)
+            # Append the page before the checkpoint: a crash in between only re-fetches this page
+            with open(PARTIAL_FILE, "ab") as f:
+                for order, src in new_records:
+                    self.fetched.append((order, f.tell()))
+                    f.write((json.dumps({"order": order, "project": src}) + "\n").encode("utf-8"))
+            self.done.add(page_key(shard, offset))
+            self.save_checkpoint()
+
+    def save_checkpoint(self) -> None:
+        write_json_atomic(
+            CHECKPOINT_FILE,
+            {
+                "mode": self.mode,
+                "done": sorted(self.done),
+                "totals": self.totals,
+                "tracks": {k: sorted(v) for k, v in self.tracks.items()},
+                "ids_by_slug": {k: sorted(v) for k, v in self.ids_by_slug.items()},
+                "streaks": self.streaks,
+                "stopped": sorted(self.stopped),
+                "seen": sorted(self.seen),
+            },
+            indent=None,
+        )
+
+    def load_checkpoint(self) -> bool:
+        """Restore a previous interrupted run of the same mode; returns False if there is none."""
+        if not CHECKPOINT_FILE.exists():
+            return False
+        with open(CHECKPOINT_FILE, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("mode") != self.mode or "done" not in checkpoint:
+            print("Ignoring checkpoint from a different kind of run.")
+            return False
+        self.done = set(checkpoint["done"])
+        self.totals = checkpoint.get("totals") or {}
+        self.tracks = {k: set(v) for k, v in (checkpoint.get("tracks") or {}).items()}
+        self.ids_by_slug = {k: set(v) for k, v in (checkpoint.get("ids_by_slug") or {}).items()}
+        self.streaks = checkpoint.get("streaks") or {}
+        self.stopped = set(checkpoint.get("stopped") or [])
+        self.seen = set(checkpoint.get("seen") or [])
+        fetched = {}
+        if PARTIAL_FILE.exists():
+            with open(PARTIAL_FILE, "rb") as f:
+                pos = 0
+                for line in f:
+                    start, pos = pos, pos + len(line)
+                    if not line.strip():
+                        continue
+                    try:
+                        row = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn last line from a crash mid-append; that page is re-fetched
+                        break
+                    # Records past the checkpoint (crash between append and save) are re-fetched
+                    pid = project_id(row["project"])
+                    if pid in self.seen:
+                        fetched[pid] = (row["order"], start)
+        self.fetched = list(fetched.values())
+        return True
+
+    def projects(self):
+        """Yield the collected projects in output order, reading each back from PARTIAL_FILE."""
+        if not self.fetched:
+            return
+        with open(PARTIAL_FILE, "rb") as f:
+            for _, start in sorted(self.fetched, key=lambda item: item[0]):
+                f.seek(start)
+                yield json.loads(f.readline())["project"]
+
+
+def clear_checkpoint() -> None:
+    for path in (CHECKPOINT_FILE, PARTIAL_FILE):
+        if path.exists():
+            path.unlink()
+
+
+def fetch_pages(pool: ThreadPoolExecutor, state: ScrapeState, jobs: list) -> None:
+    """Fetch (shard, offset) pages in parallel, skipping pages a previous run already finished."""
+    futures = {
+        pool.submit(fetch_page, shard, offset): (shard, offset)
+        for shard, offset in jobs
+        if page_key(shard, offset) not in state.done
+    }
+    for future in as_completed(futures):
+        shard, offset = futures[future]
+        records, total = future.result()
+        state.record_page(shard, offset, records, total)
+        print("Collected:", len(state.seen), f"({shard.key} @ {offset})")
+
+
+def walk_shard(state: ScrapeState, shard: Shard) -> None:
+    """Incremental mode: page one shard in order until it runs out or stays unchanged long enough."""
+    offset = 0
+    while offset < state.limit(shard) and shard.key not in state.stopped:
+        if page_key(shard, offset) not in state.done:
+            records, total = fetch_page(shard, offset)
+            state.record_page(shard, offset, records, total)
+            print("Collected:", len(state.seen), "new/changed:", len(state.fetched), f"({shard.key} @ {offset})")
+            if not records:
+                break
+        offset += PAGE_SIZE
+    if shard.key in state.stopped:
+        print("Stopping", shard.key, "early:", state.streaks.get(shard.key), "consecutive unchanged projects.")
+
+
+def split_oversized(state: ScrapeState, shards: list) -> list:
+    """Replace hackathons with more hits than the search window by one shard per prize track."""
+    sub_shards = []
+    for shard in shards:
+        total = state.totals.get(shard.key)
+        if total is None or total <= MAX_OFFSET or shard.key in state.stopped:
+            continue
+        if shard.track is not None:
+            print("Warning:", shard.key, "has", total, "hits, more than the", MAX_OFFSET, "search window.")
+            continue
+        tracks = sorted(state.tracks.get(shard.key) or [])
+        print(shard.key, "has", total, "hits; splitting into", len(tracks), "prize-track shards.")
+        sub_shards.extend(Shard(shard.slug, track) for track in tracks)
+    return sub_shards
+
+
+def report_completeness(state: ScrapeState) -> bool:
+    """Compare unique projects collected per hackathon with the total hit count the API reported."""
+    complete = True
+    for slug in HACKATHON_SLUGS:
+        got = len(state.ids_by_slug.get(slug) or ())
+        total = state.totals.get(slug)
+        if any(key == slug or key.startswith(slug + "/") for key in state.stopped):
+            print(f"  {slug}: {got} seen (stopped early, incremental)")
+        elif total is None:
+            print(f"  {slug}: {got} collected (API reported no total)")
+        elif got < total:
+            complete = False
+            print(f"  {slug}: {got} / {total} collected, MISSING {total - got}")
+        else:
+            print(f"  {slug}: {got} / {total} collected")
+    return complete
+
+
+def merge_incremental(existing: list, fetched: list) -> tuple[list, list, list]:
+    """Replace changed records in place and append new ones; returns (merged, added ids, changed ids)."""
+    index = {project_id(src): i for i, src in enumerate(existing) if project_id(src)}
+    merged = list(existing)
+    added, changed = [], []
+    for src in fetched:
+        pid = project_id(src)
+        if pid in index:
+            if merged[index[pid]] != src:
+                merged[index[pid]] = src
+                changed.append(pid)
+        else:
+            index[pid] = len(merged)
+            merged.append(src)
+            added.append(pid)
+    return merged, added, changed
+
+
+def scrape(
+    stop_after_unchanged: int,
+    restart: bool,
+    workers: int = DEFAULT_WORKERS,
+    existing_list: list | None = None,
+) -> ScrapeState:
+    """Run the scrape. With existing_list (incremental mode) only new or changed hits are
+    collected; state.projects() then yields just those, in scrape order."""
+    existing = {project_id(src): src for src in existing_list or [] if project_id(src)}
+    state = ScrapeState("incremental" if existing else "full", existing, stop_after_unchanged)
+
+    if restart:
+        clear_checkpoint()
+    if state.load_checkpoint():
+        print("Resuming", state.mode, "scrape:", len(state.done), "pages already done,", len(state.seen), "projects seen.")
+    else:
+        clear_checkpoint()
+
+    pending = [Shard(slug) for slug in HACKATHON_SLUGS]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while pending:
+            if existing:
+                # Shards run in parallel, but each pages in order so it can stop early
+                list(pool.map(lambda shard: walk_shard(state, shard), pending))
+            else:
+                # First page of each shard gives its total, then all remaining pages at once
+                fetch_pages(pool, state, [(shard, 0) for shard in pending])
+                fetch_pages(
+                    pool,
+                    state,
+                    [(shard, offset) for shard in pending for offset in range(PAGE_SIZE, state.limit(shard), PAGE_SIZE)],
+                )
+            pending = split_oversized(state, pending)
+
+    print("Completeness check:")
+    state.complete = report_completeness(state)
+    if not state.complete:
+        print("Warning: some projects could not be reached through the search window.")
+
+    return state
+
+
+def scrape_file(
+    output_file: Path,
+    incremental: bool,
+    stop_after_unchanged: int = DEFAULT_STOP_AFTER_UNCHANGED,
+    restart: bool = False,
+    workers: int = DEFAULT_WORKERS,
+) -> tuple[int, list, list, bool]:
+    """Scrape into output_file (JSON or NDJSON by suffix); incremental merges new and changed hits
+    into the file already there. Returns (projects written, added ids, changed ids, complete), ids
+    as in project_id(); a full scrape reports every project as added."""
+    existing_list = []
+    if incremental:
+        if output_file.exists():
+            existing_list = list(iter_records(output_file))
+        else:
+            print("No", output_file.name, "yet; running a full scrape.")
+    with metrics.stage("fetch"):
+        state = scrape(stop_after_unchanged, restart, workers, existing_list)
+    all_projects = state.projects()
+    # Without existing records every hit was collected, so the seen set is exactly what was written
+    added, changed = sorted(state.seen), []
+    if state.existing:
+        all_projects, added, changed = merge_incremental(existing_list, all_projects)
+        print("Incremental merge:", len(added), "added,", len(changed), "changed,", len(all_projects), "total.")
+    with metrics.stage("write"):
+        count = write_records(output_file, all_projects)
+    return count, added, changed, state.complete
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape Devfolio projects into all_projects.json.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Merge only new or changed hits into the existing all_projects.json",
+    )
+    parser.add_argument(
+        "--stop-after-unchanged",
+        type=int,
+        default=DEFAULT_STOP_AFTER_UNCHANGED,
+        help=f"Incremental mode: stop a shard after N consecutive unchanged hits (default: {DEFAULT_STOP_AFTER_UNCHANGED})",
+    )
+    parser.add_argument("--restart", action="store_true", help="Discard any checkpoint and start from scratch")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Parallel page requests (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("json", "ndjson"),
+        default="json",
+        help="all_projects.json (array) or all_projects.ndjson (one project per line)",
+    )
+    parser.add_argument(
+        "--allow-incomplete",
+        action="store_true",
+        help="Exit 0 even when some hits could not be reached through the search window",
+    )
+    http_client.add_rate_arguments(parser)
+    add_store_arguments(parser)
+    metrics.add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.adaptive:
+        http_client.configure_rate(start_rps=args.workers, max_rps=args.max_rps)
+
+    if args.store:
+        with RecordStore(args.store) as store:
+            existing_list = [src for _, src in store.iter_raw_projects()] if args.incremental else []
+            if args.incremental and not existing_list:
+                print("Store is empty; running a full scrape.")
+            with metrics.stage("fetch"):
+                state = scrape(args.stop_after_unchanged, args.restart, args.workers, existing_list)
+            with metrics.stage("write"):
+                if state.existing:
+                    counts = store.upsert_raw_projects(state.projects())
+                else:
+                    counts = store.replace_raw_projects(state.projects())
+            count = store.count("raw_projects")
+        complete = state.complete
+        output_file = args.store
+        print("Store update:", ", ".join(f"{n} {k}" for k, n in counts.items()))
+    else:
+        output_file = NDJSON_OUTPUT_FILE if args.format == "ndjson" else OUTPUT_FILE
+        count, _, _, complete = scrape_file(output_file, args.incremental, args.stop_after_unchanged, args.restart, args.workers)
+    clear_checkpoint()
+
+    print("Final count:", count)
+    print("Saved to:", output_file)
+    if args.adaptive:
+        print("Request rate:", http_client.rate_summary() or "no requests")
+    metrics.write_reports("scrape", args)
+    if not complete and not args.allow_incomplete:
+        sys.exit("Scrape incomplete (see the completeness check); rerun with --allow-incomplete to accept it.")
+
+
+if __name__ == "__main__":
+    main()
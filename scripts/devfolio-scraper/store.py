@@ -0,0 +1,345 @@
+"""
+SQLite record store shared by the pipeline stages (devfolio.sqlite3 next to the scripts).
+
+Tables:
+  raw_projects   scraped search hits, keyed by project uuid (slug indexed), in scrape order
+  projects       transform_to_data output keyed by project id (slug and founder indexed);
+                 merged holds the row after merge_profile_links, NULL until (re)merged
+  profile_links  Twitter/GitHub/LinkedIn per Devfolio username (Twitter handle indexed)
+
+Stages run with --store upsert through it in one transaction each, touching only rows whose
+content changed, so a small refresh costs work proportional to the change and a crash leaves
+the previous state intact. Every change bumps a store-wide version counter; each row and
+table remembers the version of its last change, which is what later stages and pipeline.py
+use to find what is new. The JSON files the app reads are exported from the store at the end.
+
+Usage:
+  python store.py import        # seed from all_projects.json + profile_links.json
+  python store.py export        # write lib/projects-from-devfolio.json + lib/directory/ + changeset + profile_links.json
+  python store.py export --all-projects all_projects.json
+  python store.py stats
+"""
+import argparse
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import metrics
+from changeset import ChangesetWriter, changeset_path
+from directory_index import DirectoryWriter
+from records import iter_records, write_json_atomic, write_records
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+STORE_FILE = SCRIPT_DIR / "devfolio.sqlite3"
+PROJECTS_JSON = SCRIPT_DIR.parent.parent / "lib" / "projects-from-devfolio.json"
+PROFILE_LINKS = SCRIPT_DIR / "profile_links.json"
+ALL_PROJECTS = SCRIPT_DIR / "all_projects.json"
+TABLES = ("raw_projects", "projects", "profile_links")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS raw_projects (
+    uuid TEXT PRIMARY KEY,
+    slug TEXT,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    version INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS raw_projects_slug ON raw_projects (slug);
+CREATE INDEX IF NOT EXISTS raw_projects_version ON raw_projects (version);
+
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    slug TEXT,
+    position INTEGER NOT NULL,
+    founder TEXT,
+    data TEXT NOT NULL,
+    merged TEXT,
+    version INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS projects_slug ON projects (slug);
+CREATE INDEX IF NOT EXISTS projects_founder ON projects (founder);
+CREATE INDEX IF NOT EXISTS projects_position ON projects (position);
+CREATE INDEX IF NOT EXISTS projects_unmerged ON projects (id) WHERE merged IS NULL;
+
+CREATE TABLE IF NOT EXISTS profile_links (
+    username TEXT PRIMARY KEY,
+    twitter TEXT,
+    data TEXT NOT NULL,
+    version INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS profile_links_twitter ON profile_links (twitter);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def encode(record) -> str:
+    return json.dumps(record, ensure_ascii=False)
+
+
+def project_uuid(src: dict) -> str:
+    """Same key scrape.py dedupes on."""
+    return src.get("uuid") or src.get("slug") or ""
+
+
+class RecordStore:
+    def __init__(self, path: Path = STORE_FILE):
+        self.path = Path(path)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA synchronous = NORMAL")
+        self.db.executescript(SCHEMA)
+        self._version = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        self.db.close()
+
+    # --- versions -----------------------------------------------------------------------
+
+    def get_meta(self, key: str) -> str | None:
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value) -> None:
+        self.db.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, str(value)))
+
+    def version(self, table: str | None = None) -> int:
+        """Store version of the last change (to one table, or to anything)."""
+        return int(self.get_meta(f"version:{table}" if table else "version") or 0)
+
+    @contextmanager
+    def transaction(self):
+        """One write transaction; rows changed inside it share a new version number."""
+        self._version = self.version() + 1
+        self._changed = set()
+        try:
+            with self.db:
+                yield self
+                if self._changed:
+                    self.set_meta("version", self._version)
+                    for table in self._changed:
+                        self.set_meta(f"version:{table}", self._version)
+        finally:
+            self._version = None
+
+    def _mark(self, table: str, n: int = 1) -> None:
+        if n:
+            self._changed.add(table)
+            metrics.records_written(f"store:{table}", n)
+
+    # --- raw_projects (scrape.py) ---------------------------------------------------------
+
+    def iter_raw_projects(self, since: int = 0) -> Iterator[tuple[int, dict]]:
+        """(position, search hit) in scrape order, optionally only rows changed after version since."""
+        cur = self.db.execute(
+            "SELECT position, data FROM raw_projects WHERE version > ? ORDER BY position", (since,)
+        )
+        for position, data in cur:
+            yield position, json.loads(data)
+
+    def _upsert_raw(self, src: dict, position: int | None) -> str:
+        """Insert or update one hit; position None keeps an existing row's place (or appends).
+        Returns "added", "changed" or "unchanged"."""
+        uid = project_uuid(src)
+        data = encode(src)
+        row = self.db.execute("SELECT position, data FROM raw_projects WHERE uuid = ?", (uid,)).fetchone()
+        if row is None:
+            if position is None:
+                position = self.db.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM raw_projects").fetchone()[0]
+            self.db.execute(
+                "INSERT INTO raw_projects VALUES (?, ?, ?, ?, ?)", (uid, src.get("slug"), position, data, self._version)
+            )
+            return "added"
+        if row[1] == data and (position is None or row[0] == position):
+            return "unchanged"
+        self.db.execute(
+            "UPDATE raw_projects SET slug = ?, position = ?, data = ?, version = ? WHERE uuid = ?",
+            (src.get("slug"), row[0] if position is None else position, data, self._version, uid),
+        )
+        return "changed"
+
+    def upsert_raw_projects(self, projects: Iterable[dict]) -> dict:
+        """Incremental scrape: update changed hits in place and append new ones."""
+        counts = {"added": 0, "changed": 0, "unchanged": 0}
+        with self.transaction():
+            for src in projects:
+                if project_uuid(src):
+                    counts[self._upsert_raw(src, None)] += 1
+            self._mark("raw_projects", counts["added"] + counts["changed"])
+        return counts
+
+    def replace_raw_projects(self, projects: Iterable[dict]) -> dict:
+        """Full scrape: the hits in this order become the whole table."""
+        counts = {"added": 0, "changed": 0, "unchanged": 0, "removed": 0}
+        with self.transaction():
+            self.db.execute("CREATE TEMP TABLE IF NOT EXISTS seen (uuid TEXT PRIMARY KEY)")
+            self.db.execute("DELETE FROM seen")
+            position = 0
+            for src in projects:
+                uid = project_uuid(src)
+                if not uid:
+                    continue
+                self.db.execute("INSERT OR IGNORE INTO seen VALUES (?)", (uid,))
+                counts[self._upsert_raw(src, position)] += 1
+                position += 1
+            counts["removed"] = self.db.execute(
+                "DELETE FROM raw_projects WHERE uuid NOT IN (SELECT uuid FROM seen)"
+            ).rowcount
+            self._mark("raw_projects", counts["added"] + counts["changed"] + counts["removed"])
+        return counts
+
+    # --- projects (transform_to_data.py, merge_profile_links.py) ------------------------------
+
+    def upsert_projects(self, rows: Iterable[tuple[str, int, dict]]) -> int:
+        """(source uuid, position, transformed project) rows; a changed row is queued for merge
+        again. Projects whose raw hit is gone are deleted. Returns rows changed."""
+        changed = 0
+        with self.transaction():
+            for source, position, out in rows:
+                data = encode(out)
+                founder = (out.get("founderTwitter") or "").strip().lower() or None
+                row = self.db.execute("SELECT data, position FROM projects WHERE id = ?", (out["id"],)).fetchone()
+                if row is not None and row[0] == data and row[1] == position:
+                    continue
+                self.db.execute(
+                    "INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?, ?, NULL, ?)",
+                    (out["id"], source, out.get("slug"), position, founder, data, self._version),
+                )
+                changed += 1
+            changed += self.db.execute(
+                "DELETE FROM projects WHERE source NOT IN (SELECT uuid FROM raw_projects)"
+            ).rowcount
+            self._mark("projects", changed)
+        return changed
+
+    def iter_unmerged_projects(self) -> Iterator[tuple[str, dict]]:
+        for pid, data in self.db.execute("SELECT id, data FROM projects WHERE merged IS NULL").fetchall():
+            yield pid, json.loads(data)
+
+    def set_merged(self, rows: Iterable[tuple[str, dict]]) -> int:
+        n = 0
+        with self.transaction():
+            for pid, project in rows:
+                self.db.execute("UPDATE projects SET merged = ?, version = ? WHERE id = ?", (encode(project), self._version, pid))
+                n += 1
+            self._mark("projects", n)
+        return n
+
+    def iter_projects(self) -> Iterator[dict]:
+        """Projects as the app sees them (merged when available), in export order."""
+        for (data,) in self.db.execute("SELECT COALESCE(merged, data) FROM projects ORDER BY position"):
+            yield json.loads(data)
+
+    # --- profile_links (fetch_devfolio_profile_json.py) ---------------------------------
+
+    def profile_links(self) -> dict:
+        return {u: json.loads(d) for u, d in self.db.execute("SELECT username, data FROM profile_links ORDER BY username")}
+
+    def upsert_profile_links(self, links: dict, keep: set | None = None) -> int:
+        """Save {username: links}; with keep, rows for other usernames are dropped (full crawl).
+        Projects of every founder whose links changed are queued for merge again."""
+        changed = 0
+        affected = set()
+        with self.transaction():
+            for username, data in links.items():
+                twitter = (data.get("twitter") or "").strip().lower() or None
+                row = self.db.execute("SELECT twitter, data FROM profile_links WHERE username = ?", (username,)).fetchone()
+                encoded = encode(data)
+                if row is not None and row[1] == encoded:
+                    continue
+                self.db.execute(
+                    "INSERT OR REPLACE INTO profile_links VALUES (?, ?, ?, ?)", (username, twitter, encoded, self._version)
+                )
+                affected.update(k for k in (username.lower(), twitter, row[0] if row else None) if k)
+                changed += 1
+            if keep is not None:
+                for username, twitter in self.db.execute("SELECT username, twitter FROM profile_links").fetchall():
+                    if username not in keep:
+                        self.db.execute("DELETE FROM profile_links WHERE username = ?", (username,))
+                        affected.update(k for k in (username.lower(), twitter) if k)
+                        changed += 1
+            for founder in affected:
+                self.db.execute("UPDATE projects SET merged = NULL WHERE founder = ?", (founder,))
+            self._mark("profile_links", changed)
+        return changed
+
+    # --- export -------------------------------------------------------------------------
+
+    def count(self, table: str) -> int:
+        assert table in TABLES
+        return self.db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def export(self, projects_path: Path = PROJECTS_JSON, links_path: Path | None = PROFILE_LINKS, all_projects_path: Path | None = None) -> None:
+        """Write the app's JSON files and directory payloads (streamed, atomic; same bytes as the
+        file-based stages)."""
+        directory = DirectoryWriter(Path(projects_path).parent / "directory")
+        changes = ChangesetWriter(changeset_path(projects_path), "store.py export")
+        n = write_records(projects_path, directory.tee(changes.tee(self.iter_projects())))
+        print("Exported", n, "projects to", projects_path)
+        print("Directory payloads in", directory.out_dir, directory.close())
+        print("Changeset:", changes.path, changes.close())
+        if links_path is not None:
+            links = self.profile_links()
+            write_json_atomic(links_path, links)
+            print("Exported", len(links), "profile links to", links_path)
+        if all_projects_path is not None:
+            n = write_records(all_projects_path, (src for _, src in self.iter_raw_projects()))
+            print("Exported", n, "raw projects to", all_projects_path)
+
+
+def import_files(store: RecordStore, all_projects: Path = ALL_PROJECTS, profile_links: Path = PROFILE_LINKS) -> None:
+    if all_projects.exists():
+        counts = store.replace_raw_projects(iter_records(all_projects))
+        print("Imported", all_projects.name, counts)
+    if profile_links.exists():
+        with open(profile_links, encoding="utf-8") as f:
+            links = json.load(f) or {}
+        print("Imported", profile_links.name, store.upsert_profile_links(links), "changed")
+
+
+def add_store_arguments(parser) -> None:
+    parser.add_argument(
+        "--store",
+        nargs="?",
+        type=Path,
+        const=STORE_FILE,
+        default=None,
+        help=f"Read and write the SQLite record store instead of the JSON files (default path: {STORE_FILE.name})",
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=("import", "export", "stats"))
+    parser.add_argument("--path", type=Path, default=STORE_FILE, help="Store file (default: %(default)s)")
+    parser.add_argument("--projects", type=Path, default=PROJECTS_JSON, help="export: app projects file")
+    parser.add_argument("--profile-links", type=Path, default=PROFILE_LINKS, help="import/export: profile_links.json")
+    parser.add_argument("--all-projects", type=Path, help="import: raw scrape to load; export: also write the raw scrape here")
+    metrics.add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with RecordStore(args.path) as store:
+        if args.command == "import":
+            import_files(store, args.all_projects or ALL_PROJECTS, args.profile_links)
+        elif args.command == "export":
+            with metrics.stage("export"):
+                store.export(args.projects, args.profile_links, args.all_projects)
+        for table in TABLES:
+            print(f"  {table}: {store.count(table)} rows, last changed at version {store.version(table)}")
+    metrics.write_reports(f"store_{args.command}", args)
+
+
+if __name__ == "__main__":
+    main()
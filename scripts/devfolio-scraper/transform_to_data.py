@@ -1,15 +1,37 @@
 """
 Transform Devfolio all_projects.json into the app's Project[] format.
-Reads: all_projects.json (in this folder)
+Reads: all_projects.json or all_projects.ndjson (in this folder)
 Writes: ../../lib/projects-from-devfolio.json
+
+Projects are read, transformed and written one at a time, so an NDJSON input is processed
+in constant memory.
+
+Usage:
+  python transform_to_data.py
+  python transform_to_data.py --input all_projects.ndjson
+  python transform_to_data.py --output projects.ndjson   # one project per line
+  python transform_to_data.py --workers 4                # transform chunks in a process pool
+  python transform_to_data.py --store                    # only hits changed in devfolio.sqlite3 since last run
 """
-import json
+import argparse
+import hashlib
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator
+
+import metrics
+from records import iter_records, write_records
+from store import RecordStore, add_store_arguments, project_uuid
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 INPUT_FILE = SCRIPT_DIR / "all_projects.json"
+NDJSON_INPUT_FILE = SCRIPT_DIR / "all_projects.ndjson"
 OUTPUT_FILE = SCRIPT_DIR.parent.parent / "lib" / "projects-from-devfolio.json"
+# Projects per task sent to a worker process
+CHUNK_SIZE = 500
 
 # Devfolio hackathon subdomain -> our batch display name (for filter + README)
 HACKATHON_BATCH_MAP = {
@@ -35,21 +57,97 @@ CATEGORY_KEYWORDS = {
 }
 
 
-def infer_category(hashtags: list) -> str:
-    """Infer app category from Devfolio hashtags."""
-    if not hashtags:
-        return "Consumer"
+DEFAULT_CATEGORY = "Consumer"
+
+
+class CategoryIndex:
+    """Keyword index over CATEGORY_KEYWORDS, built once.
+
+    A tag matches a keyword when either contains the other (case-insensitive), exactly as the
+    original per-project loops did. Category priority is the order of CATEGORY_KEYWORDS: a
+    project gets the first category with any match. Per-tag matches are computed once and
+    memoized, since the same few hundred hashtags repeat across every hackathon."""
+
+    def __init__(self, category_keywords: dict):
+        self.categories = list(category_keywords)
+        # keyword -> indexes of the categories listing it ("kw in tag")
+        self.keyword_categories = {}
+        # every substring of every keyword -> the keywords containing it ("tag in kw")
+        self.fragment_keywords = {}
+        for ci, keywords in enumerate(category_keywords.values()):
+            for kw in keywords:
+                self.keyword_categories.setdefault(kw, set()).add(ci)
+                for i in range(len(kw) + 1):
+                    for j in range(i, len(kw) + 1):
+                        self.fragment_keywords.setdefault(kw[i:j], set()).add(kw)
+        self.max_keyword_len = max((len(kw) for kw in self.keyword_categories), default=0)
+        self._tag_cache = {}
+
+    def tag_matches(self, tag: str) -> dict:
+        """{category index: number of its keywords matching this (lowercased) tag}."""
+        cached = self._tag_cache.get(tag)
+        if cached is not None:
+            return cached
+        # Keywords the tag contains, plus keywords that contain the tag
+        keywords = set(self.fragment_keywords.get(tag, ()))
+        for i in range(len(tag)):
+            for j in range(i + 1, min(len(tag), i + self.max_keyword_len) + 1):
+                if tag[i:j] in self.keyword_categories:
+                    keywords.add(tag[i:j])
+        matched = {}
+        for kw in keywords:
+            for ci in self.keyword_categories[kw]:
+                matched[ci] = matched.get(ci, 0) + 1
+        self._tag_cache[tag] = matched
+        return matched
+
+    def scores(self, tag_names: list) -> dict:
+        """{category: match score} summed over the project's tags, in priority order."""
+        totals = {}
+        for tag in tag_names:
+            for ci, n in self.tag_matches(tag).items():
+                totals[ci] = totals.get(ci, 0) + n
+        return {self.categories[ci]: totals[ci] for ci in sorted(totals)}
+
+    def classify(self, tag_names: list, by_score: bool = False) -> tuple[str, dict]:
+        """(category, scores). Default picks the highest-priority matching category (the
+        original behaviour); by_score=True picks the highest score, priority breaking ties."""
+        scores = self.scores(tag_names)
+        if not scores:
+            return DEFAULT_CATEGORY, scores
+        if by_score:
+            best = max(scores.values())
+            return next(c for c, n in scores.items() if n == best), scores
+        return next(iter(scores)), scores
+
+
+CATEGORY_INDEX = CategoryIndex(CATEGORY_KEYWORDS)
+
+
+def hashtag_names(hashtags: list) -> list:
     tag_names = []
-    for h in hashtags:
+    for h in hashtags or []:
         if isinstance(h, dict) and "name" in h:
             tag_names.append(h["name"].lower())
         elif isinstance(h, str):
             tag_names.append(h.lower())
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        for kw in keywords:
-            if any(kw in t or t in kw for t in tag_names):
-                return category
-    return "Consumer"
+    return tag_names
+
+
+def infer_category(hashtags: list) -> str:
+    """Infer app category from Devfolio hashtags."""
+    if not hashtags:
+        return DEFAULT_CATEGORY
+    return CATEGORY_INDEX.classify(hashtag_names(hashtags))[0]
+
+
+def infer_categories(hashtag_lists: Iterable, by_score: bool = False) -> list[tuple[str, dict]]:
+    """Classify a batch of projects (one hashtag list each) in one pass: [(category, scores)].
+    by_score picks the best-scoring category instead of the first by priority (see classify)."""
+    return [
+        CATEGORY_INDEX.classify(hashtag_names(hashtags), by_score) if hashtags else (DEFAULT_CATEGORY, {})
+        for hashtags in hashtag_lists
+    ]
 
 
 def description_text(desc_field) -> str:
@@ -97,126 +195,234 @@ def full_description_markdown(desc_field) -> str:
     return "\n\n".join(parts).strip() if parts else ""
 
 
-def main():
-    with open(INPUT_FILE, encoding="utf-8") as f:
-        raw = json.load(f)
+def transform_project(i: int, src: dict, category: str | None = None) -> dict | None:
+    """Map one Devfolio project (position i in the scrape) to a Project; None for non-records.
+    category comes from a batch infer_categories() pass when the caller made one."""
+    if not isinstance(src, dict):
+        return None
+    hackathon = src.get("hackathon") or {}
+    subdomain = (hackathon.get("subdomain") or "").strip() or "base-batch-india"
+    batch_name = HACKATHON_BATCH_MAP.get(subdomain) or hackathon.get("name") or "Base Batch India"
+    base_url_hack = f"https://{subdomain}.devfolio.co/projects"
 
-    base_url = "https://base-batch-india.devfolio.co/projects"
-    projects = []
+    name = (src.get("name") or "").strip() or f"Project {i+1}"
+    slug = (src.get("slug") or "").strip()
+    tagline = (src.get("tagline") or "").strip()
+    desc = description_text(src.get("description"))
+    description = tagline or desc or "Built on Base."
+    if len(description) > 380:
+        description = description[:377] + "..."
+    description_full = full_description_markdown(src.get("description"))
 
-    for i, src in enumerate(raw):
-        if not isinstance(src, dict):
-            continue
-        hackathon = src.get("hackathon") or {}
-        subdomain = (hackathon.get("subdomain") or "").strip() or "base-batch-india"
-        batch_name = HACKATHON_BATCH_MAP.get(subdomain) or hackathon.get("name") or "Base Batch India"
-        base_url_hack = f"https://{subdomain}.devfolio.co/projects"
-
-        name = (src.get("name") or "").strip() or f"Project {i+1}"
-        slug = (src.get("slug") or "").strip()
-        tagline = (src.get("tagline") or "").strip()
-        desc = description_text(src.get("description"))
-        description = tagline or desc or "Built on Base."
-        if len(description) > 380:
-            description = description[:377] + "..."
-        description_full = full_description_markdown(src.get("description"))
-
-        hashtags = src.get("hashtags") or []
-        tag_names = [
-            h.get("name") or h if isinstance(h, dict) else str(h)
-            for h in hashtags
-            if h
-        ][:15]
-
-        members = src.get("members") or []
-        founders_list = []
-        if members:
-            for m in members:
-                first_name = (m.get("first_name") or "").strip()
-                last_name = (m.get("last_name") or "").strip()
-                full_name = f"{first_name} {last_name}".strip() or name
-                username = (m.get("username") or "").replace(" ", "").strip()
-                if not username:
-                    continue
-                founders_list.append({"name": full_name, "twitter": username})
-            founder = founders_list[0]["name"] if founders_list else name
-            founder_twitter = founders_list[0]["twitter"] if founders_list else (slug or "devfolio")
-        else:
-            founder = name
-            founder_twitter = slug or "devfolio"
-
-        project_url = f"{base_url_hack}/{slug}" if slug else base_url_hack
-        logo = (src.get("favicon") or src.get("cover_img") or "").strip()
-
-        # Parse all project links: GitHub, Farcaster, YouTube, and other (app/demo/website)
-        links_str = (src.get("links") or "").strip()
-        github_url = ""
-        farcaster_url = ""
-        youtube_url = ""
-        other_links = []
-        if links_str:
-            for part in links_str.replace("，", ",").split(","):
-                part = part.strip()
-                if not part or not part.startswith("http"):
-                    continue
-                lower = part.lower()
-                if "github.com" in lower and not github_url:
-                    github_url = part
-                elif "farcaster.xyz" in lower or "warpcast.com" in lower:
-                    if not farcaster_url:
-                        farcaster_url = part
-                elif "youtu.be" in lower or "youtube.com" in lower:
-                    if not youtube_url:
-                        youtube_url = part
-                else:
-                    # App, demo, website, docs, etc. (skip blockscan, drive, canva, etc. for "main" links)
-                    skip_domains = ("basescan.org", "blockscout.com", "drive.google.com", "canva.com", "1drv.ms", "linktr.ee", "medium.com", "docs.google.com", "figma.com")
-                    if not any(d in lower for d in skip_domains):
-                        other_links.append(part)
-        other_links = other_links[:5]
-
-        # Do NOT use API "prizes" for "prizes won" — the search API returns prize definitions
-        # for tracks the project applied to (e.g. "First Place" for Consumer track), not actual
-        # awards. That would mark non-winners as winners. Leave prizes empty until we have a
-        # reliable source (e.g. manual winner list or a dedicated winners API).
-        prize_names = []
-
-        out = {
-            "id": src.get("uuid") or str(i + 1),
-            "name": name,
-            "description": description,
-            "category": infer_category(hashtags),
-            "founder": founder,
-            "founderTwitter": founder_twitter,
-            "url": project_url,
-            "batch": batch_name,
-            "tags": tag_names,
-            "logo": logo or name[:2].upper(),
-            "source": project_url,
-        }
-        if len(founders_list) > 0:
-            out["founders"] = founders_list
-        if slug:
-            out["slug"] = slug
-        if github_url:
-            out["github"] = github_url
-        if farcaster_url:
-            out["farcaster"] = farcaster_url
-        if youtube_url:
-            out["youtube"] = youtube_url
-        if other_links:
-            out["links"] = other_links
-        if prize_names:
-            out["prizes"] = prize_names
-        if description_full:
-            out["descriptionFull"] = description_full
-        projects.append(out)
-
-    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(projects, f, indent=2)
-
-    print("Wrote", len(projects), "projects to", OUTPUT_FILE)
+    hashtags = src.get("hashtags") or []
+    tag_names = [
+        h.get("name") or h if isinstance(h, dict) else str(h)
+        for h in hashtags
+        if h
+    ][:15]
+
+    members = src.get("members") or []
+    founders_list = []
+    if members:
+        for m in members:
+            first_name = (m.get("first_name") or "").strip()
+            last_name = (m.get("last_name") or "").strip()
+            full_name = f"{first_name} {last_name}".strip() or name
+            username = (m.get("username") or "").replace(" ", "").strip()
+            if not username:
+                continue
+            founders_list.append({"name": full_name, "twitter": username})
+        founder = founders_list[0]["name"] if founders_list else name
+        founder_twitter = founders_list[0]["twitter"] if founders_list else (slug or "devfolio")
+    else:
+        founder = name
+        founder_twitter = slug or "devfolio"
+
+    project_url = f"{base_url_hack}/{slug}" if slug else base_url_hack
+    logo = (src.get("favicon") or src.get("cover_img") or "").strip()
+
+    # Parse all project links: GitHub, Farcaster, YouTube, and other (app/demo/website)
+    links_str = (src.get("links") or "").strip()
+    github_url = ""
+    farcaster_url = ""
+    youtube_url = ""
+    other_links = []
+    if links_str:
+        for part in links_str.replace("，", ",").split(","):
+            part = part.strip()
+            if not part or not part.startswith("http"):
+                continue
+            lower = part.lower()
+            if "github.com" in lower and not github_url:
+                github_url = part
+            elif "farcaster.xyz" in lower or "warpcast.com" in lower:
+                if not farcaster_url:
+                    farcaster_url = part
+            elif "youtu.be" in lower or "youtube.com" in lower:
+                if not youtube_url:
+                    youtube_url = part
+            else:
+                # App, demo, website, docs, etc. (skip blockscan, drive, canva, etc. for "main" links)
+                skip_domains = ("basescan.org", "blockscout.com", "drive.google.com", "canva.com", "1drv.ms", "linktr.ee", "medium.com", "docs.google.com", "figma.com")
+                if not any(d in lower for d in skip_domains):
+                    other_links.append(part)
+    other_links = other_links[:5]
+
+    # Do NOT use API "prizes" for "prizes won" — the search API returns prize definitions
+    # for tracks the project applied to (e.g. "First Place" for Consumer track), not actual
+    # awards. That would mark non-winners as winners. Leave prizes empty until we have a
+    # reliable source (e.g. manual winner list or a dedicated winners API).
+    prize_names = []
+
+    out = {
+        "id": src.get("uuid") or str(i + 1),
+        "name": name,
+        "description": description,
+        "category": category or infer_category(src.get("hashtags")),
+        "founder": founder,
+        "founderTwitter": founder_twitter,
+        "url": project_url,
+        "batch": batch_name,
+        "tags": tag_names,
+        "logo": logo or name[:2].upper(),
+        "source": project_url,
+    }
+    if len(founders_list) > 0:
+        out["founders"] = founders_list
+    if slug:
+        out["slug"] = slug
+    if github_url:
+        out["github"] = github_url
+    if farcaster_url:
+        out["farcaster"] = farcaster_url
+    if youtube_url:
+        out["youtube"] = youtube_url
+    if other_links:
+        out["links"] = other_links
+    if prize_names:
+        out["prizes"] = prize_names
+    if description_full:
+        out["descriptionFull"] = description_full
+    return out
+
+
+def iter_transformed(raw: Iterable, start: int = 0, chunk_size: int = CHUNK_SIZE) -> Iterator[dict]:
+    """Transform projects chunk by chunk, so a streamed input never has to fit in memory; each
+    chunk's categories are classified in one infer_categories() pass. start is the scrape
+    position of the first project (used for fallback names and ids)."""
+    raw = iter(raw)
+    while True:
+        chunk = list(islice(raw, chunk_size))
+        if not chunk:
+            return
+        categories = infer_categories(src.get("hashtags") if isinstance(src, dict) else None for src in chunk)
+        for i, (src, (category, _)) in enumerate(zip(chunk, categories), start):
+            out = transform_project(i, src, category)
+            if out is not None:
+                yield out
+        start += len(chunk)
+
+
+def transform_chunk(start: int, chunk: list) -> list:
+    """Worker task for iter_transformed_parallel."""
+    return list(iter_transformed(chunk, start))
+
+
+def iter_transformed_parallel(raw: Iterable, workers: int, chunk_size: int = CHUNK_SIZE) -> Iterator[dict]:
+    """iter_transformed over a process pool. Chunks are yielded in input order, so the output is
+    identical to the serial path; at most 2 chunks per worker are in flight at a time."""
+    raw = iter(raw)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        start = 0
+        while True:
+            while len(in_flight) < 2 * workers:
+                chunk = list(islice(raw, chunk_size))
+                if not chunk:
+                    break
+                in_flight.append(pool.submit(transform_chunk, start, chunk))
+                start += len(chunk)
+            if not in_flight:
+                return
+            yield from in_flight.popleft().result()
+
+
+def transform_store(store: RecordStore, full: bool = False) -> int:
+    """Transform the raw hits that changed since the last store run (all of them when this
+    file changed or full is set) and upsert the results. Returns rows changed."""
+    code = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    if store.get_meta("transform_code") != code:
+        full = True
+    since = 0 if full else int(store.get_meta("transform_raw_version") or 0)
+    raw_version = store.version("raw_projects")
+
+    def rows():
+        for position, src in store.iter_raw_projects(since):
+            out = transform_project(position, src)
+            if out is not None:
+                yield project_uuid(src), position, out
+
+    changed = store.upsert_projects(rows())
+    with store.db:
+        store.set_meta("transform_raw_version", raw_version)
+        store.set_meta("transform_code", code)
+    return changed
+
+
+def default_input() -> Path:
+    """all_projects.ndjson or all_projects.json, whichever scrape.py wrote last."""
+    candidates = [p for p in (NDJSON_INPUT_FILE, INPUT_FILE) if p.exists()]
+    if not candidates:
+        return INPUT_FILE
+    return max(candidates, key=lambda p: p.stat().st_mtime)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Transform scraped Devfolio projects into the app's Project[] JSON.")
+    parser.add_argument(
+        "--input",
+        type=Path,
+        help="all_projects.json or .ndjson (default: whichever of the two in this folder is newer)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=OUTPUT_FILE,
+        help="Output file; a .ndjson suffix writes one project per line (default: lib/projects-from-devfolio.json)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes; records are transformed in chunks and written in input order (default: 1)",
+    )
+    parser.add_argument("--full", action="store_true", help="With --store: retransform every hit, not just changed ones")
+    add_store_arguments(parser)
+    metrics.add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.store:
+        with RecordStore(args.store) as store, metrics.stage("transform"):
+            changed = transform_store(store, args.full)
+            total = store.count("projects")
+        print("Store:", changed, "projects changed,", total, "total. Export with: python store.py export")
+        metrics.write_reports("transform_to_data", args)
+        return
+
+    input_file = args.input or default_input()
+
+    raw = iter_records(input_file)
+    if args.workers > 1:
+        projects = iter_transformed_parallel(raw, args.workers)
+    else:
+        projects = iter_transformed(raw)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    # Read, transform and write are interleaved, so they are one stage
+    with metrics.stage("transform"):
+        count = write_records(args.output, projects)
+
+    print("Wrote", count, "projects from", input_file.name, "to", args.output)
+    metrics.write_reports("transform_to_data", args)
 
 
 if __name__ == "__main__":
@@ -3,15 +3,18 @@
  * - If an MDX file already exists, only add edit_id to frontmatter when missing.
  * - If it doesn't exist, create one with slug, project_id, name, description and edit_id.
  * Run after transform_to_data.py. Then run npm run sync-edit-ids to sync edit_id to Supabase.
+ * With --changed only projects added or modified since the last run are visited (see scripts/changeset.ts).
  *
- * Usage: npx tsx scripts/generate-project-mdx.ts
+ * Usage: npx tsx scripts/generate-project-mdx.ts [--changed]
  */
 import * as fs from "fs";
 import * as path from "path";
 import matter from "gray-matter";
+import { currentSequence, projectChanges, saveCursor } from "./changeset";
 
 const PROJECTS_JSON = path.join(process.cwd(), "lib", "projects-from-devfolio.json");
 const PROJECTS_DIR = path.join(process.cwd(), "content", "projects");
+const CURSOR = "generate-project-mdx";
 
 function randomEditId(): string {
   const chars = "abcdefghjkmnpqrstuvwxyz23456789";
@@ -67,9 +70,15 @@ function main() {
   if (!fs.existsSync(PROJECTS_DIR)) {
     fs.mkdirSync(PROJECTS_DIR, { recursive: true });
   }
+  const changes = process.argv.includes("--changed") ? projectChanges(CURSOR) : null;
+  const sequence = changes?.sequence ?? currentSequence();
+  if (process.argv.includes("--changed")) {
+    console.log(changes ? `${changes.upsert.size} project(s) changed since the last run.` : "No usable changeset cursor: visiting every project.");
+  }
   let created = 0;
   let updated = 0;
   for (const p of projects) {
+    if (changes && !changes.upsert.has(p.id || p.slug || "")) continue;
     const slug = (p.slug || "").trim();
     if (!slug) continue;
     const filePath = path.join(PROJECTS_DIR, `${slug}.mdx`);
@@ -98,6 +107,7 @@ function main() {
       created++;
     }
   }
+  saveCursor(CURSOR, sequence);
   console.log("Done. Created", created, "new project MDX, added edit_id to", updated, "existing. Run npm run sync-edit-ids to sync to Supabase.");
 }
 
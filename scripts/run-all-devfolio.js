@@ -1,12 +1,14 @@
 /**
  * Run full Devfolio pipeline in order:
- * 1. scrape.py          -> all_projects.json
- * 2. transform_to_data  -> lib/projects-from-devfolio.json
- * 3. fetch_devfolio_profiles -> profile_links.json
- * 4. merge_profile_links     -> canonical founder id + founderTwitterHandle in JSON
- * 5. fetch_devfolio_profile_json -> content/founders/*.mdx (one per person, no duplicates)
- * 6. generate-mdx-from-json -> missing project/founder MDX
- * 7. generate-readme-ecosystem -> README
+ * 1. pipeline.py (skips stages whose inputs did not change):
+ *    scrape.py          -> all_projects.json
+ *    transform_to_data  -> lib/projects-from-devfolio.json
+ *    fetch_devfolio_profile_json -> content/founders/*.mdx + profile_links.json (one fetch per profile)
+ *    merge_profile_links     -> canonical founder id + founderTwitterHandle in JSON
+ *    mirror_assets      -> public/mirror/ + lib/asset-mirror.json (local logos and profile images)
+ * 2. generate-mdx-from-json -> missing project/founder MDX
+ * 3. founders_index.py -> content/founders-index.json (frontmatter of every founder MDX)
+ * 4. generate-readme-ecosystem -> README
  *
  * Usage: node scripts/run-all-devfolio.js
  * Requires: Python with requests.
@@ -18,12 +20,9 @@ const ROOT = path.join(__dirname, "..");
 const SCRAPER_DIR = path.join(__dirname, "devfolio-scraper");
 
 const steps = [
-  [SCRAPER_DIR, "python scrape.py", "Scrape (fetch all hackathons)"],
-  [SCRAPER_DIR, "python transform_to_data.py", "Transform to projects-from-devfolio.json"],
-  [SCRAPER_DIR, "python fetch_devfolio_profiles.py", "Fetch Devfolio profile links (Twitter/GitHub)"],
-  [SCRAPER_DIR, "python merge_profile_links.py", "Merge profile links (canonical founder id)"],
-  [SCRAPER_DIR, "python fetch_devfolio_profile_json.py", "Fetch founder MDX (one profile per person)"],
+  [SCRAPER_DIR, "python pipeline.py", "Scrape, transform, fetch founder profiles, merge profile links, mirror images"],
   [ROOT, "node scripts/generate-mdx-from-json.js", "Generate missing project/founder MDX"],
+  [SCRAPER_DIR, "python founders_index.py", "Update founders-index.json"],
   [ROOT, "node scripts/generate-readme-ecosystem.js", "Update README ecosystem sections"],
 ];
 
@@ -2,7 +2,10 @@
  * Seed directory_projects and directory_founders in Supabase from repo data.
  * Run once (or after adding projects/founders) so the Telegram bot can list "Existing project" / "Existing founder" by name.
  *
- * Usage: npm run seed-directory   (or npx tsx scripts/seed-directory-to-supabase.ts)
+ * With --changed only projects added, modified or removed since the last seed are written (see
+ * scripts/changeset.ts); founders are always seeded in full.
+ *
+ * Usage: npm run seed-directory   (or npx tsx scripts/seed-directory-to-supabase.ts [--changed])
  * Requires: SUPABASE_URL, SUPABASE_SERVICE_KEY (e.g. in telegram-bot/.env)
  */
 import "dotenv/config";
@@ -10,6 +13,7 @@ import { config as loadEnv } from "dotenv";
 import * as path from "path";
 import * as fs from "fs";
 import matter from "gray-matter";
+import { currentSequence, projectChanges, saveCursor, type ProjectChanges } from "./changeset";
 
 loadEnv({ path: path.join(process.cwd(), "telegram-bot", ".env") });
 import { createClient } from "@supabase/supabase-js";
@@ -17,6 +21,7 @@ import { createClient } from "@supabase/supabase-js";
 const ROOT = process.cwd();
 const LIB = path.join(ROOT, "lib");
 const FOUNDERS_DIR = path.join(ROOT, "content", "founders");
+const CURSOR = "seed-directory";
 
 function getSupabase() {
   const url = process.env.SUPABASE_URL;
@@ -46,11 +51,12 @@ type ProjectRow = {
   prizes: string | null;
 };
 
-function loadProjects(): ProjectRow[] {
+function loadProjects(changes: ProjectChanges | null): ProjectRow[] {
   const p = path.join(LIB, "projects-from-devfolio.json");
   if (!fs.existsSync(p)) return [];
   const raw = fs.readFileSync(p, "utf-8");
-  const arr = JSON.parse(raw) as Record<string, unknown>[];
+  let arr = JSON.parse(raw) as Record<string, unknown>[];
+  if (changes) arr = arr.filter((proj) => changes.upsert.has(String(proj.id || proj.slug || "")));
   return arr.map((proj) => {
     const slug = (proj.slug as string) ?? (proj.id as string) ?? "";
     const founders = (proj.founders as { name?: string; twitter?: string }[]) ?? [];
@@ -133,7 +139,21 @@ function loadFounders(): FounderRow[] {
 async function main() {
   const supabase = getSupabase();
 
-  const projects = loadProjects();
+  const changes = process.argv.includes("--changed") ? projectChanges(CURSOR) : null;
+  const sequence = changes?.sequence ?? currentSequence();
+  if (process.argv.includes("--changed") && !changes) {
+    console.log("No usable changeset cursor: seeding every project.");
+  }
+  if (changes && changes.removedSlugs.length > 0) {
+    const { error } = await supabase.from("directory_projects").delete().in("slug", changes.removedSlugs);
+    if (error) {
+      console.error("directory_projects delete error:", error);
+      process.exit(1);
+    }
+    console.log("Removed", changes.removedSlugs.length, "projects from directory_projects.");
+  }
+
+  const projects = loadProjects(changes);
   if (projects.length > 0) {
     const { error } = await supabase.from("directory_projects").upsert(projects, {
       onConflict: "slug",
@@ -145,7 +165,7 @@ async function main() {
     }
     console.log("Seeded", projects.length, "projects to directory_projects.");
   } else {
-    console.log("No projects in lib/projects-from-devfolio.json.");
+    console.log(changes ? "No changed projects since the last seed." : "No projects in lib/projects-from-devfolio.json.");
   }
 
   const founders = loadFounders();
@@ -162,6 +182,7 @@ async function main() {
   } else {
     console.log("No founders in content/founders/*.mdx.");
   }
+  saveCursor(CURSOR, sequence);
 }
 
 main();